@@ -39,3 +39,11 @@ func TestFindThreeEntriesWithGivenSumReturnsCorrectEntriesForInputFromAssignment
 		t.Fatalf("got unexpected matching entries: %v", entries)
 	}
 }
+
+func BenchmarkFindThreeEntriesWithGivenSumForInputFromAssignment(b *testing.B) {
+	entries := []int{1721, 979, 366, 299, 675, 1456}
+
+	for i := 0; i < b.N; i++ {
+		findThreeEntriesWithGivenSum(entries, 2020)
+	}
+}
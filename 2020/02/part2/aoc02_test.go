@@ -115,3 +115,15 @@ func TestValidatePasswordsWithPoliciesReturnsCorrectCountForInputFromAssignment(
 		t.Fatalf("unexpected number of valid passwords: %v", validPasswordCount)
 	}
 }
+
+func BenchmarkValidatePasswordsWithPoliciesForInputFromAssignment(b *testing.B) {
+	passwordsWithPolicies := PasswordsWithPolicies{
+		PasswordWithPolicy{"abcde", Policy{'a', 1, 3}},
+		PasswordWithPolicy{"cdefg", Policy{'b', 1, 3}},
+		PasswordWithPolicy{"ccccccccc", Policy{'c', 2, 9}},
+	}
+
+	for i := 0; i < b.N; i++ {
+		validatePasswordsWithPolicies(passwordsWithPolicies)
+	}
+}
@@ -95,3 +95,22 @@ func TestCountEncounteredTreesReturnsCorrectResultForExampleInAssignment(t *test
 		t.Fatalf("unexpected tree count: %v", treeCount)
 	}
 }
+
+func BenchmarkCountEncounteredTreesForExampleInAssignment(b *testing.B) {
+	m := newForestMap()
+	m.addRowFromString("..##.........##.........##.........##.........##.........##.......")
+	m.addRowFromString("#...#...#..#...#...#..#...#...#..#...#...#..#...#...#..#...#...#..")
+	m.addRowFromString(".#....#..#..#....#..#..#....#..#..#....#..#..#....#..#..#....#..#.")
+	m.addRowFromString("..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#")
+	m.addRowFromString(".#...##..#..#...##..#..#...##..#..#...##..#..#...##..#..#...##..#.")
+	m.addRowFromString("..#.##.......#.##.......#.##.......#.##.......#.##.......#.##.....")
+	m.addRowFromString(".#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#")
+	m.addRowFromString(".#........#.#........#.#........#.#........#.#........#.#........#")
+	m.addRowFromString("#.##...#...#.##...#...#.##...#...#.##...#...#.##...#...#.##...#...")
+	m.addRowFromString("#...##....##...##....##...##....##...##....##...##....##...##....#")
+	m.addRowFromString(".#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#")
+
+	for i := 0; i < b.N; i++ {
+		m.countEncounteredTrees()
+	}
+}
@@ -132,3 +132,22 @@ func TestMultiplyTreeCountsReturnsCorrectResultForNonEmptyInput(t *testing.T) {
 		t.Fatalf("unexpected tree count: %v", treeCount)
 	}
 }
+
+func BenchmarkCountEncounteredTreesForExampleInAssignment(b *testing.B) {
+	m := newForestMap()
+	m.addRowFromString("..##.........##.........##.........##.........##.........##.......")
+	m.addRowFromString("#...#...#..#...#...#..#...#...#..#...#...#..#...#...#..#...#...#..")
+	m.addRowFromString(".#....#..#..#....#..#..#....#..#..#....#..#..#....#..#..#....#..#.")
+	m.addRowFromString("..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#..#.#...#.#")
+	m.addRowFromString(".#...##..#..#...##..#..#...##..#..#...##..#..#...##..#..#...##..#.")
+	m.addRowFromString("..#.##.......#.##.......#.##.......#.##.......#.##.......#.##.....")
+	m.addRowFromString(".#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#.#.#.#....#")
+	m.addRowFromString(".#........#.#........#.#........#.#........#.#........#.#........#")
+	m.addRowFromString("#.##...#...#.##...#...#.##...#...#.##...#...#.##...#...#.##...#...")
+	m.addRowFromString("#...##....##...##....##...##....##...##....##...##....##...##....#")
+	m.addRowFromString(".#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#.#..#...#.#")
+
+	for i := 0; i < b.N; i++ {
+		multiplyTreeCounts(m.countEncounteredTrees())
+	}
+}
@@ -71,3 +71,16 @@ func TestCountValidPassportsReturnsCorrectCountForExampleFromAssignemtn(t *testi
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkCountValidPassportsForExampleFromAssignment(b *testing.B) {
+	passports := []Passport{
+		passportFromString("ecl:gry pid:860033327 eyr:2020 hcl:#fffffd byr:1937 iyr:2017 cid:147 hgt:183cm"),
+		passportFromString("iyr:2013 ecl:amb cid:350 eyr:2023 pid:028048884 hcl:#cfa07d byr:1929"),
+		passportFromString("hcl:#ae17e1 iyr:2013 eyr:2024 ecl:brn pid:760753108 byr:1931 hgt:179cm"),
+		passportFromString("hcl:#cfa07d eyr:2025 pid:166559648 iyr:2011 ecl:brn hgt:59in"),
+	}
+
+	for i := 0; i < b.N; i++ {
+		coundValidPassports(passports)
+	}
+}
@@ -49,3 +49,16 @@ func TestGetHighestSeatIdReturnsCorrectValue(t *testing.T) {
 		t.Fatalf("unexpected highest seat ID: %v", highestSeatId)
 	}
 }
+
+func BenchmarkGetHighestSeatId(b *testing.B) {
+	passes := []BoardingPass{
+		BoardingPass{"FBFBBFFRLR", 44, 5, 357},
+		BoardingPass{"BFFFBBFRRR", 70, 7, 567},
+		BoardingPass{"FFFBBBFRRR", 14, 7, 119},
+		BoardingPass{"BBFFBBFRLL", 102, 4, 820},
+	}
+
+	for i := 0; i < b.N; i++ {
+		getHighestSeatId(passes)
+	}
+}
@@ -34,3 +34,18 @@ func TestBoardingPassFromStringReturnsErrorWhenSeatSpecHasInvalidFormat(t *testi
 		t.Fatalf("expected an error, got a valid boarding pass")
 	}
 }
+
+func BenchmarkGetMySeatIdForFullPlane(b *testing.B) {
+	// All seats are taken except for the very front and back rows, and my
+	// seat (500).
+	var passes []BoardingPass
+	for seatId := seatIdForRowAndCol(1, 0); seatId < seatIdForRowAndCol(127, 0); seatId++ {
+		if seatId != 500 {
+			passes = append(passes, BoardingPass{"", seatId / 8, seatId % 8, seatId})
+		}
+	}
+
+	for i := 0; i < b.N; i++ {
+		getMySeatId(passes)
+	}
+}
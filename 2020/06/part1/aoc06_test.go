@@ -58,3 +58,33 @@ func TestSumYesAnswersPerGroupReturnsCorrectSumForExampleFromAssignment(t *testi
 		t.Fatalf("unpexpected sum: %v", sum)
 	}
 }
+
+func BenchmarkSumYesAnswersPerGroupForExampleFromAssignment(b *testing.B) {
+	yesAnswers := []YesAnswersForGroup{
+		YesAnswersForGroup{
+			YesAnswersForPerson{'a', 'b', 'c'},
+		},
+		YesAnswersForGroup{
+			YesAnswersForPerson{'a'},
+			YesAnswersForPerson{'b'},
+			YesAnswersForPerson{'c'},
+		},
+		YesAnswersForGroup{
+			YesAnswersForPerson{'a', 'b'},
+			YesAnswersForPerson{'b', 'c'},
+		},
+		YesAnswersForGroup{
+			YesAnswersForPerson{'a'},
+			YesAnswersForPerson{'a'},
+			YesAnswersForPerson{'a'},
+			YesAnswersForPerson{'a'},
+		},
+		YesAnswersForGroup{
+			YesAnswersForPerson{'b'},
+		},
+	}
+
+	for i := 0; i < b.N; i++ {
+		sumYesAnswersPerGroup(yesAnswers)
+	}
+}
@@ -159,3 +159,20 @@ dark violet bags contain no other bags.`,
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkHowManyBagsAreRequiredInForExampleFromAssignment(b *testing.B) {
+	bagRules, _ := createBagRulesFromString(
+		`shiny gold bags contain 2 dark red bags.
+dark red bags contain 2 dark orange bags.
+dark orange bags contain 2 dark yellow bags.
+dark yellow bags contain 2 dark green bags.
+dark green bags contain 2 dark blue bags.
+dark blue bags contain 2 dark violet bags.
+dark violet bags contain no other bags.`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		bagRules.howManyBagsAreRequiredIn("shiny gold")
+	}
+}
@@ -72,3 +72,23 @@ acc +6`,
 		t.Fatalf("unexpected accumulator value: %v", acc)
 	}
 }
+
+func BenchmarkFixProgramAndGetAccAtEndForExampleFromAssignment(b *testing.B) {
+	program, _ := parseProgramFromString(
+		`
+nop +0
+acc +1
+jmp +4
+acc +3
+jmp -3
+acc -99
+acc +1
+jmp -4
+acc +6`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		fixProgramAndGetAccAtEnd(program)
+	}
+}
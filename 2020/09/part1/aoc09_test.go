@@ -51,3 +51,33 @@ func TestFindFirstNumberAfterPreambleWhichIsNotSumOfPreviousNumbersReturnsCorrec
 		t.Fatalf("unexpected number: %v", n)
 	}
 }
+
+func BenchmarkFindFirstNumberAfterPreambleWhichIsNotSumOfPreviousNumbersForExampleFromAssignment(b *testing.B) {
+	numbers, _ := parseNumbersFromString(
+		`35
+20
+15
+25
+47
+40
+62
+55
+65
+95
+102
+117
+150
+182
+127
+219
+299
+277
+309
+576`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		findFirstNumberAfterPreambleWhichIsNotSumOfPreviousNumbers(numbers, 5)
+	}
+}
@@ -90,3 +90,35 @@ func TestSumSmallestAndLargestNumberInListReturnsCorrectSum(t *testing.T) {
 		t.Fatalf("unexpected sum: %v", sum)
 	}
 }
+
+func BenchmarkFindContiguousListThatSumsToGivenNumberForExampleFromAssignment(b *testing.B) {
+	numbers, _ := parseNumbersFromString(
+		`35
+20
+15
+25
+47
+40
+62
+55
+65
+95
+102
+117
+150
+182
+127
+219
+299
+277
+309
+576`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		n := findFirstNumberAfterPreambleWhichIsNotSumOfPreviousNumbers(numbers, 5)
+		list := findContiguousListThatSumsToGivenNumber(numbers, n)
+		sumSmallestAndLargestNumberInList(list)
+	}
+}
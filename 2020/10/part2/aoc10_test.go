@@ -113,3 +113,45 @@ func TestCountAllDistinctAdapterArrangementsReturnsCorrectResultForSecondExample
 		t.Fatalf("unexpected result: %v", result)
 	}
 }
+
+func BenchmarkCountAllDistinctAdapterArrangementsForSecondExampleFromAssignment(b *testing.B) {
+	adapterJoltages, _ := parseJoltagesFromString(
+		`28
+33
+18
+42
+31
+14
+46
+20
+48
+47
+24
+23
+49
+45
+19
+38
+39
+11
+1
+32
+25
+35
+8
+17
+7
+9
+4
+2
+34
+10
+3`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		chain := findChainThatUsesAllAdapters(adapterJoltages)
+		countAllDistinctAdapterArrangements(chain)
+	}
+}
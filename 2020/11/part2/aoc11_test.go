@@ -186,3 +186,25 @@ LLL###LLL#
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkProgressUntilNoChangeAndGetOccupiedSeatCountForExampleFromAssignment(b *testing.B) {
+	inputRepr := `
+L.LL.LL.LL
+LLLLLLL.LL
+L.L.L..L..
+LLLL.LL.LL
+L.LL.LL.LL
+L.LLLLL.LL
+..L.L.....
+LLLLLLLLLL
+L.LLLLLL.L
+L.LLLLL.LL
+`
+
+	for i := 0; i < b.N; i++ {
+		// The layout is changed in place, so it has to be parsed anew.
+		layout, _ := parseSeatLayoutFromString(inputRepr)
+		layout.progressUntilNoChange()
+		layout.getOccupiedSeatCount()
+	}
+}
@@ -77,3 +77,19 @@ F11
 		t.Fatalf("unexpected distance: %v", distance)
 	}
 }
+
+func BenchmarkFollowInstructionsAndComputeDistanceFromStartForExampleFromAssignment(b *testing.B) {
+	instructions, _ := parseStringAsInstructions(
+		`F10
+N3
+F7
+R90
+F11
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		followInstructionsAndComputeDistanceFromStart(instructions)
+	}
+}
@@ -44,3 +44,12 @@ func TestGetEarliestBusIdAndWaitTimeFromNotesReturnsCorrectResultForExampleFromA
 		t.Fatalf("unexpected wait time: %v", waitTime)
 	}
 }
+
+func BenchmarkGetEarliestBusIdAndWaitTimeFromNotesForExampleFromAssignment(b *testing.B) {
+	notes, _ := parseNotesFromString("939\n7,13,x,x,59,x,31,19")
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		getEarliestBusIdAndWaitTimeFromNotes(notes)
+	}
+}
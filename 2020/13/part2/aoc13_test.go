@@ -73,3 +73,12 @@ func TestGetEarliestTimestampForDepartureOfAllBusesReturnsCorrectTimestamp(t *te
 		1202161486,
 	)
 }
+
+func BenchmarkGetEarliestTimestampForDepartureOfAllBusesForExampleFromAssignment(b *testing.B) {
+	schedule, _ := parseScheduleFromString("939\n7,13,x,x,59,x,31,19")
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		getEarliestTimestampForDepartureOfAllBuses(schedule)
+	}
+}
@@ -54,3 +54,21 @@ func TestSumNonZeroValuesInAddressSpaceReturnsCorrectValue(t *testing.T) {
 		t.Fatalf("unexpected sum: %v", sum)
 	}
 }
+
+func BenchmarkRunProgramAndSumNonZeroValuesInAddressSpaceForExampleFromAssignment(b *testing.B) {
+	program, _ := parseProgramFromString(
+		`
+mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X
+mem[8] = 11
+mem[7] = 101
+mem[8] = 0
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		addressSpace := make(AddressSpace)
+		runProgram(program, &addressSpace)
+		sumNonZeroValuesInAddressSpace(&addressSpace)
+	}
+}
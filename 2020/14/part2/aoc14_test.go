@@ -59,3 +59,21 @@ mem[26] = 1
 		t.Fatalf("unexpected sum: %v", sum)
 	}
 }
+
+func BenchmarkRunProgramAndSumNonZeroValuesInAddressSpaceForExampleFromAssignment(b *testing.B) {
+	program, _ := parseProgramFromString(
+		`
+mask = 000000000000000000000000000000X1001X
+mem[42] = 100
+mask = 00000000000000000000000000000000X0XX
+mem[26] = 1
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		addressSpace := make(AddressSpace)
+		runProgram(program, &addressSpace)
+		sumNonZeroValuesInAddressSpace(&addressSpace)
+	}
+}
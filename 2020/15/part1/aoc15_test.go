@@ -34,3 +34,9 @@ func TestComputeNthSpokenNumberReturnsCorrectNumberForExamplesFromAssignment(t *
 func TestComputeNthSpokenNumberReturnsCorrectNumberWhenNthNumberIsFromInitialNumbers(t *testing.T) {
 	scenarioComputesCorrectNthSpokenNumber(t, []int{0, 3, 6}, 3, 6)
 }
+
+func BenchmarkComputeNthSpokenNumberForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		computeNthSpokenNumber([]int{0, 3, 6}, 2020)
+	}
+}
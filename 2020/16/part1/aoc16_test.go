@@ -57,3 +57,26 @@ nearby tickets:
 		t.Fatalf("unexpected rate: %v", rate)
 	}
 }
+
+func BenchmarkComputeErrorScanningRateForExampleFromAssignment(b *testing.B) {
+	info, _ := parseInputInfoFromString(
+		`class: 1-3 or 5-7
+row: 6-11 or 33-44
+seat: 13-40 or 45-50
+
+your ticket:
+7,1,14
+
+nearby tickets:
+7,3,47
+40,4,50
+55,2,20
+38,6,12
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		info.computeErrorScanningRate()
+	}
+}
@@ -126,3 +126,28 @@ nearby tickets:
 		t.Fatalf("unexpected result: %v", result)
 	}
 }
+
+func BenchmarkMultiplyValuesForLocationsStartingWithForModifiedExampleFromAssignment(b *testing.B) {
+	inputRepr := `departure location: 0-1 or 4-19
+departure station: 0-5 or 8-19
+arrival location: 0-13 or 16-19
+
+your ticket:
+11,12,13
+
+nearby tickets:
+3,9,18
+15,1,5
+5,14,9
+20,1,1`
+
+	for i := 0; i < b.N; i++ {
+		// Invalid tickets are removed in place, so the input has to be
+		// parsed anew.
+		info, _ := parseInputInfoFromString(inputRepr)
+		info.removeInvalidNearbyTickets()
+		fieldsOrder := info.determineFieldsOrder()
+		m := info.mapLocationsToMyTicketValues(fieldsOrder)
+		multiplyValuesForLocationsStartingWith(m, "departure")
+	}
+}
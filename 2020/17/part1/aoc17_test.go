@@ -81,3 +81,18 @@ func TestGetActiveCubeCountReturnsCorrectCountForExampleFromAssignmentAfterSixCy
 		t.Fatalf("unexpected active cube count: %v", activeCubeCount)
 	}
 }
+
+func BenchmarkRunCyclesAndGetActiveCubeCountForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// Cycles change the pocket dimension in place, so it has to be
+		// parsed anew.
+		pd, _ := parsePocketDimensionFromInputString(
+			`.#.
+..#
+###
+`,
+		)
+		pd.runCycles(6)
+		pd.getActiveCubeCount()
+	}
+}
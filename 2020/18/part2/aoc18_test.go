@@ -79,3 +79,20 @@ func TestEvaluateExpressionsAndSumTheirResultsReturnsCorrectSum(t *testing.T) {
 		t.Fatalf("unexpected sum: %v", sum)
 	}
 }
+
+func BenchmarkEvaluateExpressionsAndSumTheirResultsForExamplesFromAssignment(b *testing.B) {
+	exprs, _ := parseExpressionsFromString(
+		`1 + 2 * 3 + 4 * 5 + 6
+1 + (2 * 3) + (4 * (5 + 6))
+2 * 3 + (4 * 5)
+5 + (8 * 3 + 9 + 3 * 4 * 3)
+5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))
+((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		evaluateExpressionsAndSumTheirResults(exprs)
+	}
+}
@@ -106,3 +106,26 @@ aaaabbb
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkComputeValidMessageCountForExampleFromAssignment(b *testing.B) {
+	rules, messages, _ := parseRulesAndMessagesFromString(
+		`0: 4 1 5
+1: 2 3 | 3 2
+2: 4 4 | 5 5
+3: 4 5 | 5 4
+4: "a"
+5: "b"
+
+ababbb
+bababa
+abbbab
+aaabbb
+aaaabbb
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		rules.computeValidMessageCount(messages)
+	}
+}
@@ -307,3 +307,13 @@ func TestMultipleIdsOfCornerTilesAfterAssembleReturnsCorrectValueForExampleFromA
 		t.Fatalf("unexpected result: %v", result)
 	}
 }
+
+func BenchmarkMultipleIdsOfCornerTilesAfterAssembleForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// Assembling rotates and flips the tiles in place, so they have to
+		// be parsed anew.
+		tiles, _ := parseTilesFromString(tilesFromAssignment)
+		tiles.assemble()
+		tiles.multipleIdsOfCornerTiles()
+	}
+}
@@ -362,3 +362,14 @@ func TestDetermineMaxWaterRoughnessReturnsCorrectResultForExampleFromAssignment(
 		t.Fatalf("unexpected water roughness: %v", waterRoughness)
 	}
 }
+
+func BenchmarkDetermineMaxWaterRoughnessForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// Assembling rotates and flips the tiles in place, so they have to
+		// be parsed anew.
+		tiles, _ := parseTilesFromString(tilesFromAssignment)
+		tiles.assemble()
+		image := tiles.exportImage()
+		image.determineMaxWaterRoughness()
+	}
+}
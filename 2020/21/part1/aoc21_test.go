@@ -56,3 +56,19 @@ sqjhc mxmxvkd sbzzf (contains fish)
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkComputeOccurrenceCountOfIngredientsWithoutAllergensForExampleFromAssignment(b *testing.B) {
+	foods, _ := parseFoodsFromString(
+		`mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
+trh fvjkl sbzzf mxmxvkd (contains dairy)
+sqjhc fvjkl (contains soy)
+sqjhc mxmxvkd sbzzf (contains fish)
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		ingredientsWithoutAllergens := getIngredientsWithoutAllergens(foods)
+		computeOccurrenceCountOfIngredients(foods, ingredientsWithoutAllergens)
+	}
+}
@@ -52,3 +52,19 @@ sqjhc mxmxvkd sbzzf (contains fish)
 		t.Fatalf("unexpected list: %v", ingredientList)
 	}
 }
+
+func BenchmarkComputeCanonicalDangerousIngredientListForExampleFromAssignment(b *testing.B) {
+	foods, _ := parseFoodsFromString(
+		`mxmxvkd kfcds sqjhc nhms (contains dairy, fish)
+trh fvjkl sbzzf mxmxvkd (contains dairy)
+sqjhc fvjkl (contains soy)
+sqjhc mxmxvkd sbzzf (contains fish)
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		m := computeIngredientAlergenMap(foods)
+		computeCanonicalDangerousIngredientList(m)
+	}
+}
@@ -75,3 +75,25 @@ Player 2:
 		t.Fatalf("unexpected winning score: %v", winningScore)
 	}
 }
+
+func BenchmarkPlayGameForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// Playing changes the decks, so they have to be parsed anew.
+		deck1, deck2, _ := parseDecksFromString(
+			`Player 1:
+9
+2
+6
+3
+1
+
+Player 2:
+5
+8
+4
+7
+10`,
+		)
+		playGame(deck1, deck2)
+	}
+}
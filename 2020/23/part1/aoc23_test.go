@@ -44,3 +44,13 @@ func TestPerformMovesPerformsCorrectMovesOverGivenCupsForExampleFromAssignment2(
 		t.Fatalf("unexpected labelling: %v", labelling)
 	}
 }
+
+func BenchmarkPerformMovesAndGetFinalLabellingForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// The moves may change the cups in place, so they have to be created
+		// anew.
+		cups := Cups{3, 8, 9, 1, 2, 5, 4, 6, 7}
+		cups = performMoves(cups, 100)
+		getFinalLabelling(cups)
+	}
+}
@@ -161,6 +161,107 @@ func (game *Game) multiplyTwoCupLabelsAfterGivenCup(cup Cup) Cup {
 	return first * second
 }
 
+// An alternative to Game that stores the circle of cups as a successor array,
+// in which the cup following a cup is stored at the index given by the label
+// of the cup. Taking three cups and placing them after the destination cup
+// then only relinks three successors, so a move takes constant time instead
+// of copying all the cups between two buffers.
+type LinkedGame struct {
+	// The cup (label) following the given cup (label). The cup labels are
+	// 1, 2, ..., so the item at index 0 is unused.
+	next []Cup
+	// The current cup (label).
+	currCup Cup
+	// The last added cup (label), which is followed by the first added cup.
+	lastCup Cup
+	// Minimal cup (label).
+	minCup Cup
+	// Maximal cup (label).
+	maxCup Cup
+}
+
+func parseLinkedGameFromString(s string) (LinkedGame, error) {
+	game := LinkedGame{}
+
+	for _, c := range strings.Trim(s, "\n") {
+		c, err := strconv.Atoi(string(c))
+		if err != nil {
+			return game, errors.New(fmt.Sprintf("invalid string: %s", s))
+		}
+		game.addCup(Cup(c))
+	}
+
+	return game, nil
+}
+
+func (game *LinkedGame) padCupsWithCupNumbersUpTo(n Cup) {
+	for c := game.maxCup + 1; c <= n; c++ {
+		game.addCup(c)
+	}
+}
+
+func (game *LinkedGame) addCup(cup Cup) {
+	if game.minCup == 0 || cup < game.minCup {
+		game.minCup = cup
+	}
+	if game.maxCup == 0 || cup > game.maxCup {
+		game.maxCup = cup
+	}
+	for Cup(len(game.next)) <= cup {
+		game.next = append(game.next, noCup)
+	}
+	if game.currCup == noCup {
+		game.currCup = cup
+	} else {
+		game.next[game.lastCup] = cup
+	}
+	// Close the circle.
+	game.next[cup] = game.currCup
+	game.lastCup = cup
+}
+
+func (game *LinkedGame) performMove() {
+	// Take 3 cups.
+	first := game.next[game.currCup]
+	second := game.next[first]
+	third := game.next[second]
+
+	// Select a destination cup.
+	destinationCup := game.currCup
+	for {
+		destinationCup -= 1
+		if destinationCup < game.minCup {
+			destinationCup = game.maxCup
+		}
+
+		if destinationCup != first &&
+			destinationCup != second &&
+			destinationCup != third {
+			break
+		}
+	}
+
+	// Place the taken cups after the destination cup.
+	game.next[game.currCup] = game.next[third]
+	game.next[third] = game.next[destinationCup]
+	game.next[destinationCup] = first
+
+	// Select a new current cup.
+	game.currCup = game.next[game.currCup]
+}
+
+func (game *LinkedGame) performMoves(moveCount int) {
+	for n := 0; n < moveCount; n++ {
+		game.performMove()
+	}
+}
+
+func (game *LinkedGame) multiplyTwoCupLabelsAfterGivenCup(cup Cup) Cup {
+	first := game.next[cup]
+	second := game.next[first]
+	return first * second
+}
+
 func printErrorAndExit(err error) {
 	fmt.Fprintln(os.Stderr, "error:", err)
 	os.Exit(1)
@@ -181,7 +282,7 @@ func loadInputFileContent() string {
 
 func main() {
 	input := loadInputFileContent()
-	game, err := parseGameFromString(input)
+	game, err := parseLinkedGameFromString(input)
 	if err != nil {
 		printErrorAndExit(err)
 	}
@@ -1,6 +1,9 @@
 package main
 
-import "testing"
+import (
+	"fmt"
+	"testing"
+)
 
 func TestParseGameFromStringReturnsCorrectGameWhenInputStringIsValid(t *testing.T) {
 	game, err := parseGameFromString("32415")
@@ -49,5 +52,100 @@ func TestPerformMovesPerformsCorrectMovesOverGivenCupsForExampleFromAssignment(t
 	}
 }
 
-// There is no test for 10M moves because its execution takes too long to
-// finish.
+// There is no test for 10M moves of Game because its execution takes too long
+// to finish (LinkedGame is tested on 10M moves below).
+
+func TestParseLinkedGameFromStringReturnsCorrectGameWhenInputStringIsValid(t *testing.T) {
+	game, err := parseLinkedGameFromString("32415")
+
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	next := game.next
+	if len(next) != 6 || next[3] != 2 || next[2] != 4 || next[4] != 1 ||
+		next[1] != 5 || next[5] != 3 || game.minCup != 1 || game.maxCup != 5 ||
+		game.currCup != 3 {
+		t.Fatalf("unexpected game: %v", game)
+	}
+}
+
+func TestParseLinkedGameFromStringReturnsErrorWhenInputStringIsInvalid(t *testing.T) {
+	_, err := parseLinkedGameFromString("32x15")
+
+	if err == nil {
+		t.Fatalf("unexpectedly succeeded")
+	}
+}
+
+func TestPadCupsWithCupNumbersUpToCorrectlyPadsLinkedCups(t *testing.T) {
+	game, _ := parseLinkedGameFromString("32415")
+
+	game.padCupsWithCupNumbersUpTo(1_000_000)
+
+	next := game.next
+	if len(next) != 1_000_001 || next[5] != 6 || next[6] != 7 ||
+		next[999_999] != 1_000_000 || next[1_000_000] != 3 ||
+		game.minCup != 1 || game.maxCup != 1_000_000 || game.currCup != 3 {
+		t.Fatalf("unexpected game: %v... (length: %v)", next[:10], len(next))
+	}
+}
+
+func TestPerformMovesPerformsCorrectMovesOverGivenLinkedCupsForExampleFromAssignment(t *testing.T) {
+	game, _ := parseLinkedGameFromString("389125467")
+
+	game.performMoves(10)
+
+	result := game.multiplyTwoCupLabelsAfterGivenCup(1)
+	if result != 18 { // 9 * 2
+		t.Fatalf("unexpected result: %v", result)
+	}
+}
+
+func TestPerformMovesPerformsCorrectTenMillionMovesOverMillionLinkedCupsForExampleFromAssignment(t *testing.T) {
+	game, _ := parseLinkedGameFromString("389125467")
+	game.padCupsWithCupNumbersUpTo(1_000_000)
+
+	game.performMoves(10_000_000)
+
+	result := game.multiplyTwoCupLabelsAfterGivenCup(1)
+	if result != 149245887792 { // 934001 * 159792
+		t.Fatalf("unexpected result: %v", result)
+	}
+}
+
+func BenchmarkPerformMovesAndMultiplyTwoCupLabelsAfterGivenCupForExampleFromAssignment(b *testing.B) {
+	for i := 0; i < b.N; i++ {
+		// The moves change the cups in place, so the game has to be created
+		// anew.
+		game, _ := parseLinkedGameFromString("389125467")
+		game.padCupsWithCupNumbersUpTo(1_000_000)
+		game.performMoves(10_000_000)
+		game.multiplyTwoCupLabelsAfterGivenCup(1)
+	}
+}
+
+// Compares a single move of the two engines (Game and LinkedGame) on circles
+// of 10^6 and 10^7 cups. The moves continue with the same game, so ns/op is
+// the time per move.
+func BenchmarkPerformMove(b *testing.B) {
+	for _, cupCount := range []Cup{1_000_000, 10_000_000} {
+		b.Run(fmt.Sprintf("Game/%v", cupCount), func(b *testing.B) {
+			game, _ := parseGameFromString("389125467")
+			game.padCupsWithCupNumbersUpTo(cupCount)
+
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				game.performMove()
+			}
+		})
+		b.Run(fmt.Sprintf("LinkedGame/%v", cupCount), func(b *testing.B) {
+			game, _ := parseLinkedGameFromString("389125467")
+			game.padCupsWithCupNumbersUpTo(cupCount)
+
+			b.ResetTimer()
+			for i := 0; i < b.N; i++ {
+				game.performMove()
+			}
+		})
+	}
+}
@@ -86,3 +86,37 @@ wseweeenwnesenwwwswnew
 		t.Fatalf("unexpected count: %v", count)
 	}
 }
+
+func BenchmarkFlipTilesByRulesForDaysAndCountBlackTilesForExampleFromAssignment(b *testing.B) {
+	tilesDirections, _ := parseTilesDirectionsFromString(
+		`sesenwnenenewseeswwswswwnenewsewsw
+neeenesenwnwwswnenewnwwsewnenwseswesw
+seswneswswsenwwnwse
+nwnwneseeswswnenewneswwnewseswneseene
+swweswneswnenwsewnwneneseenw
+eesenwseswswnenwswnwnwsewwnwsene
+sewnenenenesenwsewnenwwwse
+wenwwweseeeweswwwnwwe
+wsweesenenewnwwnwsenewsenwwsesesenwne
+neeswseenwwswnwswswnw
+nenwswwsewswnenenewsenwsenwnesesenew
+enewnwewneswsewnwswenweswnenwsenwsw
+sweneswneswneneenwnewenewwneswswnese
+swwesenesewenwneswnwwneseswwne
+enesenwswwswneneswsenwnewswseenwsese
+wnwnesenesenenwwnenwsewesewsesesew
+nenewswnwewswnenesenwnesewesw
+eneswnwswnwsenenwnwnwwseeswneewsenese
+neswnwewnwnwseenwseesewsenwsweewe
+wseweeenwnesenwwwswnew
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		grid := createNewGrid()
+		grid.flipTilesByDirections(tilesDirections)
+		grid.flipTilesByRulesForDays(100)
+		grid.countBlackTiles()
+	}
+}
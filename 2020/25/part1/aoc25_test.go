@@ -33,3 +33,16 @@ func TestComputeEncryptionKeyReturnsCorrectEncryptionKeyForExampleFromAssignment
 		t.Fatalf("unexpected encryption key: %v", encryptionKey)
 	}
 }
+
+func BenchmarkComputeEncryptionKeyForExampleFromAssignment(b *testing.B) {
+	cardPK, doorPK, _ := parsePublicKeysFromString(
+		`5764801
+17807724
+`,
+	)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		computeEncryptionKey(cardPK, doorPK)
+	}
+}
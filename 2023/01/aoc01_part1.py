@@ -5,18 +5,19 @@
 import textwrap
 import unittest
 
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return list(input.strip().split("\n"))
+    return inputs.iter_lines(input)
 
 
 def compute_calibration_values(lines):
-    return list(map(compute_calibration_value, lines))
+    return map(compute_calibration_value, lines)
 
 
 def compute_calibration_value(line):
@@ -30,7 +31,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
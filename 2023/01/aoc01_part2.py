@@ -2,66 +2,123 @@
 # Advent of Code 2023, day 01, part 2
 #
 
+import collections
+import dataclasses
 import textwrap
 import unittest
 
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return list(input.strip().split("\n"))
+    return inputs.iter_lines(input)
 
 
 def compute_calibration_values(lines):
-    return list(map(compute_calibration_value, lines))
+    return map(compute_calibration_value, lines)
+
+
+DIGITS = {
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    **{digit: digit for digit in "123456789"},
+}
+
+
+@dataclasses.dataclass
+class Automaton:
+    # An Aho-Corasick automaton turned into a deterministic one: the state 0
+    # is the start, transitions[state] maps every character occurring in the
+    # words to the next state (characters not in the mapping lead to the
+    # start), and outputs[state] is the value of the word ending in the state
+    # (or None). Every character is thus processed by a single lookup, also
+    # when words overlap (e.g. "twone" ends with both "two" and "one").
+    transitions: list
+    outputs: list
+
+
+def build_automaton(words):
+    # Words are a mapping of words to their values. No word may be a proper
+    # suffix of another word (so that at most one word ends in every state).
+    transitions = [{}]
+    outputs = [None]
+    for word, value in words.items():
+        state = 0
+        for c in word:
+            if c not in transitions[state]:
+                transitions[state][c] = len(transitions)
+                transitions.append({})
+                outputs.append(None)
+            state = transitions[state][c]
+        outputs[state] = value
+
+    # Complete the transitions in the breadth-first order, in which the
+    # failure state (the longest proper suffix that is a prefix of a word) of
+    # every state is complete before the state itself.
+    alphabet = set("".join(words))
+    failures = [0] * len(transitions)
+    queue = collections.deque()
+    for c in alphabet:
+        if c in transitions[0]:
+            queue.append(transitions[0][c])
+        else:
+            transitions[0][c] = 0
+    while queue:
+        state = queue.popleft()
+        failure = failures[state]
+        if outputs[state] is None:
+            outputs[state] = outputs[failure]
+        for c in alphabet:
+            if c in transitions[state]:
+                next_state = transitions[state][c]
+                failures[next_state] = transitions[failure][c]
+                queue.append(next_state)
+            else:
+                transitions[state][c] = transitions[failure][c]
+    return Automaton(transitions, outputs)
+
+
+DIGIT_AUTOMATON = build_automaton(DIGITS)
 
 
 def compute_calibration_value(line):
     first_digit = None
     last_digit = None
 
-    for i in range(len(line)):
-        c = get_digit_on_position(line, i)
-        if c.isdigit():
+    transitions = DIGIT_AUTOMATON.transitions
+    outputs = DIGIT_AUTOMATON.outputs
+    state = 0
+    for c in line:
+        state = transitions[state].get(c, 0)
+        digit = outputs[state]
+        if digit is not None:
             if first_digit is None:
-                first_digit = last_digit = c
-            else:
-                last_digit = c
+                first_digit = digit
+            last_digit = digit
 
     assert first_digit is not None and last_digit is not None
     return int(first_digit + last_digit)
 
 
-def get_digit_on_position(line, i):
-    map = {
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-    }
-
-    for name, digit in map.items():
-        if line[i : i + len(name)] == name:
-            return digit
-
-    return line[i]
-
-
 def run_program(input):
     lines = parse_input(input)
     return sum(compute_calibration_values(lines))
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
@@ -107,3 +164,15 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 28)
+
+    def test_automaton_finds_all_overlapping_words(self):
+        automaton = build_automaton(DIGITS)
+
+        state = 0
+        found = []
+        for c in "xtwoneightwo7":
+            state = automaton.transitions[state].get(c, 0)
+            if automaton.outputs[state] is not None:
+                found.append(automaton.outputs[state])
+
+        self.assertEqual(found, ["2", "1", "8", "2", "7"])
@@ -2,21 +2,16 @@
 # Advent of Code 2023, day 03, part 1
 #
 
+import dataclasses
+import itertools
 import re
 import textwrap
 import unittest
 
 
-ADJACENT_DIRECTIONS = [
-    (-1, -1),
-    (-1, 0),
-    (-1, +1),
-    (0, -1),
-    (0, +1),
-    (+1, -1),
-    (+1, 0),
-    (+1, +1),
-]
+# The group keeps the numbers in the result of NUMBER_RE.split().
+NUMBER_RE = re.compile(r"(\d+)")
+SYMBOL_RE = re.compile(r"[^.\d]")
 
 
 def read_input():
@@ -24,39 +19,59 @@ def read_input():
         return f.read()
 
 
-def parse_input(input):
-    return list(input.strip().split("\n"))
-
-
-def get_part_numbers(engine):
-    part_numbers = []
-    for i in range(len(engine)):
-        for j in range(len(engine[i])):
-            if engine[i][j] not in ".1234567890":
-                part_numbers.extend(get_part_numbers_adjacent_to_position(engine, i, j))
-    return part_numbers
-
-
-def get_part_numbers_adjacent_to_position(engine, i, j):
-    part_numbers = set()
-    for ix, jx in ADJACENT_DIRECTIONS:
-        if engine[i + ix][j + jx].isdigit():
-            part_numbers.add(get_number_on_position(engine, i + ix, j + jx))
-    return part_numbers
+@dataclasses.dataclass
+class Schematic:
+    rows: list
+    # values[id] is the value of the number with the id (ids are assigned in
+    # the reading order).
+    values: list
+    # ids[i][j] is the id of the number covering the cell (None when there is
+    # no number), so every cell is turned into a number in constant time.
+    ids: list
 
 
-def get_number_on_position(engine, i, j):
-    while engine[i][j].isdigit():
-        j -= 1
-
-    m = re.match(r"^(\d+)", engine[i][j + 1 :])
-    assert m is not None
-    return int(m.group(1))
+def parse_input(input):
+    rows = list(input.strip().split("\n"))
+    values = []
+    ids = []
+    for row in rows:
+        # The row is split into runs of non-digits and numbers, which
+        # alternate (the first and last runs are non-digits, possibly empty).
+        runs = NUMBER_RE.split(row)
+        run_starts = list(itertools.accumulate(map(len, runs), initial=0))
+        row_ids = [None] * len(row)
+        for id, start, end in zip(
+            itertools.count(len(values)), run_starts[1::2], run_starts[2::2]
+        ):
+            row_ids[start:end] = [id] * (end - start)
+        values.extend(map(int, runs[1::2]))
+        ids.append(row_ids)
+    return Schematic(rows, values, ids)
+
+
+def get_part_numbers(schematic):
+    # Every number adjacent to a symbol is a part number, even when it is
+    # adjacent to several symbols. The windows around all symbols in a row
+    # share the same rows of the id grid, so their columns are collected first
+    # and then looked up in every row at once (the symbols themselves are not
+    # numbers).
+    part_number_ids = set()
+    for i, row in enumerate(schematic.rows):
+        symbol_columns = [m.start() for m in SYMBOL_RE.finditer(row)]
+        columns = set(symbol_columns)
+        columns.update(j - 1 for j in symbol_columns)
+        columns.update(j + 1 for j in symbol_columns)
+        columns.discard(-1)
+        columns.discard(len(row))
+        for row_ids in schematic.ids[max(i - 1, 0) : i + 2]:
+            part_number_ids.update(map(row_ids.__getitem__, columns))
+    part_number_ids.discard(None)
+    return [schematic.values[id] for id in sorted(part_number_ids)]
 
 
 def run_program(input):
-    engine = parse_input(input)
-    return sum(get_part_numbers(engine))
+    schematic = parse_input(input)
+    return sum(get_part_numbers(schematic))
 
 
 if __name__ == "__main__":
@@ -84,3 +99,23 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 4361)
+
+    def test_parse_input_builds_id_grid(self):
+        schematic = parse_input("467..114\n...*....\n")
+
+        self.assertEqual(schematic.values, [467, 114])
+        self.assertEqual(schematic.ids[0], [0, 0, 0, None, None, 1, 1, 1])
+
+    def test_program_counts_every_part_number_once(self):
+        # The first 12 is adjacent to two symbols, and both 12s are adjacent
+        # to the same symbol.
+        input = textwrap.dedent(
+            """
+            #12.12
+            ...*..
+            """
+        )
+
+        result = run_program(input)
+
+        self.assertEqual(result, 24)
@@ -2,21 +2,16 @@
 # Advent of Code 2023, day 03, part 2
 #
 
+import dataclasses
+import itertools
 import re
 import textwrap
 import unittest
 
 
-ADJACENT_DIRECTIONS = [
-    (-1, -1),
-    (-1, 0),
-    (-1, +1),
-    (0, -1),
-    (0, +1),
-    (+1, -1),
-    (+1, 0),
-    (+1, +1),
-]
+# The group keeps the numbers in the result of NUMBER_RE.split().
+NUMBER_RE = re.compile(r"(\d+)")
+GEAR_RE = re.compile(r"\*")
 
 
 def read_input():
@@ -24,41 +19,62 @@ def read_input():
         return f.read()
 
 
-def parse_input(input):
-    return list(input.strip().split("\n"))
+@dataclasses.dataclass
+class Schematic:
+    rows: list
+    # values[id] is the value of the number with the id (ids are assigned in
+    # the reading order).
+    values: list
+    # ids[i][j] is the id of the number covering the cell (None when there is
+    # no number), so every cell is turned into a number in constant time.
+    ids: list
 
 
-def get_gear_ratios_in_engine(engine):
+def parse_input(input):
+    rows = list(input.strip().split("\n"))
+    values = []
+    ids = []
+    for row in rows:
+        # The row is split into runs of non-digits and numbers, which
+        # alternate (the first and last runs are non-digits, possibly empty).
+        runs = NUMBER_RE.split(row)
+        run_starts = list(itertools.accumulate(map(len, runs), initial=0))
+        row_ids = [None] * len(row)
+        for id, start, end in zip(
+            itertools.count(len(values)), run_starts[1::2], run_starts[2::2]
+        ):
+            row_ids[start:end] = [id] * (end - start)
+        values.extend(map(int, runs[1::2]))
+        ids.append(row_ids)
+    return Schematic(rows, values, ids)
+
+
+def get_adjacent_number_ids(schematic, i, j):
+    # Returns ids of numbers in the 3x3 window around the cell (the cell itself
+    # holds a symbol, not a number). Each row of the window is a slice of the
+    # id grid, and a number covering several cells of the window is reported
+    # only once.
+    number_ids = set()
+    for row_ids in schematic.ids[max(i - 1, 0) : i + 2]:
+        number_ids.update(row_ids[max(j - 1, 0) : j + 2])
+    number_ids.discard(None)
+    return number_ids
+
+
+def get_gear_ratios_in_engine(schematic):
     gear_ratios = []
-    for i in range(len(engine)):
-        for j in range(len(engine[i])):
-            if engine[i][j] == "*":
-                part_numbers = get_part_numbers_adjacent_to_position(engine, i, j)
-                if len(part_numbers) == 2:
-                    gear_ratios.append(part_numbers[0] * part_numbers[1])
+    for i, row in enumerate(schematic.rows):
+        for m in GEAR_RE.finditer(row):
+            part_number_ids = get_adjacent_number_ids(schematic, i, m.start())
+            if len(part_number_ids) == 2:
+                id1, id2 = part_number_ids
+                gear_ratios.append(schematic.values[id1] * schematic.values[id2])
     return gear_ratios
 
 
-def get_part_numbers_adjacent_to_position(engine, i, j):
-    part_numbers = set()
-    for ix, jx in ADJACENT_DIRECTIONS:
-        if engine[i + ix][j + jx].isdigit():
-            part_numbers.add(get_number_on_position(engine, i + ix, j + jx))
-    return list(part_numbers)
-
-
-def get_number_on_position(engine, i, j):
-    while engine[i][j].isdigit():
-        j -= 1
-
-    m = re.match(r"^(\d+)", engine[i][j + 1 :])
-    assert m is not None
-    return int(m.group(1))
-
-
 def run_program(input):
-    engine = parse_input(input)
-    return sum(get_gear_ratios_in_engine(engine))
+    schematic = parse_input(input)
+    return sum(get_gear_ratios_in_engine(schematic))
 
 
 if __name__ == "__main__":
@@ -86,3 +102,15 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 467835)
+
+    def test_program_returns_gear_ratio_of_two_equal_part_numbers(self):
+        input = textwrap.dedent(
+            """
+            12.12
+            ..*..
+            """
+        )
+
+        result = run_program(input)
+
+        self.assertEqual(result, 144)
@@ -6,14 +6,15 @@ import re
 import textwrap
 import unittest
 
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [parse_card(line) for line in input.strip().split("\n")]
+    return map(parse_card, inputs.iter_lines(input))
 
 
 def parse_card(line):
@@ -44,7 +45,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
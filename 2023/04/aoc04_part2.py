@@ -2,23 +2,35 @@
 # Advent of Code 2023, day 04, part 2
 #
 
+import functools
+import operator
 import re
 import textwrap
 import unittest
 
+from aoc import inputs
+
+
+# Cards in the puzzle input have 10 winning numbers, so they win at most 10
+# copies (the ring buffer grows when a card wins more).
+INITIAL_RING_SIZE = 16
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [parse_card(line) for line in input.strip().split("\n")]
+    return map(parse_card, inputs.iter_lines(input))
 
 
 def parse_card(line):
     def parse_numbers(raw_numbers):
-        return {int(n) for n in re.split(r"\s+", raw_numbers.strip())}
+        # A bitmask with the bit n set for every number n, so the matching
+        # numbers of a card are found by a single AND.
+        return functools.reduce(
+            operator.or_, map((1).__lshift__, map(int, raw_numbers.split())), 0
+        )
 
     m = re.fullmatch(r"Card +(\d+): (.*) \| (.*)", line)
     assert m is not None
@@ -30,16 +42,42 @@ def parse_card(line):
 
 
 def get_total_card_count_for_cards(original_cards):
-    card_count_for_id = {id: 1 for id in range(1, len(original_cards) + 1)}
-    for card in original_cards:
+    # Cards are processed as they are read. A card with card_count copies and
+    # n matching numbers adds card_count copies to each of the next n cards,
+    # which is recorded in a difference array (+card_count for the next card,
+    # -card_count for the card after the n cards). The array is a ring buffer
+    # over the cards that have not been read yet, so the memory usage is
+    # bounded by the number of matching numbers, not by the number of cards.
+    diffs = [0] * INITIAL_RING_SIZE
+    copy_count = 0
+    total_card_count = 0
+    for id, card in enumerate(original_cards, start=1):
+        assert card["id"] == id
+        slot = id % len(diffs)
+        copy_count += diffs[slot]
+        diffs[slot] = 0
+        card_count = copy_count + 1
+        total_card_count += card_count
         matches = get_matching_number_count_for_card(card)
-        for id in range(card["id"] + 1, card["id"] + matches + 1):
-            card_count_for_id[id] += card_count_for_id[card["id"]]
-    return sum(card_count_for_id.values())
+        if matches > 0:
+            if matches + 2 > len(diffs):
+                diffs = resize_ring(diffs, id, max(matches + 2, 2 * len(diffs)))
+            diffs[(id + 1) % len(diffs)] += card_count
+            diffs[(id + matches + 1) % len(diffs)] -= card_count
+    return total_card_count
+
+
+def resize_ring(ring, start, size):
+    # Returns a ring of the given size with the items of the ring for the
+    # positions from start on.
+    new_ring = [0] * size
+    for position in range(start, start + len(ring)):
+        new_ring[position % size] = ring[position % len(ring)]
+    return new_ring
 
 
 def get_matching_number_count_for_card(card):
-    return len(card["own_numbers"] & card["winning_numbers"])
+    return (card["own_numbers"] & card["winning_numbers"]).bit_count()
 
 
 def run_program(input):
@@ -48,7 +86,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
@@ -68,3 +107,16 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 30)
+
+    def test_program_returns_correct_result_when_card_wins_more_than_ring_size(self):
+        winning_numbers = " ".join(map(str, range(1, 21)))
+        input = "".join(
+            f"Card {id}: {winning_numbers} | {' '.join(map(str, range(1, 22 - id)))}\n"
+            for id in range(1, 22)
+        )
+
+        result = run_program(input)
+
+        # Card i wins copies of all the following cards, so every card has
+        # twice as many instances as the previous one.
+        self.assertEqual(result, 2**21 - 1)
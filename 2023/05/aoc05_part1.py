@@ -2,6 +2,9 @@
 # Advent of Code 2023, day 05, part 1
 #
 
+import array
+import bisect
+import dataclasses
 import re
 import textwrap
 import unittest
@@ -20,7 +23,7 @@ def parse_input(input):
     m = re.fullmatch("seeds: (.+)", lines[0])
     assert m is not None
     raw_seeds = m.group(1).split(" ")
-    seeds = [int(n) for n in raw_seeds]
+    seeds = array.array("q", (int(n) for n in raw_seeds))
 
     maps = []
     for line in lines[2:]:
@@ -42,21 +45,51 @@ def parse_input(input):
     }
 
 
-def get_min_location_from_alamac(almanac):
-    min_location = None
+@dataclasses.dataclass
+class IntervalIndex:
+    # Numbers from starts[i] up to starts[i + 1] (exclusive) map to n +
+    # offsets[i]. The starts are sorted and the first one is 0, so numbers
+    # that are not in any range of the map have their own intervals (with
+    # offset 0) and every number is mapped by a single bisection.
+    starts: list
+    offsets: list
+
+
+def create_index_from_map(map):
+    starts, offsets = [0], [0]
+    for dst, src, length in sorted(map["ranges"], key=lambda range: range[1]):
+        if starts[-1] == src:
+            # Replace an empty gap between two adjacent ranges.
+            starts.pop()
+            offsets.pop()
+        starts.append(src)
+        offsets.append(dst - src)
+        starts.append(src + length)
+        offsets.append(0)
+    return IntervalIndex(starts, offsets)
+
+
+def get_locations(indexes, seeds):
+    # Returns the locations of all the seeds (an array, in the order of the
+    # seeds). Every map is applied to all the seeds before the next one, so
+    # the loop over the (possibly millions of) seeds runs in a comprehension
+    # with the index of a single map at hand, and it takes O(log ranges) per
+    # seed and map instead of O(ranges).
+    numbers = seeds
+    for index in indexes:
+        starts, offsets = index.starts, index.offsets
+        numbers = array.array(
+            "q",
+            [n + offsets[bisect.bisect_right(starts, n) - 1] for n in numbers],
+        )
+    return numbers
 
-    for n in almanac["seeds"]:
-        # The maps are ordered in a correct way, e.g. seed-soil,
-        # soil-fertilizer, etc.
-        for map in almanac["maps"]:
-            for dst, src, range in map["ranges"]:
-                if src <= n < src + range:
-                    n = dst + n - src
-                    break
-        if min_location is None or n < min_location:
-            min_location = n
 
-    return min_location
+def get_min_location_from_alamac(almanac):
+    # The maps are ordered in a correct way, e.g. seed-soil, soil-fertilizer,
+    # etc.
+    indexes = [create_index_from_map(map) for map in almanac["maps"]]
+    return min(get_locations(indexes, almanac["seeds"]))
 
 
 def run_program(input):
@@ -112,3 +145,13 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 35)
+
+    def test_get_locations_returns_location_for_every_seed(self):
+        indexes = [
+            create_index_from_map({"ranges": [(50, 98, 2), (52, 50, 48)]}),
+            create_index_from_map({"ranges": [(60, 56, 37), (56, 93, 4)]}),
+        ]
+
+        locations = get_locations(indexes, array.array("q", [79, 14, 55, 13, 99]))
+
+        self.assertEqual(list(locations), [85, 14, 61, 13, 51])
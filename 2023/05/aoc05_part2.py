@@ -1,9 +1,11 @@
 #
 # Advent of Code 2023, day 05, part 2
 #
-# Note: Although the script is slow, it does the job.
-#
 
+import bisect
+import dataclasses
+import functools
+import math
 import re
 import textwrap
 import unittest
@@ -47,52 +49,99 @@ def parse_input(input):
     }
 
 
+@dataclasses.dataclass
+class PiecewiseLinearFunction:
+    # The function maps x to x + offsets[i], where breakpoints[i] is the last
+    # breakpoint <= x. The breakpoints are sorted and the first one is 0, so
+    # the piece i spans from breakpoints[i] up to breakpoints[i + 1] (exclusive)
+    # and the last piece is unbounded.
+    breakpoints: list
+    offsets: list
+
+    def __call__(self, x):
+        return x + self.offsets[bisect.bisect_right(self.breakpoints, x) - 1]
+
+
+def add_piece(breakpoints, offsets, start, offset):
+    # Appends a piece (in the order of starts), replacing an empty piece that
+    # starts at the same place and merging it into the previous piece when
+    # their offsets are the same.
+    if breakpoints and breakpoints[-1] == start:
+        breakpoints.pop()
+        offsets.pop()
+    if offsets and offsets[-1] == offset:
+        return
+    breakpoints.append(start)
+    offsets.append(offset)
+
+
+def create_function_from_map(map):
+    # Numbers that are not in any range map to themselves (offset 0).
+    breakpoints, offsets = [], []
+    add_piece(breakpoints, offsets, 0, 0)
+    for dst, src, length in sorted(map["ranges"], key=lambda range: range[1]):
+        add_piece(breakpoints, offsets, src, dst - src)
+        add_piece(breakpoints, offsets, src + length, 0)
+    return PiecewiseLinearFunction(breakpoints, offsets)
+
+
+def compose_functions(f, g):
+    # Returns the function x -> g(f(x)). Every piece of f is mapped onto an
+    # interval that is split by the breakpoints of g, so the composed function
+    # has at most as many pieces as f and g together.
+    breakpoints, offsets = [], []
+    for i, (start, offset) in enumerate(zip(f.breakpoints, f.offsets)):
+        end = f.breakpoints[i + 1] if i + 1 < len(f.breakpoints) else math.inf
+        j = bisect.bisect_right(g.breakpoints, start + offset) - 1
+        x = start
+        while x < end:
+            add_piece(breakpoints, offsets, x, offset + g.offsets[j])
+            j += 1
+            if j == len(g.breakpoints):
+                break
+            x = g.breakpoints[j] - offset
+    return PiecewiseLinearFunction(breakpoints, offsets)
+
+
+def build_min_table(values):
+    # A sparse table, in which table[k][i] is the minimum of values[i:i + 2**k],
+    # so the minimum of any slice is found in constant time.
+    table = [values]
+    while 2 ** len(table) <= len(values):
+        prev = table[-1]
+        table.append(list(map(min, prev, prev[2 ** (len(table) - 1) :])))
+    return table
+
+
+def get_min_from_table(table, i, j):
+    # Returns the minimum of values[i:j] (i < j).
+    k = (j - i).bit_length() - 1
+    return min(table[k][i], table[k][j - 2**k])
+
+
 def get_min_location_from_alamac(almanac):
-    # We need to work with whole ranges as working with standalone seeds would
-    # be too slow and inefficient.
-    def map_ranges(ranges, mappings):
-        remaining = ranges
-        mapped = []
-        for dst, src, length in mappings:
-            new_remaining = []
-            for start, end in remaining:
-                # No overlap:
-                # [....]
-                #        [....]
-                # or
-                #        [....]
-                # [....]
-                if src + length < start or src > end:
-                    new_remaining.append((start, end))
-                # Overlap of the whole range:
-                # [...........]
-                #    [.....]
-                elif src <= start < src + length and src <= end < src + length:
-                    mapped.append((dst + start - src, dst + end - src))
-                # Overlap in the beginning of the range:
-                #    [......]
-                # [.....]
-                elif src <= end < src + length:
-                    mapped.append((dst, dst + end - src))
-                    new_remaining.append((start, src - 1))
-                # Overlap in the ending of the range:
-                #    [......]
-                #        [.....]
-                else:
-                    mapped.append((dst + start - src, dst + length))
-                    new_remaining.append((src + length, end))
-            remaining = new_remaining
-
-        return mapped + remaining
-
-    ranges = [(start, start + length - 1) for start, length in almanac["seed_ranges"]]
-
-    # The maps are ordered in a correct way, e.g. seed-soil,
-    # soil-fertilizer, etc.
-    for map in almanac["maps"]:
-        ranges = map_ranges(ranges, map["ranges"])
-
-    return min(range[0] for range in ranges)
+    # The maps are ordered in a correct way, e.g. seed-soil, soil-fertilizer,
+    # etc., so we compose them into a single function from seeds to locations.
+    f = functools.reduce(
+        compose_functions, (create_function_from_map(map) for map in almanac["maps"])
+    )
+
+    # The function increases within every piece, so its minimum over a range
+    # of seeds is at the start of the range or at the start of a piece inside
+    # the range.
+    min_table = build_min_table(
+        [start + offset for start, offset in zip(f.breakpoints, f.offsets)]
+    )
+    min_location = math.inf
+    for start, length in almanac["seed_ranges"]:
+        if length <= 0:
+            continue
+        i = bisect.bisect_right(f.breakpoints, start)
+        j = bisect.bisect_left(f.breakpoints, start + length)
+        min_location = min(min_location, f(start))
+        if i < j:
+            min_location = min(min_location, get_min_from_table(min_table, i, j))
+    return min_location
 
 
 def run_program(input):
@@ -148,3 +197,24 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 46)
+
+    def test_compose_functions_returns_function_applying_both_maps(self):
+        f = create_function_from_map({"ranges": [(50, 98, 2), (52, 50, 48)]})
+        g = create_function_from_map(
+            {"ranges": [(0, 15, 37), (37, 52, 2), (39, 0, 15)]}
+        )
+
+        h = compose_functions(f, g)
+
+        # From the assignment: seeds 79, 14, 55, and 13 correspond to soils 81,
+        # 14, 57, and 13, which correspond to fertilizers 81, 53, 57, and 52.
+        self.assertEqual([h(seed) for seed in (79, 14, 55, 13)], [81, 53, 57, 52])
+
+    def test_get_min_from_table_returns_minimum_of_any_slice(self):
+        values = [5, 3, 8, 1, 9, 2, 7]
+
+        table = build_min_table(values)
+
+        for i in range(len(values)):
+            for j in range(i + 1, len(values) + 1):
+                self.assertEqual(get_min_from_table(table, i, j), min(values[i:j]))
@@ -3,13 +3,29 @@
 #
 
 import collections
-import itertools
 import textwrap
 import unittest
 
 
-AVAILABLE_CARDS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A"]
 CARD_STRENGTHS = ["J", "2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A"]
+STRENGTH_FOR_CARD = {card: strength for strength, card in enumerate(CARD_STRENGTHS)}
+# Hand types for counts of the same cards in the hand (from the largest).
+HAND_TYPES = {
+    # Five of kind
+    (5,): 7,
+    # Four of kind
+    (4, 1): 6,
+    # Full house
+    (3, 2): 5,
+    # Three of kind
+    (3, 1, 1): 4,
+    # Two pairs
+    (2, 2, 1): 3,
+    # One pair
+    (2, 1, 1, 1): 2,
+    # High card
+    (1, 1, 1, 1, 1): 1,
+}
 
 
 def read_input():
@@ -36,65 +52,41 @@ def compute_total_winnings(hands_and_bids):
 
 def hand_and_bid_ordering_key(hand_and_bid):
     hand, _ = hand_and_bid
-    return get_best_hand_type(hand), get_cards_strengths(hand)
-
-
-def get_best_hand_type(hand):
-    """Selects the best hand type when the given hand may contain jokers."""
-    joker_count = hand.count("J")
+    return get_hand_key(hand)
 
-    # A hand with 4 or 5 jokers can always be converted to five of kind, so do
-    # this right away to speed up the computation.
-    if joker_count in (4, 5):
-        return get_hand_type(["A", "A", "A", "A", "A"])
 
-    hand_types = []
-    for joker_replacement in itertools.product(AVAILABLE_CARDS, repeat=joker_count):
-        hand_without_jokers = replace_jokers(hand, joker_replacement)
-        hand_types.append(get_hand_type(hand_without_jokers))
-    return max(hand_types)
+def get_hand_key(hand):
+    """Encodes the hand into a single integer that orders hands by their best
+    types and then by strengths of their cards.
+    """
+    # The type is above the five card strengths, which are digits in base 13.
+    key = get_best_hand_type(hand)
+    for strength in get_cards_strengths(hand):
+        key = key * len(CARD_STRENGTHS) + strength
+    return key
 
 
-def replace_jokers(hand, joker_replacement):
-    new_hand = []
-    i = 0
-    for card in hand:
-        if card == "J":
-            new_hand.append(joker_replacement[i])
-            i += 1
-        else:
-            new_hand.append(card)
-    return new_hand
+def get_best_hand_type(hand):
+    """Selects the best hand type when the given hand may contain jokers."""
+    # Turning all jokers into the most common other card always gives the
+    # best type (e.g. two pairs and a joker become a full house, not three of
+    # kind), so the type is computed without trying the replacements.
+    counts = get_card_counts([card for card in hand if card != "J"]) or [0]
+    counts[0] += len(hand) - sum(counts)
+    return HAND_TYPES[tuple(counts)]
 
 
 def get_hand_type(hand):
     """Selects the hand type when the given hand does not contain any."""
-    counts = sorted(collections.Counter(hand).values(), reverse=True)
+    return HAND_TYPES[tuple(get_card_counts(hand))]
 
-    # Five of kind
-    if counts == [5]:
-        return 7
-    # Four of kind
-    elif counts == [4, 1]:
-        return 6
-    # Full house
-    elif counts == [3, 2]:
-        return 5
-    # Three of kind
-    elif counts == [3, 1, 1]:
-        return 4
-    # Two pairs
-    elif counts == [2, 2, 1]:
-        return 3
-    # One pair
-    elif counts == [2, 1, 1, 1]:
-        return 2
-    # High card
-    return 1
+
+def get_card_counts(hand):
+    return sorted(collections.Counter(hand).values(), reverse=True)
 
 
 def get_cards_strengths(hand):
-    return [CARD_STRENGTHS.index(card) for card in hand]
+    return [STRENGTH_FOR_CARD[card] for card in hand]
 
 
 def run_program(input):
@@ -153,3 +145,11 @@ class Tests(unittest.TestCase):
         self.assertEqual(get_cards_strengths("A23A4"), [12, 1, 2, 12, 3])
         self.assertEqual(get_cards_strengths("23456"), [1, 2, 3, 4, 5])
         self.assertEqual(get_cards_strengths("JJJJJ"), [0, 0, 0, 0, 0])
+
+    def test_get_hand_key_orders_hands_by_type_and_then_by_card_strengths(self):
+        hands = ["32T3K", "KK677", "T55J5", "QQQJA", "KTJJT", "JKKK2", "QQQQ2"]
+
+        self.assertEqual(
+            sorted(hands, key=get_hand_key),
+            ["32T3K", "KK677", "JKKK2", "T55J5", "QQQJA", "QQQQ2", "KTJJT"],
+        )
@@ -2,6 +2,8 @@
 # Advent of Code 2023, day 08, part 2
 #
 
+import dataclasses
+import itertools
 import math
 import re
 import textwrap
@@ -28,20 +30,192 @@ def parse_input(input):
     return instructions, network
 
 
+@dataclasses.dataclass
+class CompiledNetwork:
+    # Nodes are integers (indexes into names).
+    names: list
+    terminals: list
+    # moves[i][id] is the node reached from the node by the i-th instruction.
+    moves: list
+    # cycle_next[id] is the node reached from the node by all the
+    # instructions (a cycle), and cycle_terminal_offsets[id] are the numbers
+    # of steps from the start of the cycle (0 <= offset < len(moves)) after
+    # which the walk is at a terminal node.
+    cycle_next: list
+    cycle_terminal_offsets: list
+    # Binary lifting: jumps[k][id] is the node reached from the node after
+    # 2**k cycles (more levels are added as needed).
+    jumps: list
+
+
+@dataclasses.dataclass
+class GhostCycle:
+    # After tail steps (a multiple of the number of instructions), the times at
+    # which the ghost is at a terminal node repeat every period steps.
+    tail: int
+    period: int
+    # Sorted numbers of steps after which the ghost is at a terminal node,
+    # before the tail ends and within the first period after the tail.
+    tail_terminal_times: list
+    cycle_terminal_times: list
+
+
+def compile_network(instructions, network):
+    names = list(network)
+    id_for_name = {name: id for id, name in enumerate(names)}
+    lefts = [id_for_name[network[name]["L"]] for name in names]
+    rights = [id_for_name[network[name]["R"]] for name in names]
+    terminals = [name.endswith("Z") for name in names]
+    moves = [lefts if instruction == "L" else rights for instruction in instructions]
+
+    # Walk from all nodes through the instructions at once (positions[id] is
+    # the current node of the walk from the node).
+    positions = list(range(len(names)))
+    cycle_terminal_offsets = [[] for _ in names]
+    for offset, move in enumerate(moves):
+        for id in itertools.compress(
+            range(len(names)), map(terminals.__getitem__, positions)
+        ):
+            cycle_terminal_offsets[id].append(offset)
+        positions = list(map(move.__getitem__, positions))
+
+    return CompiledNetwork(
+        names, terminals, moves, positions, cycle_terminal_offsets, [positions]
+    )
+
+
+def get_node_after_steps(compiled, id, steps):
+    cycle_count, rest = divmod(steps, len(compiled.moves))
+    k = 0
+    while cycle_count > 0:
+        if k == len(compiled.jumps):
+            jumps = compiled.jumps[-1]
+            compiled.jumps.append(list(map(jumps.__getitem__, jumps)))
+        if cycle_count & 1:
+            id = compiled.jumps[k][id]
+        cycle_count >>= 1
+        k += 1
+    for move in compiled.moves[:rest]:
+        id = move[id]
+    return id
+
+
+def analyze_ghost(compiled, start):
+    # The state of a ghost at the start of every cycle is just its node, so
+    # the walk repeats once a node at the start of a cycle repeats.
+    cycle_for_node = {}
+    cycle_starts = []
+    id = start
+    while id not in cycle_for_node:
+        cycle_for_node[id] = len(cycle_starts)
+        cycle_starts.append(id)
+        id = compiled.cycle_next[id]
+
+    tail = cycle_for_node[id] * len(compiled.moves)
+    terminal_times = [
+        cycle * len(compiled.moves) + offset
+        for cycle, id in enumerate(cycle_starts)
+        for offset in compiled.cycle_terminal_offsets[id]
+    ]
+    cycle_terminal_times = [time for time in terminal_times if time >= tail]
+    period = get_shortest_period(
+        tail, len(cycle_starts) * len(compiled.moves) - tail, cycle_terminal_times
+    )
+    return GhostCycle(
+        tail,
+        period,
+        [time for time in terminal_times if time < tail],
+        [time for time in cycle_terminal_times if time < tail + period],
+    )
+
+
+def get_shortest_period(tail, period, times):
+    # The terminal times may repeat more often than the walk (e.g. a ghost
+    # going around a loop of 59 nodes is at the terminal node of the loop every
+    # 59 steps, but its walk repeats every 59 cycles of instructions). Fewer
+    # times per period mean fewer congruences to combine.
+    offsets = {time - tail for time in times}
+    divisors = [d for d in range(1, math.isqrt(period) + 1) if period % d == 0]
+    for d in divisors + [period // d for d in reversed(divisors)]:
+        if all((offset + d) % period in offsets for offset in offsets):
+            return d
+    return period
+
+
+def is_terminal_time(ghost, time):
+    if time < ghost.tail:
+        return time in ghost.tail_terminal_times
+    return (time - ghost.tail) % ghost.period + ghost.tail in ghost.cycle_terminal_times
+
+
+def iter_terminal_times(ghost, end):
+    # Yields all times before the end at which the ghost is at a terminal node
+    # (in the increasing order).
+    yield from (time for time in ghost.tail_terminal_times if time < end)
+    if not ghost.cycle_terminal_times:
+        return
+    for cycle_start in range(0, end, ghost.period):
+        for time in ghost.cycle_terminal_times:
+            if time + cycle_start >= end:
+                return
+            yield time + cycle_start
+
+
+def combine_congruences(r1, m1, r2, m2):
+    # Generalized Chinese remainder theorem (the moduli do not have to be
+    # coprime): returns (r, m) such that x = r1 (mod m1) and x = r2 (mod m2)
+    # if and only if x = r (mod m), or None when there is no such x.
+    gcd = math.gcd(m1, m2)
+    if (r2 - r1) % gcd != 0:
+        return None
+    x = (r2 - r1) // gcd * pow(m1 // gcd, -1, m2 // gcd) % (m2 // gcd)
+    m = m1 // gcd * m2
+    return (r1 + m1 * x) % m, m
+
+
+def get_first_common_terminal_time(ghosts):
+    # Until all ghosts are in their cycles, the times at which the first ghost
+    # is at a terminal node are checked one by one.
+    all_tails_end = max(ghost.tail for ghost in ghosts)
+    for time in iter_terminal_times(ghosts[0], all_tails_end):
+        if all(is_terminal_time(ghost, time) for ghost in ghosts[1:]):
+            return time
+
+    # After that, every ghost is at a terminal node at the times congruent to
+    # one of its cycle terminal times modulo its period. In the puzzle inputs,
+    # every ghost has a single such time equal to its period (which is when
+    # the plain LCM of the periods works), but there may be more of them.
+    congruences = [(0, 1)]
+    for ghost in ghosts:
+        congruences = [
+            congruence
+            for r, m in congruences
+            for time in ghost.cycle_terminal_times
+            if (congruence := combine_congruences(r, m, time, ghost.period)) is not None
+        ]
+    if not congruences:
+        return None
+    return min(all_tails_end + (r - all_tails_end) % m for r, m in congruences)
+
+
 def count_steps_to_reach_terminal_nodes(instructions, network):
-    # For each node ending with A, compute the number of steps that it takes to
-    # arrive at a node ending with Z. Then, compute the least common multiple
-    # of those steps, which gives us the total number of steps after which we
-    # arrive at all Z nodes at the same time.
-    required_steps_for_each_a_node = []
-    a_nodes = filter(lambda node: node.endswith("A"), network)
-    for node in a_nodes:
-        steps = 0
-        while not node.endswith("Z"):
-            node = network[node][instructions[steps % len(instructions)]]
-            steps += 1
-        required_steps_for_each_a_node.append(steps)
-    return math.lcm(*required_steps_for_each_a_node)
+    # Compute the number of steps after which ghosts starting at all nodes
+    # ending with A are at nodes ending with Z at the same time. Instead of
+    # assuming that every ghost reaches a Z node after the same number of
+    # steps as its cycle takes (so the least common multiple of the numbers
+    # of steps to the first Z node would be the answer), the cycles of the
+    # ghosts are analyzed and combined.
+    compiled = compile_network(instructions, network)
+    starts = [id for id, name in enumerate(compiled.names) if name.endswith("A")]
+    ghosts = [analyze_ghost(compiled, start) for start in starts]
+    steps = get_first_common_terminal_time(ghosts)
+    assert steps is not None, "the ghosts are never at Z nodes at the same time"
+    # Check the result by jumping with every ghost right to it.
+    assert all(
+        compiled.terminals[get_node_after_steps(compiled, start, steps)]
+        for start in starts
+    )
+    return steps
 
 
 def run_program(input):
@@ -74,3 +248,50 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 6)
+
+    def test_program_returns_correct_result_when_lcm_of_first_steps_is_wrong(self):
+        # 11A is at 11Z after 1, 4, 7, ... steps, 22A at 22Z after 2, 4, 6, ...
+        # steps (the LCM of the first steps is 2).
+        input = textwrap.dedent(
+            """
+            L
+
+            11A = (11Z, 11Z)
+            11Z = (11B, 11B)
+            11B = (11C, 11C)
+            11C = (11Z, 11Z)
+            22A = (22B, 22B)
+            22B = (22Z, 22Z)
+            22Z = (22B, 22B)
+            """
+        )
+
+        result = run_program(input)
+
+        self.assertEqual(result, 4)
+
+    def test_analyze_ghost_returns_tail_period_and_terminal_times(self):
+        instructions = list("LR")
+        network = {
+            "11A": {"L": "11Z", "R": "11Z"},
+            "11Z": {"L": "11B", "R": "11Z"},
+            "11B": {"L": "11Z", "R": "11B"},
+        }
+        compiled = compile_network(instructions, network)
+
+        ghost = analyze_ghost(compiled, compiled.names.index("11A"))
+
+        # 11A -> 11Z -> 11Z -> 11B -> 11B -> 11Z -> 11Z -> 11B -> ...
+        self.assertEqual(ghost, GhostCycle(2, 4, [1], [2, 5]))
+        self.assertEqual(
+            compiled.names[get_node_after_steps(compiled, 0, 1_000_003)], "11B"
+        )
+
+    def test_get_shortest_period_returns_period_of_terminal_times(self):
+        self.assertEqual(get_shortest_period(2, 12, [2, 5, 8, 11]), 3)
+        self.assertEqual(get_shortest_period(2, 12, [2, 5, 8]), 12)
+        self.assertEqual(get_shortest_period(0, 12, []), 1)
+
+    def test_combine_congruences_handles_moduli_that_are_not_coprime(self):
+        self.assertEqual(combine_congruences(2, 4, 4, 6), (10, 12))
+        self.assertIsNone(combine_congruences(1, 4, 2, 6))
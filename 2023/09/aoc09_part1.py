@@ -6,6 +6,8 @@ import itertools
 import textwrap
 import unittest
 
+from aoc import columns
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,7 +15,8 @@ def read_input():
 
 
 def parse_input(input):
-    return [[int(n) for n in line.split(" ")] for line in input.strip().split("\n")]
+    # Every history is an array of values.
+    return columns.iter_rows(*columns.parse_rows(input))
 
 
 def find_next_value_for_history(history):
@@ -2,10 +2,12 @@
 # Advent of Code 2023, day 10, part 1
 #
 
-import collections
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,67 +15,59 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def get_number_of_steps_to_reach_farthest_position_in_loop(grid):
-    start = find_start_position(grid)
+    start = grid.find("S")
     replace_start_position_with_pipe(start, grid)
 
     # Do a breadth-first search from the starting position to find the loop and
     # the number of steps that are required to reach its farthest position.
-    visited = set()
-    to_check = collections.deque([start])
-    while to_check:
-        curr = to_check.popleft()
-        visited.add((curr))
-        for new in get_next_positions(curr, grid):
-            if new not in visited:
-                to_check.append(new)
+    next_offsets_for_pipe = get_next_offsets_for_pipes(grid)
+
+    def neighbors(pos):
+        return [pos + offset for offset in next_offsets_for_pipe[grid.cells[pos]]]
+
+    distances, _ = search.bfs(len(grid.cells), [start], neighbors)
+    visited_count = sum(1 for d in distances if d != search.INFINITY)
 
     # Since we are in a loop, we can just return the half of the number of
     # visited positions to get the number of steps that are required to reach
     # its farthest position.
-    return len(visited) // 2
-
-
-def find_start_position(grid):
-    for i, line in enumerate(grid):
-        for j, pipe in enumerate(line):
-            if pipe == "S":
-                return i, j
-    raise AssertionError("no start position")
+    return visited_count // 2
 
 
 def replace_start_position_with_pipe(start, grid):
-    i, j = start
-    if grid[i - 1][j] in ["|", "7", "F"] and grid[i + 1][j] in ["|", "L", "J"]:
-        grid[i][j] = "|"
-    elif grid[i][j - 1] in ["-", "L", "F"] and grid[i][j + 1] in ["-", "J", "7"]:
-        grid[i][j] = "-"
-    elif grid[i - 1][j] in ["|", "7", "F"] and grid[i][j + 1] in ["-", "J", "7"]:
-        grid[i][j] = "L"
-    elif grid[i - 1][j] in ["|", "7", "F"] and grid[i][j - 1] in ["-", "L", "F"]:
-        grid[i][j] = "J"
-    elif grid[i][j - 1] in ["-", "L", "F"] and grid[i + 1][j] in ["|", "L", "J"]:
-        grid[i][j] = "7"
+    up = grid[start + grid.up]
+    down = grid[start + grid.down]
+    left = grid[start + grid.left]
+    right = grid[start + grid.right]
+    if up in ["|", "7", "F"] and down in ["|", "L", "J"]:
+        grid[start] = "|"
+    elif left in ["-", "L", "F"] and right in ["-", "J", "7"]:
+        grid[start] = "-"
+    elif up in ["|", "7", "F"] and right in ["-", "J", "7"]:
+        grid[start] = "L"
+    elif up in ["|", "7", "F"] and left in ["-", "L", "F"]:
+        grid[start] = "J"
+    elif left in ["-", "L", "F"] and down in ["|", "L", "J"]:
+        grid[start] = "7"
     else:
-        grid[i][j] = "F"
-
-
-def get_next_positions(current, grid):
-    # Based on the pipe at the current position in the grid, return the two
-    # positions that connect to the pipe.
-    i, j = current
-    next_positions_for_pipe = {
-        "|": [(i - 1, j), (i + 1, j)],
-        "-": [(i, j - 1), (i, j + 1)],
-        "L": [(i - 1, j), (i, j + 1)],
-        "J": [(i - 1, j), (i, j - 1)],
-        "7": [(i, j - 1), (i + 1, j)],
-        "F": [(i, j + 1), (i + 1, j)],
+        grid[start] = "F"
+
+
+def get_next_offsets_for_pipes(grid):
+    # For each pipe, return the offsets of the two positions that connect to
+    # the pipe.
+    return {
+        ord("|"): (grid.up, grid.down),
+        ord("-"): (grid.left, grid.right),
+        ord("L"): (grid.up, grid.right),
+        ord("J"): (grid.up, grid.left),
+        ord("7"): (grid.left, grid.down),
+        ord("F"): (grid.right, grid.down),
     }
-    return next_positions_for_pipe[grid[i][j]]
 
 
 def run_program(input):
@@ -2,10 +2,12 @@
 # Advent of Code 2023, day 10, part 2
 #
 
-import copy
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,7 +15,7 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def get_number_of_tiles_enclosed_by_loop(grid):
@@ -32,7 +34,7 @@ def get_number_of_tiles_enclosed_by_loop(grid):
     # 6. Count the ground tiles in the expanded grid by counting the number of
     #    3x3 matrices composed entirely of '.'.
     #
-    start_position = find_start_position(grid)
+    start_position = grid.find("S")
     grid = replace_start_position_with_pipe(start_position, grid)
     start_position, grid = expand_grid(start_position, grid)
     grid = find_and_mark_loop(start_position, grid)
@@ -41,174 +43,117 @@ def get_number_of_tiles_enclosed_by_loop(grid):
     return count_ground_tiles_in_expanded_grid(grid)
 
 
-def find_start_position(grid):
-    for i, line in enumerate(grid):
-        for j, pipe in enumerate(line):
-            if pipe == "S":
-                return i, j
-    raise AssertionError("no start position")
-
-
 def replace_start_position_with_pipe(start_position, grid):
     # Replace the start position ('S') with a proper pipe, depending on which
     # pipe fits there.
-    new_grid = copy.deepcopy(grid)
-
-    i, j = start_position
-    if grid[i - 1][j] in ["|", "7", "F"] and grid[i + 1][j] in ["|", "L", "J"]:
-        new_grid[i][j] = "|"
-    elif grid[i][j - 1] in ["-", "L", "F"] and grid[i][j + 1] in ["-", "J", "7"]:
-        new_grid[i][j] = "-"
-    elif grid[i - 1][j] in ["|", "7", "F"] and grid[i][j + 1] in ["-", "J", "7"]:
-        new_grid[i][j] = "L"
-    elif grid[i - 1][j] in ["|", "7", "F"] and grid[i][j - 1] in ["-", "L", "F"]:
-        new_grid[i][j] = "J"
-    elif grid[i][j - 1] in ["-", "L", "F"] and grid[i + 1][j] in ["|", "L", "J"]:
-        new_grid[i][j] = "7"
+    new_grid = grid.copy()
+
+    up = grid[start_position + grid.up]
+    down = grid[start_position + grid.down]
+    left = grid[start_position + grid.left]
+    right = grid[start_position + grid.right]
+    if up in ["|", "7", "F"] and down in ["|", "L", "J"]:
+        new_grid[start_position] = "|"
+    elif left in ["-", "L", "F"] and right in ["-", "J", "7"]:
+        new_grid[start_position] = "-"
+    elif up in ["|", "7", "F"] and right in ["-", "J", "7"]:
+        new_grid[start_position] = "L"
+    elif up in ["|", "7", "F"] and left in ["-", "L", "F"]:
+        new_grid[start_position] = "J"
+    elif left in ["-", "L", "F"] and down in ["|", "L", "J"]:
+        new_grid[start_position] = "7"
     else:
-        new_grid[i][j] = "F"
+        new_grid[start_position] = "F"
 
     return new_grid
 
 
+# Replacements of tiles by 3x3 matrices in the expanded grid.
+EXPANDED_TILES = {
+    "-": ["...", "---", "..."],
+    "|": [".|.", ".|.", ".|."],
+    "L": [".|.", ".L-", "..."],
+    "J": [".|.", "-J.", "..."],
+    "7": ["...", "-7.", ".|."],
+    "F": ["...", ".F-", ".|."],
+}
+EXPANDED_GROUND = ["...", "...", "..."]
+
+
 def expand_grid(start_position, grid):
     # Replace each tile in the grid with a 3x3 matrix. This simplifies the
     # flood-fill algorithm as pipes might touch each other.
-    new_start_position = start_position[0] * 3 + 1, start_position[1] * 3 + 1
-    new_grid = []
-
-    for line in grid:
-        new_lines = []
-        for c in line:
-            if c == "-":
-                new_lines.append(
-                    [
-                        [".", ".", "."],
-                        ["-", "-", "-"],
-                        [".", ".", "."],
-                    ]
-                )
-            elif c == "|":
-                new_lines.append(
-                    [
-                        [".", "|", "."],
-                        [".", "|", "."],
-                        [".", "|", "."],
-                    ]
-                )
-            elif c == "L":
-                new_lines.append(
-                    [
-                        [".", "|", "."],
-                        [".", "L", "-"],
-                        [".", ".", "."],
-                    ]
-                )
-            elif c == "J":
-                new_lines.append(
-                    [
-                        [".", "|", "."],
-                        ["-", "J", "."],
-                        [".", ".", "."],
-                    ]
-                )
-            elif c == "7":
-                new_lines.append(
-                    [
-                        [".", ".", "."],
-                        ["-", "7", "."],
-                        [".", "|", "."],
-                    ]
-                )
-            elif c == "F":
-                new_lines.append(
-                    [
-                        [".", ".", "."],
-                        [".", "F", "-"],
-                        [".", "|", "."],
-                    ]
-                )
-            else:
-                new_lines.append(
-                    [
-                        [".", ".", "."],
-                        [".", ".", "."],
-                        [".", ".", "."],
-                    ]
-                )
-        for i in [0, 1, 2]:
-            new_line = []
-            for lines in new_lines:
-                new_line.extend(lines[i])
-            new_grid.append(new_line)
-
-    return new_start_position, new_grid
+    i, j = grid.coords(start_position)
+    lines = []
+    for row in grid.rows():
+        expanded_tiles = [EXPANDED_TILES.get(c, EXPANDED_GROUND) for c in row]
+        for k in [0, 1, 2]:
+            lines.append("".join(tile[k] for tile in expanded_tiles))
+    new_grid = grids.Grid.from_lines(lines)
+    return new_grid.pos(i * 3 + 1, j * 3 + 1), new_grid
 
 
 def find_and_mark_loop(start_position, grid):
-    # Do a depth-first search from the starting position ('S') to find the
-    # loop and replace all its characters with '#'. Breadth-first search would
-    # also work here.
-    new_grid = copy.deepcopy(grid)
-
-    visited = set()
-    to_check = [start_position]
-    while to_check:
-        i, j = to_check.pop(0)
-        visited.add((i, j))
-        new_grid[i][j] = "#"
-        for position in get_next_positions((i, j), grid):
-            if position not in visited:
-                to_check.append(position)
+    # Do a breadth-first search from the starting position ('S') to find the
+    # loop and replace all its characters with '#'.
+    new_grid = grid.copy()
+    next_offsets_for_pipe = get_next_offsets_for_pipes(grid)
+    loop_tile = ord("#")
+
+    def neighbors(pos):
+        return [pos + offset for offset in next_offsets_for_pipe[grid.cells[pos]]]
+
+    distances, _ = search.bfs(len(grid.cells), [start_position], neighbors)
+    for pos, distance in enumerate(distances):
+        if distance != search.INFINITY:
+            new_grid.cells[pos] = loop_tile
 
     return new_grid
 
 
-def get_next_positions(current, grid):
-    # Based on the pipe at the current position in the grid, return the two
-    # positions that connect to the pipe.
-    i, j = current
-    next_positions_for_pipe = {
-        "|": [(i - 1, j), (i + 1, j)],
-        "-": [(i, j - 1), (i, j + 1)],
-        "L": [(i - 1, j), (i, j + 1)],
-        "J": [(i - 1, j), (i, j - 1)],
-        "7": [(i, j - 1), (i + 1, j)],
-        "F": [(i, j + 1), (i + 1, j)],
+def get_next_offsets_for_pipes(grid):
+    # For each pipe, return the offsets of the two positions that connect to
+    # the pipe.
+    return {
+        ord("|"): (grid.up, grid.down),
+        ord("-"): (grid.left, grid.right),
+        ord("L"): (grid.up, grid.right),
+        ord("J"): (grid.up, grid.left),
+        ord("7"): (grid.left, grid.down),
+        ord("F"): (grid.right, grid.down),
     }
-    return next_positions_for_pipe[grid[i][j]]
 
 
 def mark_non_loop_tiles(grid):
     # Go over the grid and replace all tiles that are not part of the loop
     # with '.'. This simplifies the next steps.
-    new_grid = copy.deepcopy(grid)
+    new_grid = grid.copy()
 
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] != "#":
-                new_grid[i][j] = "."
+    loop_tile = ord("#")
+    ground_tile = ord(".")
+    for pos in grid.positions():
+        if grid.cells[pos] != loop_tile:
+            new_grid.cells[pos] = ground_tile
 
     return new_grid
 
 
 def flood_grid(grid):
     # Do a flood fill over the grid (https://en.wikipedia.org/wiki/Flood_fill),
-    # replacing ground tiles ('.') with ' '.
-    new_grid = copy.deepcopy(grid)
-
-    positions_to_flood = [(0, 0)]
-    while positions_to_flood:
-        i, j = positions_to_flood.pop()
-        new_grid[i][j] = " "
-        neighbors = [(i - 1, j), (i, j + 1), (i + 1, j), (i, j - 1)]
-        for x, y in neighbors:
-            if (
-                0 <= x < len(new_grid)
-                and 0 <= y < len(new_grid[i])
-                and new_grid[x][y] == "."
-            ):
-                positions_to_flood.append((x, y))
+    # replacing ground tiles ('.') with ' '. The border around the grid stops
+    # the flood, so there is no need to check bounds.
+    new_grid = grid.copy()
+
+    ground_tile = ord(".")
+    flooded_tile = ord(" ")
+
+    def neighbors(pos):
+        return [pos + d for d in grid.directions if grid.cells[pos + d] == ground_tile]
+
+    distances, _ = search.bfs(len(grid.cells), [grid.pos(0, 0)], neighbors)
+    for pos, distance in enumerate(distances):
+        if distance != search.INFINITY:
+            new_grid.cells[pos] = flooded_tile
 
     return new_grid
 
@@ -216,36 +161,16 @@ def flood_grid(grid):
 def count_ground_tiles_in_expanded_grid(grid):
     # Count the number of ground tiles in the expanded grid. A single ground
     # tile in the original grid is represented by nine ground tiles in the
-    # expanded grid. Therefore, count all occurrences of a 3x3 '.' matrix.
-    ground_tile_count = 0
-
-    marked_grid = copy.deepcopy(grid)
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            expanded_ground_positions = [
-                (i, j),
-                (i, j + 1),
-                (i, j + 2),
-                (i + 1, j),
-                (i + 1, j + 1),
-                (i + 1, j + 2),
-                (i + 2, j),
-                (i + 2, j + 1),
-                (i + 2, j + 2),
-            ]
-            for x, y in expanded_ground_positions:
-                if (
-                    x >= len(marked_grid)
-                    or y >= len(marked_grid[i])
-                    or marked_grid[x][y] != "."
-                ):
-                    break
-            else:  # nobreak
-                ground_tile_count += 1
-                for x, y in expanded_ground_positions:
-                    marked_grid[x][y] = "x"
-
-    return ground_tile_count
+    # expanded grid. A tile that is not a part of the loop has '.' in its
+    # center and all of its nine tiles are either flooded or not, so it
+    # suffices to check the centers.
+    ground_tile = ord(".")
+    return sum(
+        1
+        for i in range(1, grid.height, 3)
+        for j in range(1, grid.width, 3)
+        if grid.cells[grid.pos(i, j)] == ground_tile
+    )
 
 
 def run_program(input):
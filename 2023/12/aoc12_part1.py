@@ -7,6 +7,8 @@ import functools
 import textwrap
 import unittest
 
+from aoc import counters
+
 
 @dataclasses.dataclass
 class SpringRecord:
@@ -54,7 +56,9 @@ def get_arrangement_count(spring_record):
             return 0
         return get_count(s[1:], d)
 
-    return get_count(spring_record.springs, spring_record.damaged)
+    count = get_count(spring_record.springs, spring_record.damaged)
+    counters.count_cache("arrangements", get_count)
+    return count
 
 
 def run_program(input):
@@ -5,6 +5,12 @@
 import textwrap
 import unittest
 
+from aoc import grids
+
+
+ROUNDED_ROCK = ord("O")
+EMPTY_SPACE = ord(".")
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -12,26 +18,36 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def tilt_platform_to_north(platform):
-    # Iteratively move stones until the platform stops changing.
-    platform_changed = True
-    while platform_changed:
-        platform_changed = False
-        for i in range(len(platform)):
-            for j in range(len(platform[i])):
-                if i - 1 >= 0 and platform[i][j] == "O" and platform[i - 1][j] == ".":
-                    platform[i][j] = "."
-                    platform[i - 1][j] = "O"
-                    platform_changed = True
+    tilt_platform(platform, platform.up)
+
+
+def tilt_platform(platform, direction):
+    # Move every stone as far as it goes in the given direction. Stones that
+    # are closer to the edge we tilt to move first, so every stone stops at the
+    # edge (the border around the grid), at a cube-shaped rock, or at an
+    # already moved stone, and a single pass suffices.
+    positions = platform.positions()
+    if direction > 0:
+        positions = reversed(list(positions))
+
+    cells = platform.cells
+    for pos in positions:
+        if cells[pos] == ROUNDED_ROCK:
+            new_pos = pos
+            while cells[new_pos + direction] == EMPTY_SPACE:
+                new_pos += direction
+            if new_pos != pos:
+                cells[pos] = EMPTY_SPACE
+                cells[new_pos] = ROUNDED_ROCK
 
 
 def get_total_load_for_platform(platform):
     return sum(
-        row.count("O") * load_per_rock
-        for row, load_per_rock in zip(platform, range(len(platform), 0, -1))
+        platform.height - platform.coords(pos)[0] for pos in platform.find_all("O")
     )
 
 
@@ -5,6 +5,12 @@
 import textwrap
 import unittest
 
+from aoc import grids
+
+
+ROUNDED_ROCK = ord("O")
+EMPTY_SPACE = ord(".")
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -12,7 +18,7 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def cycle_platform_n_times(platform, n):
@@ -20,7 +26,7 @@ def cycle_platform_n_times(platform, n):
     # which the platform configuration repeats itself, and then use this period
     # to dramatically reduce the number of cycles that we need to perform.
     def current_configuration():
-        return "".join("".join(row) for row in platform)
+        return bytes(platform.cells)
 
     i = 0
 
@@ -54,34 +60,35 @@ def cycle_platform_n_times(platform, n):
 
 
 def cycle_platform_once(platform):
-    def tilt_platform(move_stones_to):
-        # Iteratively move stones until the platform stops changing.
-        platform_changed = True
-        while platform_changed:
-            platform_changed = False
-            for i in range(len(platform)):
-                for j in range(len(platform[i])):
-                    x, y = move_stones_to(i, j)
-                    if (
-                        0 <= x < len(platform)
-                        and 0 <= y < len(platform[i])
-                        and platform[i][j] == "O"
-                        and platform[x][y] == "."
-                    ):
-                        platform[x][y] = "O"
-                        platform[i][j] = "."
-                        platform_changed = True
-
-    tilt_platform(move_stones_to=lambda i, j: (i - 1, j))  # North
-    tilt_platform(move_stones_to=lambda i, j: (i, j - 1))  # West
-    tilt_platform(move_stones_to=lambda i, j: (i + 1, j))  # South
-    tilt_platform(move_stones_to=lambda i, j: (i, j + 1))  # East
+    tilt_platform(platform, platform.up)  # North
+    tilt_platform(platform, platform.left)  # West
+    tilt_platform(platform, platform.down)  # South
+    tilt_platform(platform, platform.right)  # East
+
+
+def tilt_platform(platform, direction):
+    # Move every stone as far as it goes in the given direction. Stones that
+    # are closer to the edge we tilt to move first, so every stone stops at the
+    # edge (the border around the grid), at a cube-shaped rock, or at an
+    # already moved stone, and a single pass suffices.
+    positions = platform.positions()
+    if direction > 0:
+        positions = reversed(list(positions))
+
+    cells = platform.cells
+    for pos in positions:
+        if cells[pos] == ROUNDED_ROCK:
+            new_pos = pos
+            while cells[new_pos + direction] == EMPTY_SPACE:
+                new_pos += direction
+            if new_pos != pos:
+                cells[pos] = EMPTY_SPACE
+                cells[new_pos] = ROUNDED_ROCK
 
 
 def get_total_load_for_platform(platform):
     return sum(
-        row.count("O") * load_per_rock
-        for row, load_per_rock in zip(platform, range(len(platform), 0, -1))
+        platform.height - platform.coords(pos)[0] for pos in platform.find_all("O")
     )
 
 
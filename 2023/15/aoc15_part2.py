@@ -6,14 +6,15 @@ import re
 import textwrap
 import unittest
 
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return input.strip("\n").split(",")
+    return inputs.iter_tokens(input)
 
 
 def do_hashmap_procedure(initialization_sequence):
@@ -72,7 +73,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
@@ -6,13 +6,28 @@ import dataclasses
 import textwrap
 import unittest
 
+from aoc import counters
+from aoc import grids
+
+
+# Directions of beams are indexes into the grid's directions.
+UP, RIGHT, DOWN, LEFT = range(4)
+
+# For each tile and the direction of an incoming beam, the directions of the
+# outgoing beams.
+NEXT_DIRECTIONS = {
+    ord("."): [[UP], [RIGHT], [DOWN], [LEFT]],
+    ord("\\"): [[LEFT], [DOWN], [RIGHT], [UP]],
+    ord("/"): [[RIGHT], [UP], [LEFT], [DOWN]],
+    ord("|"): [[UP], [UP, DOWN], [DOWN], [UP, DOWN]],
+    ord("-"): [[LEFT, RIGHT], [RIGHT], [LEFT, RIGHT], [LEFT]],
+}
+
 
 @dataclasses.dataclass(frozen=True)
 class Beam:
-    x: int
-    y: int
-    dx: int
-    dy: int
+    pos: int
+    direction: int
 
 
 def read_input():
@@ -21,7 +36,7 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def count_max_energized_tiles(contraption):
@@ -32,90 +47,52 @@ def count_max_energized_tiles(contraption):
 
 
 def gen_possible_start_beams(contraption):
-    row_count = len(contraption)
-    col_count = len(contraption[0])
+    row_count = contraption.height
+    col_count = contraption.width
 
     # Top edge:
     for y in range(col_count):
-        yield Beam(0, y, +1, 0)
+        yield Beam(contraption.pos(0, y), DOWN)
 
     # Bottom edge:
     for y in range(col_count):
-        yield Beam(row_count - 1, y, -1, 0)
+        yield Beam(contraption.pos(row_count - 1, y), UP)
 
     # Left edge:
     for x in range(row_count):
-        yield Beam(x, 0, 0, +1)
+        yield Beam(contraption.pos(x, 0), RIGHT)
 
     # Right edge:
     for x in range(row_count):
-        yield Beam(x, col_count - 1, 0, -1)
+        yield Beam(contraption.pos(x, col_count - 1), LEFT)
 
 
 def count_energized_tiles_from_start_beam(contraption, start_beam):
-    def is_in_bounds(beam):
-        return 0 <= beam.x < len(contraption) and 0 <= beam.y < len(contraption[beam.x])
-
     # We keep iterating until we cover all the possible paths in the
-    # contraption. Then, the we get the number of energized tiles from the set
-    # of beams that we have visited.
-    visited_beams = set()
-    beams = [start_beam]
+    # contraption. For each position, we remember the directions of the beams
+    # that have passed through it (as a bit mask), so the energized tiles are
+    # those with a non-zero mask. Beams that leave the contraption reach its
+    # border, where they stop.
+    cells = contraption.cells
+    offsets = contraption.directions
+    visited = bytearray(len(cells))
+    energized_tile_count = 0
+    beams = [(start_beam.pos, start_beam.direction)]
+    cells_touched = 0
     while beams:
-        beam = beams.pop()
-        if beam not in visited_beams and is_in_bounds(beam):
-            visited_beams.add(beam)
-            beams.extend(get_next_beams(beam, contraption))
-
-    return len({(beam.x, beam.y) for beam in visited_beams})
-
-
-def get_next_beams(beam, contraption):
-    match contraption[beam.x][beam.y]:
-        case ".":
-            return [
-                Beam(
-                    beam.x + beam.dx,
-                    beam.y + beam.dy,
-                    beam.dx,
-                    beam.dy,
-                )
-            ]
-        case "\\":
-            if beam.dx == 0 and beam.dy == +1:
-                return [Beam(beam.x + 1, beam.y, +1, 0)]
-            elif beam.dx == 0 and beam.dy == -1:
-                return [Beam(beam.x - 1, beam.y, -1, 0)]
-            elif beam.dx == -1 and beam.dy == 0:
-                return [Beam(beam.x, beam.y - 1, 0, -1)]
-            elif beam.dx == +1 and beam.dy == 0:
-                return [Beam(beam.x, beam.y + 1, 0, +1)]
-        case "/":
-            if beam.dx == 0 and beam.dy == +1:
-                return [Beam(beam.x - 1, beam.y, -1, 0)]
-            elif beam.dx == 0 and beam.dy == -1:
-                return [Beam(beam.x + 1, beam.y, +1, 0)]
-            elif beam.dx == -1 and beam.dy == 0:
-                return [Beam(beam.x, beam.y + 1, 0, +1)]
-            elif beam.dx == +1 and beam.dy == 0:
-                return [Beam(beam.x, beam.y - 1, 0, -1)]
-        case "|":
-            if beam.dy == 0:
-                return [Beam(beam.x + beam.dx, beam.y, beam.dx, 0)]
-            else:
-                return [
-                    Beam(beam.x - 1, beam.y, -1, 0),
-                    Beam(beam.x + 1, beam.y, +1, 0),
-                ]
-        case "-":
-            if beam.dx == 0:
-                return [Beam(beam.x, beam.y + beam.dy, 0, beam.dy)]
-            else:
-                return [
-                    Beam(beam.x, beam.y - 1, 0, -1),
-                    Beam(beam.x, beam.y + 1, 0, +1),
-                ]
-    raise AssertionError("unhandled move in get_next_beams()")
+        pos, direction = beams.pop()
+        cells_touched += 1
+        mask = 1 << direction
+        if visited[pos] & mask or cells[pos] == grids.OUTSIDE:
+            continue
+        if not visited[pos]:
+            energized_tile_count += 1
+        visited[pos] |= mask
+        for next_direction in NEXT_DIRECTIONS[cells[pos]][direction]:
+            beams.append((pos + offsets[next_direction], next_direction))
+
+    counters.count("grid cells touched", cells_touched)
+    return energized_tile_count
 
 
 def run_program(input):
@@ -2,10 +2,12 @@
 # Advent of Code 2023, day 17, part 1
 #
 
-import heapq
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,46 +15,56 @@ def read_input():
 
 
 def parse_input(input):
-    return [[int(c) for c in line] for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def get_min_heat_loss_when_navigating_crucible(map):
-    AVAILABLE_DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-    DESTINATION = (len(map) - 1, len(map[0]) - 1)
+    MIN_STEPS = 0
     MAX_STEPS = 3
-
-    # A priority queue, where the priority is defined by the heat loss (the
-    # lower the better).
-    # Format: (heat_loss, i, j, ix, jx, steps)
-    q = [(0, 0, 0, 0, 0, 0)]
-
-    # We need to maintain a set of visited configurations so we do not visit
-    # the same configuration twice (disregarding the heat loss).
-    visited = set()
-
-    def check(heat_loss, i, j, ix, jx, steps):
-        if 0 <= i < len(map) and 0 <= j < len(map[i]):
-            heapq.heappush(q, (heat_loss + map[i][j], i, j, ix, jx, steps))
-
-    while q:
-        heat_loss, i, j, ix, jx, steps = heapq.heappop(q)
-
-        if (i, j) == DESTINATION:
-            return heat_loss
-
-        c = (i, j, ix, jx, steps)
-        if c in visited:
-            continue
-        visited.add(c)
-
-        # Try stepping while preserving the direction.
-        if steps < MAX_STEPS and (ix, jx) != (0, 0):
-            check(heat_loss, i + ix, j + jx, ix, jx, steps + 1)
-
-        # Try stepping while changing the direction.
-        for new_ix, new_jx in AVAILABLE_DIRECTIONS:
-            if (new_ix, new_jx) != (ix, jx) and (new_ix, new_jx) != (-ix, -jx):
-                check(heat_loss, i + new_ix, j + new_jx, new_ix, new_jx, steps=1)
+    START = map.pos(0, 0)
+    DESTINATION = map.pos(map.height - 1, map.width - 1)
+    # Directions are indexed in clockwise order, so turning left or right is
+    # (d + 3) % 4 or (d + 1) % 4.
+    RIGHT, DOWN = 1, 2
+    cells = map.cells
+    directions = map.directions
+
+    # A configuration (position, direction, number of steps made in the
+    # direction) is encoded into a single integer state.
+    def state(pos, d, steps):
+        return (pos * 4 + d) * (MAX_STEPS + 1) + steps
+
+    def neighbors(s):
+        pos_and_d, steps = divmod(s, MAX_STEPS + 1)
+        pos, d = divmod(pos_and_d, 4)
+        if steps < MAX_STEPS:
+            yield from step(pos, d, steps + 1)
+        if steps >= MIN_STEPS:
+            yield from step(pos, (d + 1) % 4, 1)
+            yield from step(pos, (d + 3) % 4, 1)
+
+    def step(pos, d, steps):
+        new_pos = pos + directions[d]
+        if cells[new_pos] != grids.OUTSIDE:
+            yield state(new_pos, d, steps), cells[new_pos] - ord("0")
+
+    def is_destination(s):
+        steps = s % (MAX_STEPS + 1)
+        return s // (4 * (MAX_STEPS + 1)) == DESTINATION and steps >= MIN_STEPS
+
+    # Heat losses are digits, so a bucket queue (Dial's algorithm) can be
+    # used instead of a binary heap. The crucible can start by going either
+    # right or down.
+    heat_losses, destination = search.dial(
+        len(cells) * 4 * (MAX_STEPS + 1),
+        [state(START, RIGHT, 0), state(START, DOWN, 0)],
+        neighbors,
+        max_weight=9,
+        is_target=is_destination,
+    )
+    if destination is None:
+        raise AssertionError("the destination is not reachable")
+    return heat_losses[destination]
 
 
 def run_program(input):
@@ -88,3 +100,9 @@ class Tests(unittest.TestCase):
         result = run_program(input)
 
         self.assertEqual(result, 102)
+
+    def test_program_raises_error_when_there_is_no_valid_path(self):
+        for input in ["11111", "1\n1\n1\n1\n1"]:
+            with self.subTest(input=input):
+                with self.assertRaises(AssertionError):
+                    run_program(input)
@@ -5,8 +5,10 @@
 import textwrap
 import unittest
 
+from aoc import grids
 
-DIRECTIONS = [(0, 1), (1, 0), (-1, 0), (0, -1)]
+
+ROCK = ord("#")
 
 
 def read_input():
@@ -15,33 +17,24 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def count_garden_plots_after_steps(map, steps):
-    positions = {get_start_position(map)}
+    positions = {map.find("S")}
 
     for _ in range(steps):
         new_positions = set()
-        for i, j in positions:
-            for ix, jx in DIRECTIONS:
-                ni, nj = i + ix, j + jx
-                if 0 <= ni < len(map) and 0 <= nj < len(map[ni]) and map[ni][nj] != "#":
-                    new_positions.add((ni, nj))
+        for pos in positions:
+            for d in map.directions:
+                tile = map.cells[pos + d]
+                if tile != ROCK and tile != grids.OUTSIDE:
+                    new_positions.add(pos + d)
         positions = new_positions
 
     return len(positions)
 
 
-def get_start_position(map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == "S":
-                return i, j
-
-    raise AssertionError("no start position found")
-
-
 def run_program(input, steps):
     map = parse_input(input)
     return count_garden_plots_after_steps(map, steps)
@@ -6,6 +6,12 @@ import collections
 import textwrap
 import unittest
 
+from aoc import counters
+from aoc import grids
+
+
+FOREST = ord("#")
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,7 +19,7 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def get_longest_hike_length(map):
@@ -26,60 +32,69 @@ def get_longest_hike_length(map):
     # 2) Second, we use the graph to find the longest hike by checking all the
     #    hikes in it.
 
-    # The end is always in the last row and second-to-last column.
-    END = len(map) - 1, len(map[-1]) - 2
+    # The start is always in the first row and second column, the end is
+    # always in the last row and second-to-last column.
+    start = map.pos(0, 1)
+    end = map.pos(map.height - 1, map.width - 2)
 
-    # Graph format: (i, j): {(neighbor i, neighbor j, distance), ...}
+    # Graph format: pos: {(neighbor pos, distance), ...}
     graph = collections.defaultdict(set)
 
     # Step 1): Use depth-first search to construct the graph.
-    # Stack format: (i, j, from_i, from_j, orig_i, orig_j, distance)
-    s = [(1, 1, 0, 1, 0, 1, 1)]
+    # Stack format: (pos, from pos, orig pos, distance)
+    s = [(start + map.down, start, start, 1)]
     visited = set()
     while s:
-        i, j, from_i, from_j, orig_i, orig_j, distance = s.pop()
+        pos, from_pos, orig_pos, distance = s.pop()
 
-        if (i, j) in visited or (i, j) == END:
-            graph[(orig_i, orig_j)].add((i, j, distance))
+        if pos in visited or pos == end:
+            graph[orig_pos].add((pos, distance))
             continue
 
         neighbors = []
-        for ni, nj in [(i, j + 1), (i + 1, j), (i - 1, j), (i, j - 1)]:
+        for neighbor in [pos + map.right, pos + map.down, pos + map.up, pos + map.left]:
             if (
-                (ni, nj) != (from_i, from_j)
-                and 0 <= ni < len(map)
-                and 0 <= nj < len(map[i])
-                and map[ni][nj] != "#"
+                neighbor != from_pos
+                and map.cells[neighbor] != FOREST
+                and map.cells[neighbor] != grids.OUTSIDE
             ):
-                neighbors.append((ni, nj))
+                neighbors.append(neighbor)
         if len(neighbors) == 1:
             # A "long hall".
-            s.append((*neighbors[0], i, j, orig_i, orig_j, distance + 1))
+            s.append((neighbors[0], pos, orig_pos, distance + 1))
         elif len(neighbors) > 1:
             # Multiple neighbors (i.e. a "hub" node).
-            visited.add((i, j))
-            graph[(orig_i, orig_j)].add((i, j, distance))
-            graph[(i, j)].add((orig_i, orig_j, distance))
-            for ni, nj in neighbors:
-                s.append((ni, nj, i, j, i, j, 1))
-
-    # Step 2): Check all possible hikes to find the longest one.
+            visited.add(pos)
+            graph[orig_pos].add((pos, distance))
+            graph[pos].add((orig_pos, distance))
+            for neighbor in neighbors:
+                s.append((neighbor, pos, pos, 1))
+
+    # Step 2): Check all possible hikes to find the longest one. The nodes
+    # visited by a hike are stored as a bit mask.
+    node_bits = {}
+    for node, neighbors in graph.items():
+        for neighbor, _ in neighbors:
+            node_bits.setdefault(neighbor, 1 << len(node_bits))
+        node_bits.setdefault(node, 1 << len(node_bits))
     hike_lengths = set()
 
-    # Format: (i, j, steps, visited nodes)
-    hikes_to_check = [(0, 1, 0, set())]
+    # Format: (pos, steps, visited nodes)
+    hikes_to_check = [(start, 0, 0)]
+    states_visited = 0
     while hikes_to_check:
-        i, j, steps, visited = hikes_to_check.pop()
-        for new_i, new_j, distance in graph[(i, j)]:
-            if (new_i, new_j) == END:
+        pos, steps, visited = hikes_to_check.pop()
+        states_visited += 1
+        for new_pos, distance in graph[pos]:
+            if new_pos == end:
                 hike_lengths.add(steps + distance)
                 continue
 
-            if (new_i, new_j) not in visited:
-                hikes_to_check.append(
-                    (new_i, new_j, steps + distance, visited | {(new_i, new_j)})
-                )
+            new_bit = node_bits[new_pos]
+            if not visited & new_bit:
+                hikes_to_check.append((new_pos, steps + distance, visited | new_bit))
 
+    counters.count("hike states visited", states_visited)
     return max(hike_lengths)
 
 
@@ -10,7 +10,12 @@
 import textwrap
 import unittest
 
-import networkx
+from aoc import lazy
+
+
+# Importing networkx takes hundreds of milliseconds, so import it only when
+# it is really used (not e.g. when only collecting tests).
+networkx = lazy.lazy_import("networkx")
 
 
 def read_input():
@@ -2,22 +2,19 @@
 # Advent of Code 2024, day 01, part 2
 #
 
-import re
 import textwrap
 import unittest
 
+from aoc import columns
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    lists = [[], []]
-    for line in input.strip().split("\n"):
-        for i, n in enumerate(re.split(r" +", line)):
-            lists[i].append(int(n))
-    return lists
+    return columns.parse_columns(input, 2)
 
 
 def find_similarity_scores_between_lists(lists):
@@ -31,7 +28,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
@@ -5,14 +5,17 @@
 import textwrap
 import unittest
 
+from aoc import columns
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [[int(n) for n in line.split(" ")] for line in input.strip().split("\n")]
+    # Every report is an array of levels.
+    return columns.iter_rows(*columns.parse_rows(input))
 
 
 def is_report_safe(report):
@@ -33,7 +36,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
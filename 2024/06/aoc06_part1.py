@@ -5,6 +5,12 @@
 import textwrap
 import unittest
 
+from aoc import grids
+
+
+OBSTRUCTION = ord("#")
+VISITED = ord("X")
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -12,44 +18,29 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip("\n").split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def patrol_guard_until_she_leaves_map(map):
-    def find_guard():
-        for i, row in enumerate(map):
-            for j, pos in enumerate(row):
-                if pos == "^":
-                    return i, j, -1, 0
-        raise AssertionError("no guard found in map")
-
-    def is_guard_inside_map(i, j):
-        return 0 <= i < len(map) and 0 <= j < len(map[i])
-
-    def move_guard(i, j, dir_i, dir_j):
-        map[i][j] = "X"
-        while (
-            is_guard_inside_map(i + dir_i, j + dir_j)
-            and map[i + dir_i][j + dir_j] == "#"
-        ):
-            if (dir_i, dir_j) == (-1, 0):
-                dir_i, dir_j = 0, 1
-            elif (dir_i, dir_j) == (0, 1):
-                dir_i, dir_j = 1, 0
-            elif (dir_i, dir_j) == (1, 0):
-                dir_i, dir_j = 0, -1
-            else:
-                dir_i, dir_j = -1, 0
-        next_i, next_j = i + dir_i, j + dir_j
-        return next_i, next_j, dir_i, dir_j
-
-    i, j, dir_i, dir_j = find_guard()
-    while is_guard_inside_map(i, j):
-        i, j, dir_i, dir_j = move_guard(i, j, dir_i, dir_j)
+    # Directions are indexes into map.directions, which are in clockwise
+    # order, so turning right means going to the next direction.
+    cells = map.cells
+    offsets = map.directions
+
+    def move_guard(pos, direction):
+        cells[pos] = VISITED
+        while cells[pos + offsets[direction]] == OBSTRUCTION:
+            direction = (direction + 1) % len(offsets)
+        return pos + offsets[direction], direction
+
+    # The guard starts facing up.
+    pos, direction = map.find("^"), 0
+    while cells[pos] != grids.OUTSIDE:
+        pos, direction = move_guard(pos, direction)
 
 
 def count_positions_visited_by_guard(map):
-    return sum(row.count("X") for row in map)
+    return map.count("X")
 
 
 def run_program(input):
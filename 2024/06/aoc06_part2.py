@@ -2,10 +2,15 @@
 # Advent of Code 2024, day 06, part 2
 #
 
-import copy
 import textwrap
 import unittest
 
+from aoc import grids
+
+
+OBSTRUCTION = ord("#")
+VISITED = ord("X")
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -13,70 +18,58 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip("\n").split("\n")]
+    return grids.Grid.from_text(input)
 
 
 def find_guard(map):
-    for i, row in enumerate(map):
-        for j, pos in enumerate(row):
-            if pos == "^":
-                return i, j, -1, 0
-    raise AssertionError("no guard found in map")
-
-
-def move_guard_until_exit_or_loop(map, i, j, dir_i, dir_j):
-    def is_guard_inside_map(i, j):
-        return 0 <= i < len(map) and 0 <= j < len(map[i])
-
-    def move_guard(i, j, dir_i, dir_j):
-        map[i][j] = "X"
-        while (
-            is_guard_inside_map(i + dir_i, j + dir_j)
-            and map[i + dir_i][j + dir_j] == "#"
-        ):
-            if (dir_i, dir_j) == (-1, 0):
-                dir_i, dir_j = 0, 1
-            elif (dir_i, dir_j) == (0, 1):
-                dir_i, dir_j = 1, 0
-            elif (dir_i, dir_j) == (1, 0):
-                dir_i, dir_j = 0, -1
-            else:
-                dir_i, dir_j = -1, 0
-        next_i, next_j = i + dir_i, j + dir_j
-        return next_i, next_j, dir_i, dir_j
-
-    visited_configs = set()
-    while is_guard_inside_map(i, j):
-        config = (i, j, dir_i, dir_j)
-        if config in visited_configs:
+    # Directions are indexes into map.directions, which are in clockwise
+    # order, so turning right means going to the next direction. The guard
+    # starts facing up.
+    return map.find("^"), 0
+
+
+def move_guard_until_exit_or_loop(map, pos, direction):
+    cells = map.cells
+    offsets = map.directions
+
+    # For each position, a bit mask of the directions in which the guard has
+    # already left it.
+    visited_configs = bytearray(len(cells))
+    while cells[pos] != grids.OUTSIDE:
+        direction_bit = 1 << direction
+        if visited_configs[pos] & direction_bit:
             return "loop"
-        visited_configs.add(config)
+        visited_configs[pos] |= direction_bit
 
-        i, j, dir_i, dir_j = move_guard(i, j, dir_i, dir_j)
+        cells[pos] = VISITED
+        while cells[pos + offsets[direction]] == OBSTRUCTION:
+            direction = (direction + 1) % len(offsets)
+        pos += offsets[direction]
 
     return "exit"
 
 
 def count_possible_obstruction_placements_for_loop(map):
-    i, j, dir_i, dir_j = find_guard(map)
+    pos, direction = find_guard(map)
 
     # Get a solution to part 1 (i.e. move the guard until she reaches an exit)
     # and use that to prune the space of possible obstacle placements as it
     # only makes sense to check positions reachable from the original
     # configuration.
-    move_guard_until_exit_or_loop(map, i, j, dir_i, dir_j)
+    move_guard_until_exit_or_loop(map, pos, direction)
 
     # Check all the viable positions to see at how many places we can put an
-    # obstacle to make the guard end in a loop.
+    # obstacle to make the guard end in a loop. Only obstructions matter when
+    # moving the guard, so we can place and remove the obstacle in the map
+    # itself instead of working with a copy.
     placement_count = 0
-    for m in range(len(map)):
-        for n in range(len(map[m])):
-            if (m, n) != (i, j) and map[m][n] == "X":
-                map_copy = copy.deepcopy(map)
-                map_copy[m][n] = "#"
-                result = move_guard_until_exit_or_loop(map_copy, i, j, dir_i, dir_j)
-                if result == "loop":
-                    placement_count += 1
+    for obstacle_pos in list(map.find_all("X")):
+        if obstacle_pos != pos:
+            map.cells[obstacle_pos] = OBSTRUCTION
+            result = move_guard_until_exit_or_loop(map, pos, direction)
+            if result == "loop":
+                placement_count += 1
+            map.cells[obstacle_pos] = VISITED
     return placement_count
 
 
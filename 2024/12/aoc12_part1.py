@@ -5,8 +5,7 @@
 import textwrap
 import unittest
 
-
-NEIGHBOR_DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+from aoc import grids
 
 
 def read_input():
@@ -15,62 +14,59 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
-def compute_region_perimeter(region):
+def compute_region_perimeter(region, garden):
+    # A side of a plot is a part of the perimeter when the neighboring plot
+    # has a different plant (or is outside of the garden).
     perimeter = 0
-    for i, j in region:
-        for ix, jx in NEIGHBOR_DIRECTIONS:
-            if (i + ix, j + jx) not in region:
+    for pos in region:
+        for d in garden.directions:
+            if garden.cells[pos + d] != garden.cells[pos]:
                 perimeter += 1
     return perimeter
 
 
-def compute_price_for_region(region):
+def compute_price_for_region(region, garden):
     region_area = len(region)
-    return region_area * compute_region_perimeter(region)
-
-
-def is_plot_inside_garden(i, j, garden):
-    return 0 <= i < len(garden) and 0 <= j < len(garden[i])
+    return region_area * compute_region_perimeter(region, garden)
 
 
-def get_region_for_plot(i, j, garden):
+def get_region_for_plot(pos, garden):
     # Use depth-first search to get all the regions for the given plot.
-    # Breadth-first search would work as well.
-    region = {(i, j)}
-    to_visit = [(i, j)]
+    # Breadth-first search would work as well. Plots outside of the garden
+    # never match the plant in the region, so there is no need to check
+    # bounds.
+    plant = garden.cells[pos]
+    region = {pos}
+    to_visit = [pos]
     while to_visit:
-        i, j = to_visit.pop()
-        for ix, jx in NEIGHBOR_DIRECTIONS:
-            new_i, new_j = i + ix, j + jx
-            if (
-                is_plot_inside_garden(new_i, new_j, garden)
-                and garden[i][j] == garden[new_i][new_j]
-                and (new_i, new_j) not in region
-            ):
-                region.add((new_i, new_j))
-                to_visit.append((new_i, new_j))
+        pos = to_visit.pop()
+        for d in garden.directions:
+            new_pos = pos + d
+            if garden.cells[new_pos] == plant and new_pos not in region:
+                region.add(new_pos)
+                to_visit.append(new_pos)
     return region
 
 
 def split_garden_into_regions(garden):
     regions = []
-    checked_plots = set()
-    for i in range(len(garden)):
-        for j in range(len(garden[i])):
-            if (i, j) not in checked_plots:
-                region = get_region_for_plot(i, j, garden)
-                regions.append(region)
-                checked_plots |= region
+    checked_plots = bytearray(len(garden.cells))
+    for pos in garden.positions():
+        if not checked_plots[pos]:
+            region = get_region_for_plot(pos, garden)
+            regions.append(region)
+            for plot in region:
+                checked_plots[plot] = 1
     return regions
 
 
 def run_program(input):
     garden = parse_input(input)
     regions = split_garden_into_regions(garden)
-    return sum(map(compute_price_for_region, regions))
+    return sum(compute_price_for_region(region, garden) for region in regions)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,7 @@
 import textwrap
 import unittest
 
-
-NEIGHBOR_DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+from aoc import grids
 
 
 def read_input():
@@ -15,30 +14,30 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
 
 
-def compute_side_count_in_region(region):
+def compute_side_count_in_region(region, garden):
     # Instead of computing the number of sides directly, we compute the number
     # of corners in the region, which is the same as the number of sides.
     #
     # In the diagram below, `#` denotes the current plot, `N` denotes a
     # neighbor, and `C` denotes a corner.
     corner_count = 0
-    for i, j in region:
+    for pos in region:
         # Introduce a few abbreviations for the presence of neighbors to make
         # the code clearer.
         #
         # T = top, R = right, B = bottom, L = left
-        T = (i - 1, j) in region
-        R = (i, j + 1) in region
-        B = (i + 1, j) in region
-        L = (i, j - 1) in region
+        T = pos + garden.up in region
+        R = pos + garden.right in region
+        B = pos + garden.down in region
+        L = pos + garden.left in region
         # TR = top right, BR = bottom right, BL = bottom left, TL = top left
-        TR = (i - 1, j + 1) in region
-        BR = (i + 1, j + 1) in region
-        BL = (i + 1, j - 1) in region
-        TL = (i - 1, j - 1) in region
+        TR = pos + garden.up + garden.right in region
+        BR = pos + garden.down + garden.right in region
+        BL = pos + garden.down + garden.left in region
+        TL = pos + garden.up + garden.left in region
 
         # No neighbors -> 4 corners:
         #
@@ -96,50 +95,45 @@ def compute_side_count_in_region(region):
     return corner_count
 
 
-def compute_price_for_region(region):
+def compute_price_for_region(region, garden):
     region_area = len(region)
-    return region_area * compute_side_count_in_region(region)
-
-
-def is_plot_inside_garden(i, j, garden):
-    return 0 <= i < len(garden) and 0 <= j < len(garden[i])
+    return region_area * compute_side_count_in_region(region, garden)
 
 
-def get_region_for_plot(i, j, garden):
+def get_region_for_plot(pos, garden):
     # Use depth-first search to get all the regions for the given plot.
-    # Breadth-first search would work as well.
-    region = {(i, j)}
-    to_visit = [(i, j)]
+    # Breadth-first search would work as well. Plots outside of the garden
+    # never match the plant in the region, so there is no need to check
+    # bounds.
+    plant = garden.cells[pos]
+    region = {pos}
+    to_visit = [pos]
     while to_visit:
-        i, j = to_visit.pop()
-        for ix, jx in NEIGHBOR_DIRECTIONS:
-            new_i, new_j = i + ix, j + jx
-            if (
-                is_plot_inside_garden(new_i, new_j, garden)
-                and garden[i][j] == garden[new_i][new_j]
-                and (new_i, new_j) not in region
-            ):
-                region.add((new_i, new_j))
-                to_visit.append((new_i, new_j))
+        pos = to_visit.pop()
+        for d in garden.directions:
+            new_pos = pos + d
+            if garden.cells[new_pos] == plant and new_pos not in region:
+                region.add(new_pos)
+                to_visit.append(new_pos)
     return region
 
 
 def split_garden_into_regions(garden):
     regions = []
-    checked_plots = set()
-    for i in range(len(garden)):
-        for j in range(len(garden[i])):
-            if (i, j) not in checked_plots:
-                region = get_region_for_plot(i, j, garden)
-                regions.append(region)
-                checked_plots |= region
+    checked_plots = bytearray(len(garden.cells))
+    for pos in garden.positions():
+        if not checked_plots[pos]:
+            region = get_region_for_plot(pos, garden)
+            regions.append(region)
+            for plot in region:
+                checked_plots[plot] = 1
     return regions
 
 
 def run_program(input):
     garden = parse_input(input)
     regions = split_garden_into_regions(garden)
-    return sum(map(compute_price_for_region, regions))
+    return sum(compute_price_for_region(region, garden) for region in regions)
 
 
 if __name__ == "__main__":
@@ -5,13 +5,11 @@
 import textwrap
 import unittest
 
+from aoc import grids
 
-DIRECTIONS_FOR_MOVE = {
-    ">": (0, 1),
-    "<": (0, -1),
-    "v": (1, 0),
-    "^": (-1, 0),
-}
+
+WALL = ord("#")
+EMPTY = ord(".")
 
 
 def read_input():
@@ -21,59 +19,58 @@ def read_input():
 
 def parse_input(input):
     raw_map, raw_movements = input.strip().split("\n\n")
-    map = [list(line) for line in raw_map.split("\n")]
+    map = grids.Grid.from_text(raw_map)
     movements = raw_movements.replace("\n", "")
     return map, movements
 
 
-def find_robot(map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == "@":
-                return i, j
-    raise AssertionError("robot not found")
+def get_offsets_for_moves(map):
+    return {
+        ">": map.right,
+        "<": map.left,
+        "v": map.down,
+        "^": map.up,
+    }
 
 
 def move_robot_in_map_according_to_movements(map, movements):
-    def swap(i, j, k, l):
-        map[i][j], map[k][l] = map[k][l], map[i][j]
+    cells = map.cells
+    box = ord("O")
 
-    def move_robot(ri, rj, move):
-        di, dj = DIRECTIONS_FOR_MOVE[move]
+    def swap(pos1, pos2):
+        cells[pos1], cells[pos2] = cells[pos2], cells[pos1]
 
-        if map[ri + di][rj + dj] == ".":
+    def move_robot(robot, d):
+        if cells[robot + d] == EMPTY:
             # Move the robot one step.
-            swap(ri, rj, ri + di, rj + dj)
-            return ri + di, rj + dj
+            swap(robot, robot + d)
+            return robot + d
 
-        if map[ri + di][rj + dj] == "O":
+        if cells[robot + d] == box:
             # Check if we can move all the boxes one step.
-            xi = ri + di
-            xj = rj + dj
-            while map[xi][xj] == "O":
-                xi += di
-                xj += dj
-            if map[xi][xj] == ".":
+            pos = robot + d
+            while cells[pos] == box:
+                pos += d
+            if cells[pos] == EMPTY:
                 # Move all the boxes and the robot one step.
-                while (xi, xj) != (ri, rj):
-                    swap(xi, xj, xi - di, xj - dj)
-                    xi -= di
-                    xj -= dj
-                return ri + di, rj + dj
+                while pos != robot:
+                    swap(pos, pos - d)
+                    pos -= d
+                return robot + d
 
-        return ri, rj
+        return robot
 
-    ri, rj = find_robot(map)
+    offset_for_move = get_offsets_for_moves(map)
+    robot = map.find("@")
     for move in movements:
-        ri, rj = move_robot(ri, rj, move)
+        robot = move_robot(robot, offset_for_move[move])
 
 
 def get_gps_coords_of_all_boxes(map):
     coords = []
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == "O":
-                coords.append(100 * i + j)
+    for pos in map.find_all("O"):
+        i, j = map.coords(pos)
+        coords.append(100 * i + j)
     return coords
 
 
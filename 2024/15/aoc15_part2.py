@@ -2,17 +2,14 @@
 # Advent of Code 2024, day 15, part 2
 #
 
-import copy
 import textwrap
 import unittest
 
+from aoc import grids
 
-DIRECTIONS_FOR_MOVE = {
-    ">": (0, 1),
-    "<": (0, -1),
-    "v": (1, 0),
-    "^": (-1, 0),
-}
+
+WALL = ord("#")
+EMPTY = ord(".")
 
 
 def read_input():
@@ -22,112 +19,99 @@ def read_input():
 
 def parse_input(input):
     raw_map, raw_movements = input.strip().split("\n\n")
-    map = [list(line) for line in raw_map.split("\n")]
+    map = grids.Grid.from_text(raw_map)
     movements = raw_movements.replace("\n", "")
     return map, movements
 
 
 def scale_map(map):
-    new_map = []
-    for row in map:
-        new_row = []
-        for c in row:
-            if c == "#":
-                new_row.extend(["#", "#"])
-            elif c == "O":
-                new_row.extend(["[", "]"])
-            elif c == ".":
-                new_row.extend([".", "."])
-            elif c == "@":
-                new_row.extend(["@", "."])
-        new_map.append(new_row)
-    return new_map
-
-
-def find_robot(map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == "@":
-                return i, j
-    raise AssertionError("robot not found")
+    scaled_tiles = {
+        "#": "##",
+        "O": "[]",
+        ".": "..",
+        "@": "@.",
+    }
+    return grids.Grid.from_lines(
+        ["".join(scaled_tiles[c] for c in row) for row in map.rows()]
+    )
+
+
+def get_offsets_for_moves(map):
+    return {
+        ">": map.right,
+        "<": map.left,
+        "v": map.down,
+        "^": map.up,
+    }
 
 
 def move_robot_in_map_according_to_movements(map, movements):
-    def is_empty(i, j):
-        return map[i][j] == "."
-
-    def is_box(i, j):
-        return map[i][j] in ("[", "]")
-
-    def box_left_coords(i, j):
-        return (i, j) if map[i][j] == "[" else (i, j - 1)
+    cells = map.cells
+    box_left = ord("[")
+    box_right = ord("]")
 
-    def box_both_coords(i, j):
-        return (i, j, i, j + 1) if map[i][j] == "[" else (i, j - 1, i, j)
+    def is_box(pos):
+        return cells[pos] == box_left or cells[pos] == box_right
 
-    def swap(i, j, k, l):
-        map[i][j], map[k][l] = map[k][l], map[i][j]
+    def box_left_pos(pos):
+        return pos if cells[pos] == box_left else pos - 1
 
-    def move_robot(ri, rj, move):
-        di, dj = DIRECTIONS_FOR_MOVE[move]
+    def swap(pos1, pos2):
+        cells[pos1], cells[pos2] = cells[pos2], cells[pos1]
 
-        if is_empty(ri + di, rj + dj):
+    def move_robot(robot, d):
+        if cells[robot + d] == EMPTY:
             # Move the robot one step.
-            swap(ri, rj, ri + di, rj + dj)
-            return ri + di, rj + dj
-
-        if is_box(ri + di, rj + dj):
-            # Get coordinates of all the boxes in the path via a fixed-point
-            # calculation (keep iterating until the set of coordinates is
-            # unchanged).
-            boxes = {box_left_coords(ri + di, rj + dj)}
-            old_boxes = set()
-            while boxes != old_boxes:
-                old_boxes = copy.copy(boxes)
-                for bi, bj in old_boxes:
-                    b1i, b1j, b2i, b2j = box_both_coords(bi, bj)
-                    if is_box(b1i + di, b1j + dj):
-                        boxes.add(box_left_coords(b1i + di, b1j + dj))
-                    if is_box(b2i + di, b2j + dj):
-                        boxes.add(box_left_coords(b2i + di, b2j + dj))
+            swap(robot, robot + d)
+            return robot + d
+
+        if is_box(robot + d):
+            # Get positions of all the boxes in the path (their left parts) by
+            # going through the boxes pushed by the already found boxes.
+            boxes = {box_left_pos(robot + d)}
+            to_check = list(boxes)
+            while to_check:
+                box = to_check.pop()
+                for pos in (box + d, box + 1 + d):
+                    if is_box(pos) and box_left_pos(pos) not in boxes:
+                        boxes.add(box_left_pos(pos))
+                        to_check.append(box_left_pos(pos))
 
             # Check if all the boxes are movable; quit if not.
-            for bi, bj in boxes:
-                b1i, b1j, b2i, b2j = box_both_coords(bi, bj)
-                if map[b1i + di][b1j + dj] == "#" or map[b2i + di][b2j + dj] == "#":
-                    return ri, rj
+            for box in boxes:
+                if cells[box + d] == WALL or cells[box + 1 + d] == WALL:
+                    return robot
 
             # Move the boxes by swapping them with their neighboring positions.
             # For this to work, we must to start with the outermost boxes and
             # continue towards the most innermost boxes (from the perspective
-            # of the robot). Therefore, we need to order the boxes.
-            key = lambda x: (-1 if sum([di, dj]) == 1 else 1) * x[abs(dj)]
-            for bi, bj in sorted(boxes, key=key):
-                b1i, b1j, b2i, b2j = box_both_coords(bi, bj)
-                if (di, dj) == (0, 1):
-                    swap(b2i, b2j, b2i + di, b2j + dj)
-                    swap(b1i, b1j, b1i + di, b1j + dj)
+            # of the robot). Since positions grow to the right and down, this
+            # means ordering the boxes by their positions.
+            for box in sorted(boxes, reverse=d > 0):
+                if d == map.right:
+                    swap(box + 1, box + 1 + d)
+                    swap(box, box + d)
                 else:
-                    swap(b1i, b1j, b1i + di, b1j + dj)
-                    swap(b2i, b2j, b2i + di, b2j + dj)
+                    swap(box, box + d)
+                    swap(box + 1, box + 1 + d)
 
             # Finally, move the robot.
-            swap(ri, rj, ri + di, rj + dj)
-            return ri + di, rj + dj
+            swap(robot, robot + d)
+            return robot + d
 
-        return ri, rj
+        return robot
 
-    ri, rj = find_robot(map)
+    offset_for_move = get_offsets_for_moves(map)
+    robot = map.find("@")
     for move in movements:
-        ri, rj = move_robot(ri, rj, move)
+        robot = move_robot(robot, offset_for_move[move])
 
 
 def get_gps_coords_of_all_boxes(map):
     coords = []
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            if map[i][j] == "[":
-                coords.append(100 * i + j)
+    for pos in map.find_all("["):
+        i, j = map.coords(pos)
+        coords.append(100 * i + j)
     return coords
 
 
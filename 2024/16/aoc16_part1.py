@@ -2,23 +2,21 @@
 # Advent of Code 2024, day 16, part 1
 #
 
-import heapq
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
+
 
 SCORE_INCREASE_STEP = 1
 SCORE_INCREASE_TURN = 1000
 TILE_START = "S"
 TILE_END = "E"
-TILE_WALL = "#"
-FACES = ["N", "E", "S", "W"]
-DIRECTIONS = {
-    "N": (-1, 0),
-    "E": (0, 1),
-    "S": (1, 0),
-    "W": (0, -1),
-}
+TILE_WALL = ord("#")
+# Faces are indexes into the map's directions (north, east, south, west).
+FACES = range(4)
+FACE_EAST = 1
 
 
 def read_input():
@@ -27,67 +25,54 @@ def read_input():
 
 
 def parse_input(input):
-    return [list(line) for line in input.strip().split("\n")]
+    return grids.Grid.from_text(input)
+
+
+def is_open_tile(map, pos):
+    return map.cells[pos] != TILE_WALL and map.cells[pos] != grids.OUTSIDE
+
 
+def count_turns_between_faces(face1, face2):
+    turns = (face2 - face1) % len(FACES)
+    return min(turns, len(FACES) - turns)
 
-def all_tiles(map):
-    for i in range(len(map)):
-        for j in range(len(map[i])):
-            yield i, j
 
+def state_index(pos, face):
+    # Scores of states (position + face) are stored in a flat list.
+    return pos * len(FACES) + face
 
-def find_tile(map, tile):
-    for i, j in all_tiles(map):
-        if map[i][j] == tile:
-            return i, j
-    raise AssertionError(f"tile {tile} not found")
 
+def get_neighbors(map):
+    # Returns a function yielding (state, score increase) pairs of states
+    # reachable from the given state in a single step.
+    def neighbors(state):
+        pos, face = divmod(state, len(FACES))
+        for new_face, d in enumerate(map.directions):
+            new_pos = pos + d
+            if is_open_tile(map, new_pos):
+                yield state_index(new_pos, new_face), (
+                    SCORE_INCREASE_STEP
+                    + count_turns_between_faces(face, new_face) * SCORE_INCREASE_TURN
+                )
 
-def faces_are_one_turn_away(face1, face2):
-    i1 = FACES.index(face1)
-    i2 = FACES.index(face2)
-    return abs(i1 - i2) == 1 or {i1, i2} == {0, len(FACES) - 1}
+    return neighbors
 
 
 def compute_best_score_from_start_to_end(map):
-    # Use a simplified version of Dijkstra's algorithm to find the path from
-    # the start to the end having the lowest score.
-    START = find_tile(map, TILE_START)
-    END = find_tile(map, TILE_END)
-    INFINITY = len(map) * len(map[0]) * SCORE_INCREASE_TURN
-
-    scores = {(*START, "E"): 0}
-    for i, j in all_tiles(map):
-        if map[i][j] != TILE_WALL:
-            for face in FACES:
-                scores.setdefault((i, j, face), INFINITY)
-
-    pq = []
-    # Format: (score, i, j, face)
-    heapq.heappush(pq, (0, *START, "E"))
-    while pq:
-        score, i, j, face = heapq.heappop(pq)
-        if score > scores[(i, j, face)]:
-            continue
-
-        for new_face, (di, dj) in DIRECTIONS.items():
-            new_i, new_j = i + di, j + dj
-            if (
-                0 <= new_i < len(map)
-                and 0 <= new_j < len(map[i])
-                and map[new_i][new_j] != TILE_WALL
-            ):
-                if new_face == face:
-                    new_score = score + SCORE_INCREASE_STEP
-                elif faces_are_one_turn_away(face, new_face):
-                    new_score = score + SCORE_INCREASE_STEP + SCORE_INCREASE_TURN
-                else:
-                    new_score = score + SCORE_INCREASE_STEP + 2 * SCORE_INCREASE_TURN
-                if new_score < scores[(new_i, new_j, new_face)]:
-                    scores[(new_i, new_j, new_face)] = new_score
-                    heapq.heappush(pq, (new_score, new_i, new_j, new_face))
-
-    return min(score for (i, j, _), score in scores.items() if (i, j) == END)
+    # Use Dijkstra's algorithm to find the path from the start to the end
+    # having the lowest score.
+    start = map.find(TILE_START)
+    end = map.find(TILE_END)
+
+    scores, target = search.dijkstra(
+        len(map.cells) * len(FACES),
+        [state_index(start, FACE_EAST)],
+        get_neighbors(map),
+        is_target=lambda state: state // len(FACES) == end,
+    )
+    if target is None:
+        raise AssertionError("the end is not reachable")
+    return scores[target]
 
 
 def run_program(input):
@@ -2,12 +2,15 @@
 # Advent of Code 2024, day 18, part 1
 #
 
-import heapq
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
 
-NEIGHBOR_DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+SAFE = ord(".")
+CORRUPTED = ord("#")
 
 
 def read_input():
@@ -24,39 +27,35 @@ def parse_input(input):
     return [parse_position(line) for line in input.strip().split("\n")]
 
 
-def count_min_steps_to_reach_end_of_grid(grid_size, unavailable_positions):
-    # Use a simplified version of Dijkstra's algorithm to find the shortest
-    # path from the start to the end.
-    UNAVAILABLE = set(unavailable_positions)
-    START = (0, 0)
-    END = (grid_size - 1, grid_size - 1)
-    INFINITY = grid_size * grid_size
-
-    distances = {START: 0}
-    for i in range(grid_size):
-        for j in range(grid_size):
-            if (i, j) != START and (i, j) not in UNAVAILABLE:
-                distances[(i, j)] = INFINITY
-
-    pq = []
-    heapq.heappush(pq, (0, *START))
-    while pq:
-        distance, i, j = heapq.heappop(pq)
-        if distance > distances[(i, j)]:
-            continue
-
-        for di, dj in NEIGHBOR_DIRECTIONS:
-            new_i, new_j = i + di, j + dj
-            if (
-                0 <= new_i < grid_size
-                and 0 <= new_j < grid_size
-                and (new_i, new_j) not in UNAVAILABLE
-            ):
-                new_distance = distance + 1
-                if new_distance < distances[(new_i, new_j)]:
-                    distances[(new_i, new_j)] = new_distance
-                    heapq.heappush(pq, (new_distance, new_i, new_j))
+def create_memory_space(grid_size, corrupted_positions):
+    memory = grids.Grid(grid_size, grid_size, fill=".")
+    for i, j in corrupted_positions:
+        memory.cells[memory.pos(i, j)] = CORRUPTED
+    return memory
+
+
+def get_safe_neighbors(memory):
+    def neighbors(pos):
+        return [pos + d for d in memory.directions if memory.cells[pos + d] == SAFE]
 
+    return neighbors
+
+
+def count_min_steps_to_reach_end_of_grid(grid_size, unavailable_positions):
+    # All steps have the same length, so breadth-first search finds the
+    # shortest path from the start to the end.
+    memory = create_memory_space(grid_size, unavailable_positions)
+    START = memory.pos(0, 0)
+    END = memory.pos(grid_size - 1, grid_size - 1)
+
+    distances, end = search.bfs(
+        len(memory.cells),
+        [START],
+        get_safe_neighbors(memory),
+        is_target=lambda pos: pos == END,
+    )
+    if end is None:
+        raise AssertionError("the end is not reachable")
     return distances[END]
 
 
@@ -2,12 +2,15 @@
 # Advent of Code 2024, day 18, part 2
 #
 
-import heapq
 import textwrap
 import unittest
 
+from aoc import grids
+from aoc import search
 
-NEIGHBOR_DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+SAFE = ord(".")
+CORRUPTED = ord("#")
 
 
 def read_input():
@@ -24,33 +27,33 @@ def parse_input(input):
     return [parse_position(line) for line in input.strip().split("\n")]
 
 
+def create_memory_space(grid_size, corrupted_positions):
+    memory = grids.Grid(grid_size, grid_size, fill=".")
+    for i, j in corrupted_positions:
+        memory.cells[memory.pos(i, j)] = CORRUPTED
+    return memory
+
+
+def get_safe_neighbors(memory):
+    def neighbors(pos):
+        return [pos + d for d in memory.directions if memory.cells[pos + d] == SAFE]
+
+    return neighbors
+
+
 def is_end_reachable_from_start(grid_size, unavailable_positions):
-    # Use depth-first search (breadth-first search would work as well) to check
-    # if the end is reachable from the start.
-    UNAVAILABLE = set(unavailable_positions)
-    START = (0, 0)
-    END = (grid_size - 1, grid_size - 1)
-
-    visited = set()
-    to_check = [START]
-    while to_check:
-        i, j = to_check.pop()
-        if (i, j) == END:
-            return True
-
-        visited.add((i, j))
-
-        for di, dj in NEIGHBOR_DIRECTIONS:
-            new_i, new_j = i + di, j + dj
-            if (
-                0 <= new_i < grid_size
-                and 0 <= new_j < grid_size
-                and (new_i, new_j) not in UNAVAILABLE
-                and (new_i, new_j) not in visited
-            ):
-                to_check.append((new_i, new_j))
-
-    return False
+    # Use breadth-first search that stops once the end is reached.
+    memory = create_memory_space(grid_size, unavailable_positions)
+    START = memory.pos(0, 0)
+    END = memory.pos(grid_size - 1, grid_size - 1)
+
+    _, end = search.bfs(
+        len(memory.cells),
+        [START],
+        get_safe_neighbors(memory),
+        is_target=lambda pos: pos == END,
+    )
+    return end is not None
 
 
 def get_position_of_first_byte_that_blocks_path(grid_size, byte_positions):
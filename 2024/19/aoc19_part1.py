@@ -6,6 +6,8 @@ import functools
 import textwrap
 import unittest
 
+from aoc import counters
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -32,7 +34,9 @@ def is_possible_design(design, stripes):
 
         return False
 
-    return is_possible(design)
+    possible = is_possible(design)
+    counters.count_cache("designs", is_possible)
+    return possible
 
 
 def get_possible_designs(designs, stripes):
@@ -6,6 +6,8 @@ import functools
 import textwrap
 import unittest
 
+from aoc import counters
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -32,7 +34,9 @@ def count_possible_design_combinations(design, stripes):
 
         return count
 
-    return count_possible_combinations(design)
+    count = count_possible_combinations(design)
+    counters.count_cache("designs", count_possible_combinations)
+    return count
 
 
 def count_possible_designs_combinations(designs, stripes):
@@ -5,6 +5,8 @@
 import functools
 import unittest
 
+from aoc import counters
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
@@ -318,26 +320,25 @@ def compute_fewest_button_presses(code, dir_keypad_count):
     # number of directional keypads.
     #
     # We do the computation recursively via the divide-and-conquer algorithm as
-    # each robot always ends up on the "A" button. We also utilize caching to
-    # speed up the computation (already computed button presses can be reused
-    # in the future).
+    # each robot always ends up on the "A" button.
+    return fewest_keypad_presses(code, dir_keypad_count, numeric_keypresses_for)
 
-    @functools.cache
-    def fewest_keypad_presses(to_press, depth, keypresses_func):
-        if depth == 0:
-            return len(to_press)
 
-        fewest_presses = 0
-        current = "A"
-        for target in to_press:
-            presses = keypresses_func(current, target)
-            current = target
-            fewest_presses += fewest_keypad_presses(
-                presses, depth - 1, dir_keypresses_for
-            )
-        return fewest_presses
+# We utilize caching to speed up the computation (already computed button
+# presses can be reused in the future). The cache is on the module level, so
+# it is shared by all codes (and inputs, when the module stays loaded).
+@functools.cache
+def fewest_keypad_presses(to_press, depth, keypresses_func):
+    if depth == 0:
+        return len(to_press)
 
-    return fewest_keypad_presses(code, dir_keypad_count, numeric_keypresses_for)
+    fewest_presses = 0
+    current = "A"
+    for target in to_press:
+        presses = keypresses_func(current, target)
+        current = target
+        fewest_presses += fewest_keypad_presses(presses, depth - 1, dir_keypresses_for)
+    return fewest_presses
 
 
 def compute_complexity_of_fewest_button_presses(code, dir_keypad_count):
@@ -347,10 +348,13 @@ def compute_complexity_of_fewest_button_presses(code, dir_keypad_count):
 
 def run_program(input, dir_keypad_count=2 + 1):
     codes = parse_input(input)
-    return sum(
+    cache_info = fewest_keypad_presses.cache_info()
+    complexity = sum(
         compute_complexity_of_fewest_button_presses(code, dir_keypad_count)
         for code in codes
     )
+    counters.count_cache("keypad presses", fewest_keypad_presses, cache_info)
+    return complexity
 
 
 if __name__ == "__main__":
@@ -5,14 +5,16 @@
 import textwrap
 import unittest
 
+from aoc import columns
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [int(n) for n in input.strip().split("\n")]
+    return columns.parse_ints(input)
 
 
 def evolve_secret_number(n, evolution_count):
@@ -38,7 +40,8 @@ def run_program(input, evolution_count=2000):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
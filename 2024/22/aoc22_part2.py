@@ -6,14 +6,16 @@ import collections
 import textwrap
 import unittest
 
+from aoc import columns
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [int(n) for n in input.strip().split("\n")]
+    return columns.parse_ints(input)
 
 
 def get_all_evolutions_of_secret_number(n, evolution_count):
@@ -67,15 +69,17 @@ def compute_max_bananas_we_can_buy(evolutions_per_number):
 
 def run_program(input, evolution_count=2000):
     secret_numbers = parse_input(input)
-    evolutions_per_number = [
+    # A generator, so that only evolutions of one number are kept in memory.
+    evolutions_per_number = (
         get_all_evolutions_of_secret_number(secret_number, evolution_count)
         for secret_number in secret_numbers
-    ]
+    )
     return compute_max_bananas_we_can_buy(evolutions_per_number)
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
@@ -2,18 +2,24 @@
 # Advent of Code 2025, day 01, part 1
 #
 
-import operator
 import textwrap
 import unittest
 
+from aoc import columns
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
         return f.read()
 
 
+# Rotations to the left are parsed as negative numbers and rotations to the
+# right as positive numbers (L68 -> -68, R48 -> +48).
+ROTATION_TO_SIGN = bytes.maketrans(b"LR", b"-+")
+
+
 def parse_input(input):
-    return [(line[0], int(line[1:])) for line in input.strip().split("\n")]
+    return columns.parse_ints(input, ROTATION_TO_SIGN)
 
 
 def get_password(rotations):
@@ -22,9 +28,8 @@ def get_password(rotations):
     password = 0
 
     c = 50
-    for dir, n in rotations:
-        op = operator.add if dir == "R" else operator.sub
-        c = op(c, n) % 100
+    for n in rotations:
+        c = (c + n) % 100
         if c == 0:
             password += 1
 
@@ -2,18 +2,24 @@
 # Advent of Code 2025, day 01, part 2
 #
 
-import operator
 import textwrap
 import unittest
 
+from aoc import columns
+
 
 def read_input():
     with open("input", encoding="utf-8") as f:
         return f.read()
 
 
+# Rotations to the left are parsed as negative numbers and rotations to the
+# right as positive numbers (L68 -> -68, R48 -> +48).
+ROTATION_TO_SIGN = bytes.maketrans(b"LR", b"-+")
+
+
 def parse_input(input):
-    return [(line[0], int(line[1:])) for line in input.strip().split("\n")]
+    return columns.parse_ints(input, ROTATION_TO_SIGN)
 
 
 def get_password(rotations):
@@ -22,11 +28,10 @@ def get_password(rotations):
     password = 0
 
     c = 50
-    for dir, n in rotations:
-        password += n // 100
-        n %= 100
-        op = operator.add if dir == "R" else operator.sub
-        x = op(c, n)
+    for n in rotations:
+        full_turns, n_rest = divmod(abs(n), 100)
+        password += full_turns
+        x = c + n_rest if n > 0 else c - n_rest
         if (c != 0 and x <= 0) or x >= 100:
             password += 1
         c = x % 100
@@ -5,14 +5,15 @@
 import textwrap
 import unittest
 
+from aoc import inputs
+
 
 def read_input():
-    with open("input", encoding="utf-8") as f:
-        return f.read()
+    return inputs.map_input("input")
 
 
 def parse_input(input):
-    return [tuple(map(int, r.split("-"))) for r in input.strip().split(",")]
+    return (tuple(map(int, r.split("-"))) for r in inputs.iter_tokens(input))
 
 
 def gen_invalid_ids(ranges):
@@ -53,7 +54,8 @@ def run_program(input):
 
 
 if __name__ == "__main__":
-    result = run_program(read_input())
+    with read_input() as input:
+        result = run_program(input)
     print(result)
 
 
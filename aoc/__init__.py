@@ -0,0 +1,3 @@
+#
+# Tooling shared by the Advent of Code solutions (running, timing, etc.).
+#
@@ -0,0 +1,200 @@
+#
+# Solves many inputs of a single day in warm processes.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.batch [-j JOBS] YEAR/DD[/PART] INPUT_DIR
+#
+# Every file in INPUT_DIR is an input (e.g. inputs of different users). The
+# solution modules are loaded only once per process, so the interpreter
+# startup, imports, compiled regular expressions, and tables precomputed or
+# cached at the module level are shared by all the inputs. One result line is
+# printed per input and solution as soon as it is available (in the order of
+# the inputs).
+#
+
+import argparse
+import dataclasses
+import multiprocessing
+import pathlib
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+from aoc import run
+from aoc import solutions
+
+
+@dataclasses.dataclass
+class BatchResult:
+    solution: solutions.Solution
+    input_path: pathlib.Path
+    answer: object = None
+    error: str | None = None
+    # In seconds.
+    wall_time: float = 0.0
+
+
+def find_inputs(input_dir):
+    return sorted(
+        path
+        for path in pathlib.Path(input_dir).iterdir()
+        if path.is_file() and not path.name.startswith(".")
+    )
+
+
+def solve_input(solution_and_input_path):
+    solution, input_path = solution_and_input_path
+    result = BatchResult(solution, input_path)
+    try:
+        module = solutions.get_solution_module(solution)
+        input = input_path.read_text(encoding="utf-8")
+        start = time.perf_counter()
+        try:
+            result.answer = module.run_program(input)
+        finally:
+            result.wall_time = time.perf_counter() - start
+    # See run.run_solution() for why BaseException is caught.
+    except BaseException as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def solve_batch(solutions_to_run, input_paths, jobs=1):
+    # Yields BatchResults for all inputs (in order) and all solutions. With a
+    # single job, the inputs are solved in the current process, otherwise in
+    # a pool of long-lived worker processes.
+    items = [
+        (solution, input_path)
+        for input_path in input_paths
+        for solution in solutions_to_run
+    ]
+    if jobs == 1:
+        yield from map(solve_input, items)
+    else:
+        # The modules are loaded before the workers are forked, so that all
+        # the workers inherit them (spawned workers, the default on macOS,
+        # would import them again). A module that cannot be loaded is left to
+        # the workers, which report the error for every input.
+        for solution in solutions_to_run:
+            try:
+                solutions.get_solution_module(solution)
+            except Exception:
+                pass
+        with multiprocessing.get_context("fork").Pool(processes=jobs) as pool:
+            yield from pool.imap(solve_input, items)
+
+
+def format_batch_result(result, name_width=0):
+    answer = result.answer if result.error is None else f"ERROR ({result.error})"
+    return (
+        f"{result.input_path.name:<{name_width}} {result.solution.name:<10} "
+        f"{run.format_duration(result.wall_time):>10}  {answer}"
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.batch",
+        description="Solves many inputs of an Advent of Code day.",
+    )
+    parser.add_argument(
+        "selector",
+        metavar="YEAR/DD[/PART]",
+        help="the day (or part) to solve",
+    )
+    parser.add_argument(
+        "input_dir",
+        metavar="INPUT_DIR",
+        type=pathlib.Path,
+        help="directory with the inputs (one file per input)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default: 1, i.e. the current process)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.selector.count("/") == 0:
+        sys.exit("error: the selector has to be YEAR/DD or YEAR/DD/PART")
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), [args.selector]
+        )
+        input_paths = find_inputs(args.input_dir)
+    except (ValueError, OSError) as e:
+        sys.exit(f"error: {e}")
+    if not selected:
+        sys.exit(f"error: no solution for {args.selector}")
+
+    name_width = max((len(path.name) for path in input_paths), default=0)
+    failed = False
+    for result in solve_batch(selected, input_paths, args.jobs):
+        print(format_batch_result(result, name_width), flush=True)
+        failed = failed or result.error is not None
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        path = self.dir / "01" / "aoc01_part1.py"
+        path.parent.mkdir()
+        path.write_text(
+            textwrap.dedent(
+                """
+                import os
+
+                def run_program(input):
+                    return sum(map(int, input.split())), os.getpid()
+                """
+            ),
+            encoding="utf-8",
+        )
+        self.solution = solutions.Solution(2024, 1, 1, path)
+        self.input_dir = self.dir / "inputs"
+        self.input_dir.mkdir()
+        for name, input in [("b", "3 4\n"), ("a", "1 2\n"), ("c", "x\n")]:
+            (self.input_dir / name).write_text(input, encoding="utf-8")
+
+    def test_find_inputs_returns_files_in_order(self):
+        (self.input_dir / ".hidden").write_text("", encoding="utf-8")
+
+        self.assertEqual(
+            [path.name for path in find_inputs(self.input_dir)], ["a", "b", "c"]
+        )
+
+    def test_solve_batch_solves_all_inputs_in_one_process(self):
+        results = list(solve_batch([self.solution], find_inputs(self.input_dir)))
+
+        self.assertEqual([result.answer[0] for result in results[:2]], [3, 7])
+        self.assertEqual(results[0].answer[1], results[1].answer[1])
+        self.assertTrue(results[2].error.startswith("ValueError"))
+
+    def test_solve_batch_returns_results_in_input_order_with_pool(self):
+        results = list(
+            solve_batch([self.solution], find_inputs(self.input_dir), jobs=2)
+        )
+
+        self.assertEqual(
+            [result.input_path.name for result in results], ["a", "b", "c"]
+        )
+
+    def test_format_batch_result_includes_input_name_and_answer(self):
+        result = BatchResult(self.solution, pathlib.Path("alice"), 1812)
+
+        self.assertRegex(
+            format_batch_result(result, 8), r"^alice    2024/01/1 .* 1812$"
+        )
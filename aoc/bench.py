@@ -0,0 +1,559 @@
+#
+# Benchmarks the selected solutions, stores the timings into a local history,
+# and reports regressions against the previously benchmarked commit.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.bench [-n RUNS] [-w WARMUP] [--threshold T] [SELECTOR ...]
+#     python -m aoc.bench --update-readme [SELECTOR ...]
+#     python -m aoc.bench --all-interpreters [SELECTOR ...]
+#
+# The history is a JSON-lines file (one record per benchmarked solution) keyed
+# by the git commit and the Python interpreter that ran the benchmark.
+#
+
+import argparse
+import dataclasses
+import datetime
+import functools
+import json
+import pathlib
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+from aoc import run
+from aoc import solutions
+
+
+HISTORY_PATH = solutions.ROOT_DIR / ".bench-history.jsonl"
+DEFAULT_RUNS = 5
+DEFAULT_WARMUP = 1
+# Relative slowdown of the median over which a benchmark is a regression.
+DEFAULT_THRESHOLD = 0.1
+README_RUNTIME_MIN = 0.1
+
+
+@dataclasses.dataclass
+class Record:
+    solution: str
+    commit: str
+    interpreter: str
+    runs: int
+    # In seconds.
+    median: float
+    p95: float
+    timestamp: str
+
+    @staticmethod
+    def from_json(line):
+        return Record(**json.loads(line))
+
+    def to_json(self):
+        return json.dumps(dataclasses.asdict(self))
+
+
+def get_interpreter():
+    # E.g. cpython-3.13.0 or pypy-7.3.17.
+    version = sys.implementation.version
+    return f"{sys.implementation.name}-{version.major}.{version.minor}.{version.micro}"
+
+
+# Prints the result of get_interpreter() when run by another interpreter.
+GET_INTERPRETER_CODE = (
+    "import sys; v = sys.implementation.version; "
+    "print(f'{sys.implementation.name}-{v.major}.{v.minor}.{v.micro}')"
+)
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=solutions.ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def percentile(values, p):
+    # Nearest-rank percentile (returns one of the values).
+    values = sorted(values)
+    rank = max(1, round(p / 100 * len(values)))
+    return values[rank - 1]
+
+
+def time_runs(function, input, runs, warmup):
+    for _ in range(warmup):
+        function(input)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function(input)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def benchmark_solution(solution, runs=DEFAULT_RUNS, warmup=DEFAULT_WARMUP):
+    # Returns (solution, times, error).
+    try:
+        module = solutions.load_solution_module(solution)
+        input = solutions.read_solution_input(solution)
+        return solution, time_runs(module.run_program, input, runs, warmup), None
+    except BaseException as e:
+        return solution, [], f"{type(e).__name__}: {e}"
+
+
+def create_record(solution, times, commit, interpreter):
+    return Record(
+        solution=solution.name,
+        commit=commit,
+        interpreter=interpreter,
+        runs=len(times),
+        median=statistics.median(times),
+        p95=percentile(times, 95),
+        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    )
+
+
+def load_history(path=HISTORY_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [Record.from_json(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def append_to_history(records, path=HISTORY_PATH):
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(record.to_json() + "\n")
+
+
+def find_baseline(history, record):
+    # The baseline is the latest record of the same solution benchmarked by
+    # the same interpreter on a different commit.
+    for old_record in reversed(history):
+        if (
+            old_record.solution == record.solution
+            and old_record.interpreter == record.interpreter
+            and old_record.commit != record.commit
+        ):
+            return old_record
+    return None
+
+
+def find_regressions(history, records, threshold=DEFAULT_THRESHOLD):
+    # Returns a list of (baseline, record) pairs.
+    regressions = []
+    for record in records:
+        baseline = find_baseline(history, record)
+        if baseline is not None and record.median > baseline.median * (1 + threshold):
+            regressions.append((baseline, record))
+    return regressions
+
+
+def get_best_runtimes(history):
+    # For every solution, returns the median from the latest record of the
+    # fastest interpreter (the year READMEs list the runtime of the faster of
+    # the interpreters).
+    latest = {}
+    for record in history:
+        latest[(record.solution, record.interpreter)] = record
+    best = {}
+    for (solution, _), record in latest.items():
+        best[solution] = min(best.get(solution, record.median), record.median)
+    return best
+
+
+def format_readme_runtime(seconds):
+    return f"{max(seconds, README_RUNTIME_MIN):.1f} seconds"
+
+
+def update_readme_runtimes(readme, year, runtimes):
+    # Rewrites the last column of the solution table ("Runtimes") in the year's
+    # README. Parts without a measured runtime keep their current value.
+    def update_row(m):
+        day = int(m.group(1))
+        current = m.group(3).split(", ")
+        names = (
+            [f"{year}/{day:02}/{part}" for part in (1, 2)]
+            if len(current) == 2
+            else [f"{year}/{day:02}"]
+        )
+        new = [
+            format_readme_runtime(runtimes[name]) if name in runtimes else value
+            for name, value in zip(names, current)
+        ]
+        return f"| {day} |{m.group(2)}| {', '.join(new)} |"
+
+    return re.sub(
+        r"^\| (\d+) \|(.*)\| ([^|]*?) \|$", update_row, readme, flags=re.MULTILINE
+    )
+
+
+def update_readmes(runtimes, root_dir=solutions.ROOT_DIR):
+    readme_paths = pathlib.Path(root_dir).glob("[0-9][0-9][0-9][0-9]/README.md")
+    for readme_path in sorted(readme_paths):
+        year = int(readme_path.parent.name)
+        if not any(name.startswith(f"{year}/") for name in runtimes):
+            continue
+        readme = readme_path.read_text(encoding="utf-8")
+        new_readme = update_readme_runtimes(readme, year, runtimes)
+        if new_readme != readme:
+            readme_path.write_text(new_readme, encoding="utf-8")
+            print(f"updated {readme_path.relative_to(root_dir)}")
+
+
+def format_record(record, baseline=None):
+    line = (
+        f"{record.solution:<10} {run.format_duration(record.median):>10} "
+        f"{run.format_duration(record.p95):>10}"
+    )
+    if baseline is not None:
+        change = record.median / baseline.median - 1
+        line += f"  {change:+.0%} vs {baseline.commit}"
+    return line
+
+
+def find_interpreters():
+    # Returns a list of (interpreter, executable) pairs for all distinct Python
+    # interpreters found on PATH.
+    names = ["python3", "pypy3"] + [
+        f"{name}3.{minor}" for name in ("python", "pypy") for minor in range(9, 16)
+    ]
+    interpreters = {}
+    for name in names:
+        executable = shutil.which(name)
+        if executable is None:
+            continue
+        try:
+            interpreter = subprocess.run(
+                [executable, "-c", GET_INTERPRETER_CODE],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            continue
+        interpreters.setdefault(interpreter, executable)
+    return sorted(interpreters.items())
+
+
+def benchmark_under_interpreter(executable, argv):
+    # Runs the benchmark in another interpreter, which stores its records into
+    # the history. Returns the benchmark's output when it fails to run.
+    completed = subprocess.run(
+        [executable, "-m", "aoc.bench", *argv],
+        cwd=solutions.ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    # Exit code 1 means that there were regressions or failed solutions, which
+    # are reported in the matrix itself.
+    if completed.returncode not in (0, 1):
+        return completed.stdout + completed.stderr
+    return None
+
+
+def get_interpreter_matrix(history, commit, interpreters):
+    # Returns {solution: {interpreter: median}} from the latest records of the
+    # given interpreters on the given commit.
+    matrix = {}
+    for record in history:
+        if record.commit == commit and record.interpreter in interpreters:
+            matrix.setdefault(record.solution, {})[record.interpreter] = record.median
+    return matrix
+
+
+def format_interpreter_matrix(matrix, interpreters):
+    width = max(10, *(len(interpreter) for interpreter in interpreters))
+    lines = [
+        f"{'Solution':<10} "
+        + " ".join(f"{interpreter:>{width}}" for interpreter in interpreters)
+        + f" {'Speedup':>8}  Winner"
+    ]
+    for solution, medians in sorted(matrix.items()):
+        line = f"{solution:<10} " + " ".join(
+            f"{run.format_duration(medians[i]) if i in medians else '-':>{width}}"
+            for i in interpreters
+        )
+        if len(medians) > 1:
+            winner = min(medians, key=medians.get)
+            speedup = max(medians.values()) / max(medians[winner], 1e-9)
+            line += f" {speedup:>7.1f}x  {winner}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def compare_interpreters(args, selectors):
+    interpreters = find_interpreters()
+    if not interpreters:
+        sys.exit("error: no Python interpreters found on PATH")
+
+    argv = [
+        *selectors,
+        f"--runs={args.runs}",
+        f"--warmup={args.warmup}",
+        f"--jobs={args.jobs}",
+        f"--history={args.history.resolve()}",
+    ]
+    for interpreter, executable in interpreters:
+        print(f"benchmarking with {interpreter} ({executable})", file=sys.stderr)
+        error = benchmark_under_interpreter(executable, argv)
+        if error is not None:
+            print(f"{interpreter} failed:\n{error}", file=sys.stderr)
+
+    names = [interpreter for interpreter, _ in interpreters]
+    matrix = get_interpreter_matrix(load_history(args.history), get_commit(), names)
+    print(format_interpreter_matrix(matrix, names))
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.bench",
+        description="Benchmarks Advent of Code solutions and tracks their timings.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all solutions)",
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help=f"number of measured runs (default: {DEFAULT_RUNS})",
+    )
+    parser.add_argument(
+        "-w",
+        "--warmup",
+        type=int,
+        default=DEFAULT_WARMUP,
+        help=f"number of unmeasured warmup runs (default: {DEFAULT_WARMUP})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default: 1 to reduce noise)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown reported as a regression "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--history",
+        type=pathlib.Path,
+        default=HISTORY_PATH,
+        help="path to the history file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--update-readme",
+        action="store_true",
+        help="only regenerate the README runtimes from the history",
+    )
+    parser.add_argument(
+        "--all-interpreters",
+        action="store_true",
+        help="benchmark under every Python interpreter on PATH and compare them",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.runs < 1:
+        sys.exit("error: the number of runs has to be at least 1")
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+    if args.all_interpreters:
+        return compare_interpreters(args, args.selectors)
+
+    history = load_history(args.history)
+    if args.update_readme:
+        selected_names = {solution.name for solution in selected}
+        runtimes = get_best_runtimes(history)
+        update_readmes({n: t for n, t in runtimes.items() if n in selected_names})
+        return 0
+
+    commit = get_commit()
+    interpreter = get_interpreter()
+    records = []
+    errors = []
+    benchmark = functools.partial(
+        benchmark_solution, runs=args.runs, warmup=args.warmup
+    )
+    print(f"{'Solution':<10} {'Median':>10} {'P95':>10}")
+    for solution, times, error in sorted(
+        run.map_in_workers(benchmark, selected, args.jobs), key=lambda r: r[0]
+    ):
+        if error is not None:
+            errors.append(solution)
+            print(f"{solution.name:<10} ERROR ({error})")
+            continue
+        record = create_record(solution, times, commit, interpreter)
+        records.append(record)
+        print(format_record(record, find_baseline(history, record)))
+    append_to_history(records, args.history)
+
+    regressions = find_regressions(history, records, args.threshold)
+    for baseline, record in regressions:
+        print(f"regression: {format_record(record, baseline)}")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def create_record(self, solution="2024/06/2", commit="abc", median=1.0):
+        return Record(
+            solution=solution,
+            commit=commit,
+            interpreter="cpython-3.13.0",
+            runs=5,
+            median=median,
+            p95=median,
+            timestamp="2024-12-06T00:00:00+00:00",
+        )
+
+    def test_percentile_returns_nearest_rank_value(self):
+        values = list(range(1, 21))
+
+        self.assertEqual(percentile(values, 95), 19)
+        self.assertEqual(percentile(values, 50), 10)
+        self.assertEqual(percentile([3], 95), 3)
+
+    def test_time_runs_calls_function_warmup_plus_runs_times(self):
+        calls = []
+
+        times = time_runs(calls.append, "input", runs=3, warmup=2)
+
+        self.assertEqual(len(times), 3)
+        self.assertEqual(calls, ["input"] * 5)
+
+    def test_history_is_stored_and_loaded(self):
+        path = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "h"
+        records = [self.create_record(), self.create_record(commit="def")]
+
+        append_to_history(records[:1], path)
+        append_to_history(records[1:], path)
+
+        self.assertEqual(load_history(path), records)
+
+    def test_find_regressions_compares_with_latest_record_from_other_commit(self):
+        history = [
+            self.create_record(commit="a", median=1.0),
+            self.create_record(commit="b", median=2.0),
+            self.create_record(commit="c", median=1.0),
+        ]
+        record = self.create_record(commit="c", median=2.5)
+
+        regressions = find_regressions(history, [record], threshold=0.1)
+
+        self.assertEqual(regressions, [(history[1], record)])
+
+    def test_find_regressions_ignores_slowdown_within_threshold(self):
+        history = [self.create_record(commit="a", median=1.0)]
+        record = self.create_record(commit="b", median=1.05)
+
+        self.assertEqual(find_regressions(history, [record], threshold=0.1), [])
+
+    def test_get_best_runtimes_uses_latest_record_of_fastest_interpreter(self):
+        history = [
+            self.create_record(median=0.5),
+            self.create_record(median=3.0),
+            dataclasses.replace(self.create_record(median=2.0), interpreter="pypy"),
+        ]
+
+        self.assertEqual(get_best_runtimes(history), {"2024/06/2": 2.0})
+
+    def test_update_readme_runtimes_updates_measured_parts(self):
+        readme = textwrap.dedent(
+            """
+            | Day | Puzzle | Solutions | Runtimes |
+            | ---- | ---- | ---- | ---- |
+            | 6 | [Guard](x) | [part 1](06/a.py), [part 2](06/b.py) | 0.1 seconds, 6.5 seconds |
+            | 25 | [Code](y) | [parts 1 & 2](25/aoc25.py) | 0.1 seconds |
+            | 26 | [Lobby](z) | TBD | TBD |
+            """
+        )
+
+        new_readme = update_readme_runtimes(
+            readme, 2024, {"2024/06/2": 2.04, "2024/25": 0.01}
+        )
+
+        self.assertEqual(
+            new_readme,
+            textwrap.dedent(
+                """
+                | Day | Puzzle | Solutions | Runtimes |
+                | ---- | ---- | ---- | ---- |
+                | 6 | [Guard](x) | [part 1](06/a.py), [part 2](06/b.py) | 0.1 seconds, 2.0 seconds |
+                | 25 | [Code](y) | [parts 1 & 2](25/aoc25.py) | 0.1 seconds |
+                | 26 | [Lobby](z) | TBD | TBD |
+                """
+            ),
+        )
+
+    def test_get_interpreter_matrix_uses_latest_records_from_given_commit(self):
+        cpython = self.create_record(commit="b", median=5.0)
+        pypy = dataclasses.replace(cpython, interpreter="pypy-7.3.17", median=0.8)
+        history = [
+            self.create_record(commit="a", median=1.0),
+            self.create_record(commit="b", median=6.0),
+            cpython,
+            pypy,
+        ]
+
+        matrix = get_interpreter_matrix(history, "b", ["cpython-3.13.0", "pypy-7.3.17"])
+
+        self.assertEqual(
+            matrix, {"2024/06/2": {"cpython-3.13.0": 5.0, "pypy-7.3.17": 0.8}}
+        )
+
+    def test_format_interpreter_matrix_shows_speedup_and_winner(self):
+        matrix = {
+            "2024/22/2": {"cpython-3.13.0": 5.0, "pypy-7.3.17": 0.8},
+            "2024/25": {"cpython-3.13.0": 0.1},
+        }
+
+        table = format_interpreter_matrix(matrix, ["cpython-3.13.0", "pypy-7.3.17"])
+
+        lines = table.split("\n")
+        self.assertEqual(len(lines), 3)
+        self.assertRegex(lines[1], r"^2024/22/2 .* 5\.00 s .* 800\.0 ms +6\.2x  pypy")
+        self.assertRegex(lines[2], r"^2024/25 .* 100\.0 ms +-$")
+
+    def test_get_interpreter_code_prints_current_interpreter(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", GET_INTERPRETER_CODE],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(completed.stdout.strip(), get_interpreter())
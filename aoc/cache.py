@@ -0,0 +1,167 @@
+#
+# A content-addressed on-disk cache of answers of the solutions.
+#
+# An answer is stored under a key derived from the SHA-256 of the input and
+# of the source code of the solution (together with the sources of the aoc
+# modules that it imports), so editing either the input or the solution makes
+# the solution recompute its answer. Every entry is a small JSON file in the
+# cache directory; reading an entry updates its modification time, so when
+# the cache grows over its size limit, the least recently used entries are
+# evicted first.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.run --cache [--cache-size MIB] [SELECTOR ...]
+#
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+import tempfile
+import textwrap
+import unittest
+
+from aoc import solutions
+
+
+CACHE_DIR = solutions.ROOT_DIR / ".answer-cache"
+# In bytes.
+DEFAULT_MAX_SIZE = 16 * 2**20
+AOC_DIR = pathlib.Path(__file__).resolve().parent
+AOC_IMPORT_RE = re.compile(r"^from aoc import (\w+)$", re.MULTILINE)
+
+
+def hash_input(input):
+    return hashlib.sha256(input.encode("utf-8")).hexdigest()
+
+
+def hash_solution_source(solution):
+    # Hashes the source of the solution together with the sources of all the
+    # aoc modules it (transitively) imports, in a fixed order.
+    hash = hashlib.sha256()
+    paths = [solution.path]
+    seen = set(paths)
+    while paths:
+        path = paths.pop(0)
+        source = path.read_bytes()
+        hash.update(source)
+        for module_name in AOC_IMPORT_RE.findall(source.decode("utf-8")):
+            module_path = AOC_DIR / f"{module_name}.py"
+            if module_path not in seen:
+                seen.add(module_path)
+                paths.append(module_path)
+    return hash.hexdigest()
+
+
+def get_cache_key(solution, input):
+    return hashlib.sha256(
+        f"{hash_input(input)}:{hash_solution_source(solution)}".encode("ascii")
+    ).hexdigest()
+
+
+def get_entry_path(key, cache_dir):
+    return pathlib.Path(cache_dir) / f"{key}.json"
+
+
+def load_entry(key, cache_dir=CACHE_DIR):
+    # Returns the stored entry (a dictionary) or None when there is none.
+    path = get_entry_path(key, cache_dir)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        # Mark the entry as recently used.
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return entry
+
+
+def store_entry(key, entry, cache_dir=CACHE_DIR):
+    # Returns False when the entry cannot be stored (e.g. when the answer is
+    # not serializable to JSON).
+    try:
+        data = json.dumps(entry)
+    except (TypeError, ValueError):
+        return False
+    cache_dir = pathlib.Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write the entry atomically, so that workers running in parallel never
+    # see a partially written entry.
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, get_entry_path(key, cache_dir))
+    return True
+
+
+def evict_entries(cache_dir=CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+    # Removes the least recently used entries until the size of the cache is
+    # at most max_size bytes. Returns the number of removed entries.
+    entries = []
+    for path in pathlib.Path(cache_dir).glob("*.json"):
+        stat = path.stat()
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    size = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, entry_size, path in entries:
+        if size <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        size -= entry_size
+        evicted += 1
+    return evicted
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def create_solution(self, source):
+        path = self.dir / "aoc01_part1.py"
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+        return solutions.Solution(2024, 1, 1, path)
+
+    def test_cache_key_changes_when_input_or_solution_changes(self):
+        solution = self.create_solution("def run_program(input): return 1\n")
+        key = get_cache_key(solution, "1 2\n")
+
+        self.assertEqual(get_cache_key(solution, "1 2\n"), key)
+        self.assertNotEqual(get_cache_key(solution, "1 3\n"), key)
+        self.create_solution("def run_program(input): return 2\n")
+        self.assertNotEqual(get_cache_key(solution, "1 2\n"), key)
+
+    def test_hash_solution_source_includes_imported_aoc_modules(self):
+        solution = self.create_solution("from aoc import grids\n")
+        hash = hashlib.sha256()
+        hash.update(solution.path.read_bytes())
+        hash.update((AOC_DIR / "grids.py").read_bytes())
+
+        self.assertEqual(hash_solution_source(solution), hash.hexdigest())
+
+    def test_load_entry_returns_stored_entry(self):
+        entry = {"answer": 1812, "wall_time": 1.5}
+
+        self.assertTrue(store_entry("abc", entry, self.dir))
+        self.assertEqual(load_entry("abc", self.dir), entry)
+
+    def test_load_entry_returns_none_for_missing_entry(self):
+        self.assertIsNone(load_entry("abc", self.dir))
+
+    def test_store_entry_does_not_store_unserializable_answer(self):
+        self.assertFalse(store_entry("abc", {"answer": {1, 2}}, self.dir))
+        self.assertIsNone(load_entry("abc", self.dir))
+
+    def test_evict_entries_removes_least_recently_used_entries(self):
+        for i, key in enumerate(["a", "b", "c"]):
+            store_entry(key, {"answer": "x" * 100}, self.dir)
+            os.utime(get_entry_path(key, self.dir), (i, i))
+        # Using an entry makes it the most recently used one.
+        load_entry("a", self.dir)
+        size = get_entry_path("a", self.dir).stat().st_size
+
+        evicted = evict_entries(self.dir, max_size=2 * size)
+
+        self.assertEqual(evicted, 1)
+        self.assertEqual(sorted(p.stem for p in self.dir.glob("*.json")), ["a", "c"])
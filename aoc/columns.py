@@ -0,0 +1,161 @@
+#
+# Columnar parsing of integer puzzle inputs.
+#
+# Instead of splitting the input into lines and every line into a list of
+# Python ints, the integers are parsed into flat array("q") buffers (8 bytes
+# per integer, usable from NumPy via numpy.frombuffer() without copying).
+# Rows of different lengths (ragged rows, e.g. reports in 2024/02) are kept in
+# a single array of values plus an array of offsets, in which the row i spans
+# values[offsets[i]:offsets[i + 1]].
+#
+# The input is parsed in chunks of whole lines by built-in functions running
+# in C (bytes.split(), int(), and array.extend()), so there is no Python loop
+# over the lines or integers, and no more than a chunk of tokens exists at any
+# time. Like inputs.iter_lines(), the parsers accept a string, bytes, or a
+# memory-mapped file, and skip blank lines at the start and end of the input.
+#
+# Usage:
+#
+#     with inputs.map_input("input") as input:
+#         left, right = columns.parse_columns(input, 2)
+#         values, offsets = columns.parse_rows(input)
+#         for row in columns.iter_rows(values, offsets):
+#             ...
+#
+
+import array
+import itertools
+import textwrap
+import unittest
+
+
+CHUNK_SIZE = 2**20
+
+
+def iter_line_chunks(input, chunk_size=CHUNK_SIZE):
+    # Yields parts of the input (as bytes) of about the given size that end
+    # with whole lines, so that no integer is split between two chunks.
+    if isinstance(input, str):
+        input = input.encode("utf-8")
+    start = 0
+    end = len(input)
+    while start < end:
+        stop = input.find(b"\n", min(start + chunk_size, end))
+        stop = end if stop == -1 else stop + 1
+        yield input[start:stop]
+        start = stop
+
+
+def parse_ints(input, translation=None, chunk_size=CHUNK_SIZE):
+    # Returns all whitespace-separated integers in the input. The translation
+    # (a bytes.maketrans() table) is applied to the input before parsing, e.g.
+    # to turn letters into signs.
+    values = array.array("q")
+    for chunk in iter_line_chunks(input, chunk_size):
+        if translation is not None:
+            chunk = chunk.translate(translation)
+        values.extend(map(int, chunk.split()))
+    return values
+
+
+def parse_columns(input, column_count, chunk_size=CHUNK_SIZE):
+    # Returns the given number of columns of integers, one array per column.
+    values = parse_ints(input, chunk_size=chunk_size)
+    if len(values) % column_count != 0:
+        raise ValueError(f"the input does not have {column_count} columns")
+    return [values[i::column_count] for i in range(column_count)]
+
+
+def parse_rows(input, chunk_size=CHUNK_SIZE):
+    # Returns (values, offsets) of rows of integers of any length (one row per
+    # line, blank lines inside the input are empty rows).
+    values = array.array("q")
+    row_lengths = array.array("q")
+    for chunk in iter_line_chunks(input, chunk_size):
+        values.extend(map(int, chunk.split()))
+        lines = chunk.split(b"\n")
+        if not lines[-1]:
+            # The empty part after the last newline is not a line.
+            lines.pop()
+        row_lengths.extend(map(len, map(bytes.split, lines)))
+
+    first = 0
+    while first < len(row_lengths) and row_lengths[first] == 0:
+        first += 1
+    last = len(row_lengths)
+    while last > first and row_lengths[last - 1] == 0:
+        last -= 1
+    offsets = array.array("q", itertools.accumulate(row_lengths[first:last], initial=0))
+    return values, offsets
+
+
+def iter_rows(values, offsets):
+    # Yields the rows (as arrays) of rows parsed by parse_rows().
+    for start, stop in itertools.pairwise(offsets):
+        yield values[start:stop]
+
+
+class Tests(unittest.TestCase):
+    def test_parse_ints_returns_all_integers_in_order(self):
+        self.assertEqual(
+            parse_ints("\n3   4\n-4 3\n\n"), array.array("q", [3, 4, -4, 3])
+        )
+
+    def test_parse_ints_applies_translation(self):
+        self.assertEqual(
+            parse_ints("L68\nR48\n", bytes.maketrans(b"LR", b"-+")),
+            array.array("q", [-68, 48]),
+        )
+
+    def test_parse_columns_returns_one_array_per_column(self):
+        input = textwrap.dedent(
+            """
+            3   4
+            4   3
+            2   5
+            """
+        )
+
+        left, right = parse_columns(input, 2)
+
+        self.assertEqual(left, array.array("q", [3, 4, 2]))
+        self.assertEqual(right, array.array("q", [4, 3, 5]))
+
+    def test_parse_columns_raises_error_for_incomplete_row(self):
+        with self.assertRaises(ValueError):
+            parse_columns("1 2\n3\n", 2)
+
+    def test_parse_rows_returns_ragged_rows(self):
+        input = textwrap.dedent(
+            """
+            7 6 4 2 1
+            1 2
+
+            -9
+            """
+        )
+
+        values, offsets = parse_rows(input)
+
+        self.assertEqual(offsets, array.array("q", [0, 5, 7, 7, 8]))
+        self.assertEqual(
+            [list(row) for row in iter_rows(values, offsets)],
+            [[7, 6, 4, 2, 1], [1, 2], [], [-9]],
+        )
+
+    def test_parsers_return_same_integers_for_any_chunk_size(self):
+        input = "".join(f"{i} {-i} {i * 7}\n" for i in range(100))
+
+        for chunk_size in (1, 5, 64, CHUNK_SIZE):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    parse_ints(input, chunk_size=chunk_size), parse_ints(input)
+                )
+                self.assertEqual(
+                    parse_rows(input.encode("utf-8"), chunk_size=chunk_size),
+                    parse_rows(input),
+                )
+
+    def test_parsers_return_nothing_for_empty_input(self):
+        self.assertEqual(parse_ints(""), array.array("q"))
+        self.assertEqual(parse_rows("\n\n"), (array.array("q"), array.array("q", [0])))
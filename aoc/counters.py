@@ -0,0 +1,106 @@
+#
+# Named counters that solutions increment in their hot loops (e.g. the number
+# of states popped from a priority queue) to see how much work they do.
+#
+# Usage:
+#
+#     from aoc import counters
+#     ...
+#     states_visited += 1
+#     ...
+#     counters.count("hike states visited", states_visited)
+#     counters.count_cache("arrangements", get_count)
+#
+# Counters in hot loops are best kept in local variables and reported once,
+# so that the instrumentation does not slow the solutions down. Unlike times,
+# the counted values do not depend on the machine or interpreter, so they
+# reveal complexity regressions reliably.
+#
+# Counting is disabled (and the functions do nothing) unless it is enabled,
+# e.g. by python -m aoc.run --counters or python -m aoc.profiling --counters.
+#
+
+import collections
+import contextlib
+import functools
+import unittest
+
+
+values = collections.Counter()
+enabled = False
+
+
+def count(name, n=1):
+    if enabled:
+        values[name] += n
+
+
+def count_cache(name, function, since=None):
+    # Counts hits and misses of the cache of a function decorated with
+    # functools.cache. For caches that outlive a single run (e.g. on the
+    # module level), pass the cache_info() from the start of the run as since.
+    if enabled:
+        info = function.cache_info()
+        values[f"{name} cache hits"] += info.hits - (since.hits if since else 0)
+        values[f"{name} cache misses"] += info.misses - (since.misses if since else 0)
+
+
+@contextlib.contextmanager
+def counting(enable=True):
+    # Enables counting from zero and yields the counted values.
+    global enabled
+    values.clear()
+    enabled = enable
+    try:
+        yield values
+    finally:
+        enabled = False
+
+
+def format_counters(counters):
+    if not counters:
+        return "no counters\n"
+    width = max(map(len, counters))
+    return "".join(
+        f"{name:<{width}} {value:>14,}\n" for name, value in sorted(counters.items())
+    )
+
+
+class Tests(unittest.TestCase):
+    def test_count_does_nothing_when_counting_is_disabled(self):
+        values.clear()
+
+        count("pops")
+
+        self.assertEqual(values, {})
+
+    def test_counting_counts_from_zero_and_disables_counting_at_end(self):
+        values["pops"] = 10
+
+        with counting() as counted:
+            count("pops")
+            count("pushes", 2)
+
+        self.assertEqual(counted, {"pops": 1, "pushes": 2})
+        self.assertFalse(enabled)
+
+    def test_count_cache_counts_hits_and_misses_since_given_info(self):
+        @functools.cache
+        def square(n):
+            return n * n
+
+        square(1)
+        since = square.cache_info()
+        with counting() as counted:
+            square(1)
+            square(2)
+            square(2)
+            count_cache("squares", square, since)
+
+        self.assertEqual(counted, {"squares cache hits": 2, "squares cache misses": 1})
+
+    def test_format_counters_aligns_values(self):
+        self.assertEqual(
+            format_counters({"pops": 1234, "cache hits": 5}),
+            f"cache hits {5:>14,}\npops       {1234:>14,}\n",
+        )
@@ -0,0 +1,258 @@
+#
+# Generators of synthetic puzzle inputs of configurable size.
+#
+# Every generator takes a scale and a random number generator and returns an
+# input that is valid for both parts of the day. At scale 1, the input is
+# roughly as large as the official input; grid inputs scale their side, other
+# inputs their line count. Inputs are deterministic for a given seed.
+#
+
+import random
+import string
+import unittest
+
+
+DEFAULT_SEED = 2024
+
+
+def scaled(base, scale):
+    return max(1, round(base * scale))
+
+
+def generate_random_grid(side, tiles, weights, rng):
+    return [rng.choices(tiles, weights, k=side) for _ in range(side)]
+
+
+def format_grid(grid):
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def generate_2023_01(scale, rng):
+    # Calibration document: lines of letters, spelled-out digits, and digits
+    # (at least one digit per line).
+    words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        parts = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                parts.append(rng.choice(words))
+            elif kind < 0.5:
+                parts.append(str(rng.randint(1, 9)))
+            else:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        rng.shuffle(parts)
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
+
+
+def generate_2023_04(scale, rng):
+    # Scratchcards with 10 winning numbers and 25 own numbers. A card never
+    # wins copies of cards past the end of the table.
+    card_count = scaled(200, scale)
+    lines = []
+    for id in range(1, card_count + 1):
+        max_matches = min(10, card_count - id)
+        matches = rng.randint(0, max_matches)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winning = numbers[:10]
+        own = winning[:matches] + numbers[10:]
+        rng.shuffle(own)
+        lines.append(
+            f"Card {id:>{len(str(card_count))}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in own)
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_2023_05(scale, rng):
+    # Almanac: pairs of seeds (starts and lengths of ranges for part 2) and
+    # seven maps. Like in the official input, every map splits the numbers
+    # below 2**32 into consecutive source ranges and shuffles them, so the
+    # destination ranges do not overlap.
+    limit = 2**32
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randint(1, limit // 2 // scaled(10, scale))]
+    lines = ["seeds: " + " ".join(map(str, seeds)), ""]
+    names = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    for src_name, dst_name in zip(names, names[1:]):
+        lines.append(f"{src_name}-to-{dst_name} map:")
+        range_count = scaled(40, scale)
+        cuts = [0] + sorted(rng.sample(range(1, limit), range_count - 1)) + [limit]
+        lengths = [b - a for a, b in zip(cuts, cuts[1:])]
+        order = list(range(range_count))
+        rng.shuffle(order)
+        dst = 0
+        dsts = [0] * range_count
+        for i in order:
+            dsts[i] = dst
+            dst += lengths[i]
+        ranges = [
+            f"{dsts[i]} {cuts[i]} {lengths[i]}"
+            for i in range(range_count)
+            # Leave a few numbers unmapped (they map to themselves).
+            if rng.random() > 0.05
+        ]
+        rng.shuffle(ranges)
+        lines += ranges + [""]
+    return "\n".join(lines)
+
+
+def generate_2023_09(scale, rng):
+    # Histories of 21 values produced by polynomials of degree at most 6 (so
+    # that the differences eventually reach all zeroes).
+    lines = []
+    for _ in range(scaled(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_2023_14(scale, rng):
+    # Platform with rounded rocks (O), cube-shaped rocks (#), and empty space.
+    side = scaled(100, scale)
+    return format_grid(generate_random_grid(side, "O#.", [20, 15, 65], rng))
+
+
+def generate_2023_16(scale, rng):
+    # Contraption with mirrors and splitters.
+    side = scaled(110, scale)
+    return format_grid(generate_random_grid(side, "./\\|-", [90, 2, 2, 3, 3], rng))
+
+
+def generate_2024_01(scale, rng):
+    # Two columns of five-digit location IDs.
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+        for _ in range(scaled(1000, scale))
+    )
+
+
+def generate_2024_02(scale, rng):
+    # Reports of 5 to 8 levels, most of them changing slowly so that a good
+    # portion of reports is safe.
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        level = rng.randint(1, 99)
+        direction = rng.choice((-1, 1))
+        levels = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += direction * rng.choice((0, 1, 1, 2, 2, 3, 3, 4))
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_2024_06(scale, rng):
+    # Lab map with obstructions (#) and a guard (^) that leaves the map when
+    # she patrols it (otherwise part 1 would never finish).
+    side = scaled(130, scale)
+    while True:
+        map = generate_random_grid(side, ".#", [97, 3], rng)
+        i, j = rng.randrange(side), rng.randrange(side)
+        map[i][j] = "^"
+        if guard_leaves_map(map, i, j):
+            return format_grid(map)
+
+
+def guard_leaves_map(map, i, j):
+    di, dj = -1, 0
+    visited = set()
+    while (i, j, di, dj) not in visited:
+        visited.add((i, j, di, dj))
+        next_i, next_j = i + di, j + dj
+        if not (0 <= next_i < len(map) and 0 <= next_j < len(map[next_i])):
+            return True
+        if map[next_i][next_j] == "#":
+            di, dj = dj, -di
+        else:
+            i, j = next_i, next_j
+    return False
+
+
+def generate_2024_22(scale, rng):
+    # Initial secret numbers of the buyers.
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(scaled(1600, scale)))
+
+
+GENERATORS = {
+    "2023/01": generate_2023_01,
+    "2023/04": generate_2023_04,
+    "2023/05": generate_2023_05,
+    "2023/09": generate_2023_09,
+    "2023/14": generate_2023_14,
+    "2023/16": generate_2023_16,
+    "2024/01": generate_2024_01,
+    "2024/02": generate_2024_02,
+    "2024/06": generate_2024_06,
+    "2024/22": generate_2024_22,
+}
+
+
+def get_generator(solution):
+    return GENERATORS.get(f"{solution.year}/{solution.day:02}")
+
+
+def generate_input(solution, scale, seed=DEFAULT_SEED):
+    generator = get_generator(solution)
+    if generator is None:
+        raise ValueError(f"no input generator for {solution.name}")
+    return generator(scale, random.Random(seed))
+
+
+class Tests(unittest.TestCase):
+    def test_generators_are_deterministic_for_given_seed(self):
+        for name, generator in GENERATORS.items():
+            with self.subTest(name=name):
+                self.assertEqual(
+                    generator(0.1, random.Random(1)), generator(0.1, random.Random(1))
+                )
+
+    def test_grid_generators_scale_grid_side(self):
+        for generator in (generate_2023_14, generate_2023_16, generate_2024_06):
+            with self.subTest(generator=generator.__name__):
+                small = generator(0.5, random.Random(1)).split()
+                large = generator(1, random.Random(1)).split()
+                self.assertEqual(len(small), len(small[0]))
+                self.assertEqual(len(large), len(large[0]))
+                self.assertEqual(len(large), 2 * len(small))
+
+    def test_line_generators_scale_line_count(self):
+        input = generate_2024_01(2, random.Random(1))
+
+        self.assertEqual(input.count("\n"), 2000)
+
+    def test_generate_2023_04_never_wins_cards_past_end_of_table(self):
+        input = generate_2023_04(0.1, random.Random(1))
+
+        lines = input.strip().split("\n")
+        for i, line in enumerate(lines):
+            winning, own = line.split(":")[1].split("|")
+            matches = len(set(winning.split()) & set(own.split()))
+            self.assertLessEqual(i + matches, len(lines) - 1)
+
+    def test_generate_2024_06_places_guard_that_leaves_map(self):
+        map = [list(row) for row in generate_2024_06(0.2, random.Random(1)).split()]
+
+        i = next(i for i, row in enumerate(map) if "^" in row)
+        self.assertTrue(guard_leaves_map(map, i, map[i].index("^")))
+
+    def test_guard_leaves_map_detects_loop(self):
+        map = [list(row) for row in [".#..", "...#", "#^..", "..#."]]
+
+        self.assertFalse(guard_leaves_map(map, 2, 1))
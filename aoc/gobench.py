@@ -0,0 +1,211 @@
+#
+# Runs the Go benchmarks (testing.B) of the 2020 solutions and collects their
+# ns/op, B/op, and allocs/op into a single table.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.gobench [--benchtime T] [SELECTOR ...]
+#
+# Every Go solution lives in YEAR/DD/partN/aocDD.go, and its benchmarks in
+# aocDD_test.go next to it (run them for a single part by `make bench` in its
+# directory). The benchmarks run one part at a time, so that they do not
+# compete for the CPU. The solutions predate Go modules, so they are built in
+# GOPATH mode (GO111MODULE=off).
+#
+
+import argparse
+import dataclasses
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import sys
+import unittest
+
+from aoc import solutions
+
+
+GO_SOLUTION_FILE_RE = re.compile(r"aoc(\d\d)\.go")
+# E.g. "BenchmarkPlayGame-8   636819   1938 ns/op   1384 B/op   24 allocs/op"
+# (the -8 suffix is GOMAXPROCS, omitted when it is 1). Names of sub-benchmarks
+# contain slashes (e.g. BenchmarkPerformMove/LinkedGame/1000000).
+BENCHMARK_LINE_RE = re.compile(
+    r"Benchmark(\S+?)(?:-\d+)?\s+(\d+)\s+([\d.]+) ns/op"
+    r"(?:\s+(\d+) B/op\s+(\d+) allocs/op)?"
+)
+
+
+@dataclasses.dataclass
+class GoBenchmark:
+    solution: solutions.Solution
+    # Without the Benchmark prefix.
+    name: str
+    iterations: int
+    ns_per_op: float
+    # None when the benchmark was not run with -benchmem.
+    bytes_per_op: int | None
+    allocs_per_op: int | None
+
+
+def discover_go_solutions(root_dir=solutions.ROOT_DIR):
+    go_solutions = []
+    for path in pathlib.Path(root_dir).glob(
+        "[0-9][0-9][0-9][0-9]/[0-9][0-9]/part[0-9]/*.go"
+    ):
+        m = GO_SOLUTION_FILE_RE.fullmatch(path.name)
+        if m is None or m.group(1) != path.parent.parent.name:
+            continue
+        go_solutions.append(
+            solutions.Solution(
+                int(path.parent.parent.parent.name),
+                int(m.group(1)),
+                int(path.parent.name.removeprefix("part")),
+                path,
+            )
+        )
+    return sorted(go_solutions)
+
+
+def parse_benchmark_output(solution, output):
+    benchmarks = []
+    for line in output.splitlines():
+        m = BENCHMARK_LINE_RE.fullmatch(line.strip())
+        if m is not None:
+            benchmarks.append(
+                GoBenchmark(
+                    solution,
+                    m.group(1),
+                    int(m.group(2)),
+                    float(m.group(3)),
+                    int(m.group(4)) if m.group(4) is not None else None,
+                    int(m.group(5)) if m.group(5) is not None else None,
+                )
+            )
+    return benchmarks
+
+
+def run_benchmarks(solution, benchtime=None):
+    # Raises subprocess.CalledProcessError when the benchmarks fail to build
+    # or run.
+    completed = subprocess.run(
+        ["go", "test", "-run=^$", "-bench=.", "-benchmem"]
+        + ([f"-benchtime={benchtime}"] if benchtime is not None else []),
+        cwd=solution.path.parent,
+        env={**os.environ, "GO111MODULE": "off"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_benchmark_output(solution, completed.stdout)
+
+
+def format_optional_count(count):
+    return f"{count:,}" if count is not None else "-"
+
+
+def format_benchmark(benchmark):
+    return (
+        f"{benchmark.solution.name:<10} {benchmark.ns_per_op:>16,.1f} "
+        f"{format_optional_count(benchmark.bytes_per_op):>13} "
+        f"{format_optional_count(benchmark.allocs_per_op):>10}  {benchmark.name}"
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.gobench",
+        description="Runs Go benchmarks of Advent of Code solutions.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all Go solutions)",
+    )
+    parser.add_argument(
+        "--benchtime",
+        help="time (e.g. 2s) or number of iterations (e.g. 100x) per benchmark "
+        "(default: go test's default of 1s)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(discover_go_solutions(), args.selectors)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    if shutil.which("go") is None:
+        sys.exit("error: go not found on PATH")
+
+    failed = False
+    print(f"{'Solution':<10} {'ns/op':>16} {'B/op':>13} {'allocs/op':>10}  Benchmark")
+    for solution in selected:
+        try:
+            benchmarks = run_benchmarks(solution, args.benchtime)
+        except subprocess.CalledProcessError as e:
+            error = e.stdout.strip() or e.stderr.strip()
+            print(f"{solution.name:<10} ERROR ({error})")
+            failed = True
+            continue
+        if not benchmarks:
+            print(f"{solution.name:<10} no benchmarks")
+        for benchmark in benchmarks:
+            print(format_benchmark(benchmark), flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    SOLUTION = solutions.Solution(2020, 22, 2, pathlib.Path("aoc22.go"))
+
+    def test_discover_go_solutions_finds_both_parts_of_all_2020_days(self):
+        go_solutions = discover_go_solutions()
+
+        self.assertEqual(len(go_solutions), 50)
+        self.assertEqual(go_solutions[0].name, "2020/01/1")
+        self.assertEqual(go_solutions[-1].path.name, "aoc25.go")
+
+    def test_parse_benchmark_output_returns_benchmarks_and_sub_benchmarks(self):
+        output = (
+            "goos: linux\n"
+            "BenchmarkPlayGameForExampleFromAssignment-8 \t   21504\t"
+            "     54759 ns/op\t    6719 B/op\t     377 allocs/op\n"
+            "BenchmarkComputeEncryptionKey \t41002592\t        28.42 ns/op\n"
+            "BenchmarkPerformMove/Game/1000000-8 \t     438\t"
+            "   2801208 ns/op\t       0 B/op\t       0 allocs/op\n"
+            "PASS\n"
+        )
+
+        self.assertEqual(
+            parse_benchmark_output(self.SOLUTION, output),
+            [
+                GoBenchmark(
+                    self.SOLUTION,
+                    "PlayGameForExampleFromAssignment",
+                    21504,
+                    54759.0,
+                    6719,
+                    377,
+                ),
+                GoBenchmark(
+                    self.SOLUTION, "ComputeEncryptionKey", 41002592, 28.42, None, None
+                ),
+                GoBenchmark(
+                    self.SOLUTION, "PerformMove/Game/1000000", 438, 2801208.0, 0, 0
+                ),
+            ],
+        )
+
+    def test_format_benchmark_contains_all_stats(self):
+        benchmark = GoBenchmark(self.SOLUTION, "PlayGame", 21504, 54759.0, 6719, 377)
+
+        self.assertEqual(
+            format_benchmark(benchmark).split(),
+            ["2020/22/2", "54,759.0", "6,719", "377", "PlayGame"],
+        )
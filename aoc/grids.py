@@ -0,0 +1,197 @@
+#
+# A two-dimensional grid of one-character tiles stored in a flat bytearray.
+#
+# The grid is surrounded by a one-tile border of OUTSIDE tiles, so moving one
+# step from any tile inside the grid never needs a bounds check: the position
+# either holds a tile or OUTSIDE. Positions are plain integers (indexes into
+# the bytearray) and moving in a direction means adding its offset, e.g.
+# grid.up, grid.right, grid.down, or grid.left.
+#
+# Usage:
+#
+#     grid = Grid.from_text(input)
+#     pos = grid.find("S")
+#     for d in grid.directions:
+#         if grid.cells[pos + d] == WALL:  # WALL = ord("#")
+#             ...
+#
+
+import textwrap
+import unittest
+
+
+# The value of tiles in the border around the grid.
+OUTSIDE = 0
+
+
+class Grid:
+    def __init__(self, height, width, fill="."):
+        self.height = height
+        self.width = width
+        # Every row is prefixed and suffixed by a border tile.
+        self.stride = width + 2
+        border = bytes(self.stride)
+        row = b"\0" + fill.encode("ascii") * width + b"\0"
+        self.cells = bytearray(border + row * height + border)
+
+        # Offsets of neighboring positions.
+        self.up = -self.stride
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        # In clockwise order, starting with up, so turning right means going
+        # to the next direction.
+        self.directions = (self.up, self.right, self.down, self.left)
+        self.diagonals = (
+            self.up + self.left,
+            self.up + self.right,
+            self.down + self.right,
+            self.down + self.left,
+        )
+        self.neighbors8 = self.directions + self.diagonals
+
+    @staticmethod
+    def from_text(text):
+        return Grid.from_lines(text.strip("\n").split("\n"))
+
+    @staticmethod
+    def from_lines(lines):
+        width = len(lines[0]) if lines else 0
+        grid = Grid(0, width)
+        border = bytes(grid.stride)
+        rows = []
+        for line in lines:
+            if len(line) != width:
+                raise ValueError("all grid lines have to be of the same length")
+            rows.append(b"\0" + line.encode("ascii") + b"\0")
+        grid.height = len(lines)
+        grid.cells = bytearray(border + b"".join(rows) + border)
+        return grid
+
+    def pos(self, i, j):
+        return (i + 1) * self.stride + j + 1
+
+    def coords(self, pos):
+        i, j = divmod(pos, self.stride)
+        return i - 1, j - 1
+
+    def is_inside(self, pos):
+        return self.cells[pos] != OUTSIDE
+
+    def __getitem__(self, pos):
+        return chr(self.cells[pos])
+
+    def __setitem__(self, pos, tile):
+        self.cells[pos] = ord(tile)
+
+    def positions(self):
+        # All positions inside the grid, row by row.
+        for i in range(self.height):
+            start = (i + 1) * self.stride + 1
+            yield from range(start, start + self.width)
+
+    def find(self, tile):
+        pos = self.cells.find(ord(tile))
+        if pos == -1:
+            raise AssertionError(f"tile {tile} not found")
+        return pos
+
+    def find_all(self, tile):
+        tile = ord(tile)
+        pos = self.cells.find(tile)
+        while pos != -1:
+            yield pos
+            pos = self.cells.find(tile, pos + 1)
+
+    def count(self, tile):
+        return self.cells.count(ord(tile))
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def rows(self):
+        for i in range(self.height):
+            start = (i + 1) * self.stride + 1
+            yield self.cells[start : start + self.width].decode("ascii")
+
+    def __str__(self):
+        return "\n".join(self.rows())
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.grid = Grid.from_text(
+            textwrap.dedent(
+                """
+                #S.
+                ..#
+                """
+            )
+        )
+
+    def test_from_text_creates_grid_with_border(self):
+        self.assertEqual(self.grid.height, 2)
+        self.assertEqual(self.grid.width, 3)
+        self.assertEqual(self.grid.stride, 5)
+        self.assertEqual(
+            self.grid.cells, bytearray(b"\0\0\0\0\0\0#S.\0\0..#\0\0\0\0\0\0")
+        )
+
+    def test_from_text_raises_error_for_lines_of_different_length(self):
+        with self.assertRaises(ValueError):
+            Grid.from_text("..\n.\n")
+
+    def test_init_creates_filled_grid_with_border(self):
+        grid = Grid(2, 1, fill="#")
+
+        self.assertEqual(grid.cells, bytearray(b"\0\0\0\0#\0\0#\0\0\0\0"))
+
+    def test_pos_and_coords_are_inverse(self):
+        pos = self.grid.pos(1, 2)
+
+        self.assertEqual(self.grid[pos], "#")
+        self.assertEqual(self.grid.coords(pos), (1, 2))
+
+    def test_moving_out_of_grid_reaches_outside_tile(self):
+        pos = self.grid.find("S")
+
+        self.assertFalse(self.grid.is_inside(pos + self.grid.up))
+        self.assertTrue(self.grid.is_inside(pos + self.grid.down))
+        self.assertEqual(self.grid[pos + self.grid.left], "#")
+
+    def test_directions_are_in_clockwise_order(self):
+        pos = self.grid.pos(0, 0)
+
+        self.assertEqual(
+            [self.grid.coords(pos + d) for d in self.grid.directions],
+            [(-1, 0), (0, 1), (1, 0), (0, -1)],
+        )
+
+    def test_positions_returns_only_positions_inside_grid(self):
+        self.assertEqual(
+            [self.grid[pos] for pos in self.grid.positions()], list("#S...#")
+        )
+
+    def test_find_returns_position_of_first_tile(self):
+        self.assertEqual(self.grid.coords(self.grid.find("#")), (0, 0))
+
+    def test_find_raises_error_when_tile_is_not_found(self):
+        with self.assertRaises(AssertionError):
+            self.grid.find("E")
+
+    def test_find_all_returns_positions_of_all_tiles(self):
+        self.assertEqual(
+            [self.grid.coords(pos) for pos in self.grid.find_all("#")],
+            [(0, 0), (1, 2)],
+        )
+
+    def test_copy_returns_independent_grid(self):
+        grid = self.grid.copy()
+        grid[grid.pos(0, 2)] = "O"
+
+        self.assertEqual(str(grid), "#SO\n..#")
+        self.assertEqual(str(self.grid), "#S.\n..#")
+        self.assertEqual(grid.count("O"), 1)
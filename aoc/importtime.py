@@ -0,0 +1,219 @@
+#
+# Measures how long it takes to import the selected solutions (python -X
+# importtime) and aggregates the import costs per solution and per module.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.importtime [-n RUNS] [--top N] [SELECTOR ...]
+#
+# Every solution is loaded in a fresh interpreter. Modules that the
+# interpreter imports on its own (at startup or to load the solution) are
+# measured separately and subtracted, so the reported costs are only those of
+# the imports of the solution (and of the aoc modules it uses).
+#
+
+import argparse
+import dataclasses
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+from aoc import run
+from aoc import solutions
+
+
+IMPORTTIME_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+DEFAULT_TOP = 20
+
+# Loads the solution at the path given as the first argument (or nothing when
+# there is no argument, to measure the imports needed to load a solution).
+LOAD_SOLUTION_CODE = (
+    "import importlib.util, sys\n"
+    "if len(sys.argv) > 1:\n"
+    "    spec = importlib.util.spec_from_file_location('solution', sys.argv[1])\n"
+    "    spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+)
+
+
+@dataclasses.dataclass
+class ImportTime:
+    module: str
+    # In seconds.
+    self_time: float
+    cumulative_time: float
+    # 0 for modules imported directly, 1 for modules imported by them, etc.
+    depth: int
+
+
+def parse_importtime(output):
+    import_times = []
+    for line in output.splitlines():
+        m = IMPORTTIME_LINE_RE.fullmatch(line)
+        if m is not None:
+            import_times.append(
+                ImportTime(
+                    m.group(4),
+                    int(m.group(1)) / 1_000_000,
+                    int(m.group(2)) / 1_000_000,
+                    (len(m.group(3)) - 1) // 2,
+                )
+            )
+    return import_times
+
+
+def measure_imports(path=None):
+    # Returns import times of all modules imported by a fresh interpreter that
+    # loads the solution at the given path.
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_SOLUTION_CODE]
+        + ([str(path)] if path is not None else []),
+        cwd=solutions.ROOT_DIR,
+        env={**os.environ, "PYTHONPATH": str(solutions.ROOT_DIR)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def audit_solution(solution, baseline_modules, runs=1):
+    # Returns a mapping of modules imported because of the solution to their
+    # self times (the minimum over the runs).
+    self_times = {}
+    for _ in range(runs):
+        for import_time in measure_imports(solution.path):
+            if import_time.module not in baseline_modules:
+                self_times[import_time.module] = min(
+                    self_times.get(import_time.module, float("inf")),
+                    import_time.self_time,
+                )
+    return self_times
+
+
+def aggregate_per_module(self_times_per_solution):
+    # Returns a mapping of modules to (total self time, number of solutions
+    # importing the module), ordered from the most expensive module.
+    per_module = {}
+    for self_times in self_times_per_solution.values():
+        for module, self_time in self_times.items():
+            total, count = per_module.get(module, (0.0, 0))
+            per_module[module] = (total + self_time, count + 1)
+    return dict(sorted(per_module.items(), key=lambda item: -item[1][0]))
+
+
+def format_most_expensive_modules(self_times, count=3):
+    most_expensive = sorted(self_times.items(), key=lambda item: -item[1])[:count]
+    return ", ".join(
+        f"{module} {run.format_duration(self_time)}"
+        for module, self_time in most_expensive
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.importtime",
+        description="Measures import costs of Advent of Code solutions.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all solutions)",
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=3,
+        help="number of measurements per solution, the minimum is reported "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of reported solutions and modules (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+    baseline_modules = {import_time.module for import_time in measure_imports()}
+    self_times_per_solution = {
+        solution: audit_solution(solution, baseline_modules, args.runs)
+        for solution in selected
+    }
+
+    print("Most expensive solutions to import:")
+    for solution, self_times in sorted(
+        self_times_per_solution.items(), key=lambda item: -sum(item[1].values())
+    )[: args.top]:
+        print(
+            f"{solution.name:<10} {run.format_duration(sum(self_times.values())):>10}"
+            f"  {format_most_expensive_modules(self_times)}"
+        )
+
+    print("\nMost expensive modules to import:")
+    print(f"{'Module':<30} {'Total':>10} {'Per import':>10} {'Solutions':>9}")
+    for module, (total, count) in list(
+        aggregate_per_module(self_times_per_solution).items()
+    )[: args.top]:
+        print(
+            f"{module:<30} {run.format_duration(total):>10} "
+            f"{run.format_duration(total / count):>10} {count:>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def test_parse_importtime_returns_times_and_depths(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       398 |       3817 |   networkx.drawing\n"
+            "import time:      5240 |     229293 | networkx\n"
+        )
+
+        self.assertEqual(
+            parse_importtime(output),
+            [
+                ImportTime("networkx.drawing", 0.000398, 0.003817, 1),
+                ImportTime("networkx", 0.00524, 0.229293, 0),
+            ],
+        )
+
+    def test_aggregate_per_module_sums_times_and_counts_solutions(self):
+        per_solution = {
+            "a": {"re": 0.002, "heapq": 0.001},
+            "b": {"heapq": 0.003},
+        }
+
+        self.assertEqual(
+            list(aggregate_per_module(per_solution).items()),
+            [("heapq", (0.004, 2)), ("re", (0.002, 1))],
+        )
+
+    def test_audit_solution_reports_only_imports_of_solution(self):
+        solution = next(
+            s for s in solutions.discover_solutions() if s.name == "2024/16/1"
+        )
+        baseline_modules = {import_time.module for import_time in measure_imports()}
+
+        self_times = audit_solution(solution, baseline_modules)
+
+        self.assertIn("heapq", self_times)
+        self.assertIn("aoc.grids", self_times)
+        self.assertNotIn("importlib.util", self_times)
@@ -0,0 +1,135 @@
+#
+# Lazy access to puzzle inputs.
+#
+# Instead of reading the whole input into a string and splitting it into a
+# list of lines, solutions can memory-map the input file and iterate over its
+# lines, blank-line-separated blocks, or separator-separated tokens one at a
+# time. This keeps the memory usage constant no matter how large the input is
+# (the operating system pages the mapped file in and out as needed).
+#
+# All the generators accept either a string (e.g. an input from tests or from
+# the runner) or a memory-mapped file (or bytes), so the same parsing code
+# works for both. Like input.strip() in the solutions, blank lines at the start
+# and at the end of the input are skipped.
+#
+# Usage:
+#
+#     with inputs.map_input("input") as input:
+#         for line in inputs.iter_lines(input):
+#             ...
+#
+
+import contextlib
+import mmap
+import os
+import pathlib
+import tempfile
+import textwrap
+import unittest
+
+
+@contextlib.contextmanager
+def map_input(path):
+    with open(path, "rb") as f:
+        # Empty files cannot be memory-mapped.
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as input:
+            yield input
+
+
+def iter_chunks(input, separator):
+    # Yields parts of the input between separators (as strings). The parts
+    # are sliced one by one, so there is never more than one in memory.
+    if not isinstance(input, str):
+        separator = separator.encode("utf-8")
+    start = 0
+    end = len(input)
+    while start < end:
+        stop = input.find(separator, start)
+        if stop == -1:
+            stop = end
+        chunk = input[start:stop]
+        yield chunk if isinstance(chunk, str) else chunk.decode("utf-8")
+        start = stop + len(separator)
+
+
+def iter_lines(input):
+    # Blank lines are held back until a non-blank line follows them so that
+    # trailing blank lines are not yielded.
+    blank_lines = None
+    for line in iter_chunks(input, "\n"):
+        if not line:
+            if blank_lines is not None:
+                blank_lines += 1
+            continue
+        if blank_lines:
+            yield from [""] * blank_lines
+        blank_lines = 0
+        yield line
+
+
+def iter_blocks(input):
+    # Yields lists of lines separated by one or more blank lines.
+    block = []
+    for line in iter_lines(input):
+        if line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def iter_tokens(input, separator=","):
+    # Yields tokens separated by the given separator, stripped of surrounding
+    # whitespace (including the trailing newline).
+    for token in iter_chunks(input, separator):
+        token = token.strip()
+        if token:
+            yield token
+
+
+class Tests(unittest.TestCase):
+    def map_text(self, text):
+        dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        path = dir / "input"
+        path.write_text(text, encoding="utf-8")
+        return self.enterContext(map_input(path))
+
+    def test_iter_lines_returns_lines_without_surrounding_blank_lines(self):
+        input = textwrap.dedent(
+            """
+            1abc2
+
+            pqr3stu8vwx
+            """
+        )
+
+        self.assertEqual(list(iter_lines(input)), ["1abc2", "", "pqr3stu8vwx"])
+
+    def test_iter_lines_returns_last_line_without_trailing_newline(self):
+        self.assertEqual(list(iter_lines("a\nb")), ["a", "b"])
+
+    def test_iter_lines_returns_same_lines_for_mapped_input(self):
+        text = "Card 1: 41 | 83\nCard 2: 13 | 61\n\n"
+
+        self.assertEqual(list(iter_lines(self.map_text(text))), list(iter_lines(text)))
+
+    def test_iter_lines_returns_no_lines_for_empty_input(self):
+        self.assertEqual(list(iter_lines("")), [])
+        self.assertEqual(list(iter_lines(self.map_text(""))), [])
+
+    def test_iter_blocks_returns_blocks_separated_by_blank_lines(self):
+        input = "ab\nc\n\n\nd\n\nef\n"
+
+        self.assertEqual(list(iter_blocks(input)), [["ab", "c"], ["d"], ["ef"]])
+
+    def test_iter_tokens_returns_stripped_tokens(self):
+        input = "rn=1,cm-,qp=3\n"
+        tokens = ["rn=1", "cm-", "qp=3"]
+
+        self.assertEqual(list(iter_tokens(input)), tokens)
+        self.assertEqual(list(iter_tokens(self.map_text(input))), tokens)
@@ -0,0 +1,81 @@
+#
+# Lazy imports of heavy dependencies.
+#
+# A lazily imported module is executed only when one of its attributes is
+# accessed for the first time, so loading a solution (e.g. to collect its
+# tests or to run other solutions in the same process) does not pay for
+# importing dependencies that are never used.
+#
+# Usage:
+#
+#     from aoc import lazy
+#
+#     networkx = lazy.lazy_import("networkx")
+#
+
+import importlib.util
+import pathlib
+import sys
+import tempfile
+import unittest
+
+
+# Names of lazily imported modules that may not have been executed yet.
+pending_modules = set()
+
+
+def lazy_import(name):
+    if name in sys.modules:
+        return sys.modules[name]
+    # Finding the module is cheap and makes a missing module fail right away.
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    pending_modules.add(name)
+    return module
+
+
+def load_pending_modules():
+    # Executes all lazily imported modules (e.g. to warm up a long-running
+    # process).
+    while pending_modules:
+        # Accessing any attribute executes the module.
+        getattr(sys.modules[pending_modules.pop()], "__name__")
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.marker = dir / "executed"
+        (dir / "aoc_lazy_test_module.py").write_text(
+            f"open({str(self.marker)!r}, 'w').close()\nvalue = 42\n",
+            encoding="utf-8",
+        )
+        sys.path.insert(0, str(dir))
+        self.addCleanup(sys.path.remove, str(dir))
+        self.addCleanup(sys.modules.pop, "aoc_lazy_test_module", None)
+        self.addCleanup(pending_modules.discard, "aoc_lazy_test_module")
+
+    def test_lazy_import_executes_module_on_first_attribute_access(self):
+        module = lazy_import("aoc_lazy_test_module")
+
+        self.assertFalse(self.marker.exists())
+        self.assertEqual(module.value, 42)
+        self.assertTrue(self.marker.exists())
+
+    def test_load_pending_modules_executes_lazily_imported_modules(self):
+        lazy_import("aoc_lazy_test_module")
+
+        load_pending_modules()
+
+        self.assertTrue(self.marker.exists())
+        self.assertNotIn("aoc_lazy_test_module", pending_modules)
+
+    def test_lazy_import_raises_error_for_missing_module(self):
+        with self.assertRaises(ModuleNotFoundError):
+            lazy_import("aoc_nonexistent_module")
@@ -0,0 +1,228 @@
+#
+# Runs functions in fresh subprocesses with CPU-time, wall-time, and memory
+# limits, so that a solution blowing up on an input (e.g. enumerating 3^n
+# operator combinations) cannot stall or exhaust the machine.
+#
+# Usage:
+#
+#     from aoc import limits
+#
+#     for value in limits.map_with_limits(
+#         function, items, limits.Limits(cpu_time=10, memory=2**30),
+#         on_failure=lambda item, e: f"{item}: {e}",
+#     ):
+#         ...
+#
+# The CPU time and memory are limited by the subprocess itself (via
+# setrlimit()), so exceeding them raises LimitExceeded or MemoryError inside
+# the function. The wall time is watched by the parent process, which kills
+# subprocesses that run for too long. Both the function and its items are
+# passed to the subprocesses by forking, so they do not need to be picklable
+# (unlike the returned values).
+#
+
+import dataclasses
+import math
+import multiprocessing
+import multiprocessing.connection
+import os
+import resource
+import signal
+import time
+import unittest
+
+
+@dataclasses.dataclass
+class Limits:
+    # In seconds.
+    cpu_time: float | None = None
+    # In seconds.
+    wall_time: float | None = None
+    # In bytes. Limits the data segment of the process (RLIMIT_DATA), which
+    # covers the heap and anonymous memory maps, i.e. practically all memory
+    # that a Python process allocates (unlike RLIMIT_AS, the limit does not
+    # include shared libraries or thread stacks).
+    memory: int | None = None
+
+
+class LimitExceeded(Exception):
+    def __init__(self, limit, value):
+        # limit is "cpu time", "wall time", or "memory".
+        self.limit = limit
+        self.value = value
+        super().__init__(f"{limit} limit of {format_limit(limit, value)} exceeded")
+
+    def __reduce__(self):
+        return LimitExceeded, (self.limit, self.value)
+
+
+# The function and items are passed to the subprocesses by forking (spawned
+# subprocesses, the default on macOS, would need them to be picklable).
+FORK_CONTEXT = multiprocessing.get_context("fork")
+
+# Limits applied in the current process (by apply_limits()).
+applied_limits = Limits()
+
+
+def format_limit(limit, value):
+    if limit == "memory":
+        return f"{value / 2**20:g} MiB"
+    return f"{value:g} s"
+
+
+def apply_limits(limits):
+    global applied_limits
+    applied_limits = limits
+    if limits.cpu_time is not None:
+
+        def raise_cpu_time_exceeded(signum, frame):
+            raise LimitExceeded("cpu time", limits.cpu_time)
+
+        # When the soft limit is reached, the process receives SIGXCPU, which
+        # is turned into an exception. If the process does not stop (e.g. it
+        # is stuck in C code), the hard limit kills it a second later.
+        signal.signal(signal.SIGXCPU, raise_cpu_time_exceeded)
+        cpu_time = math.ceil(limits.cpu_time)
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_time, cpu_time + 1))
+    if limits.memory is not None:
+        resource.setrlimit(resource.RLIMIT_DATA, (limits.memory, limits.memory))
+
+
+def get_exceeded_limit(exception):
+    # Returns the name of the limit whose violation caused the exception (None
+    # when the exception has nothing to do with the limits).
+    if isinstance(exception, LimitExceeded):
+        return exception.limit
+    if isinstance(exception, MemoryError) and applied_limits.memory is not None:
+        return "memory"
+    return None
+
+
+def run_in_child(function, item, limits, writer):
+    apply_limits(limits)
+    writer.send(function(item))
+    writer.close()
+
+
+def get_failure(process, limits):
+    # Returns an exception describing why the process ended without a value.
+    if limits.cpu_time is not None and process.exitcode in (
+        -signal.SIGKILL,
+        -signal.SIGXCPU,
+    ):
+        return LimitExceeded("cpu time", limits.cpu_time)
+    return ChildProcessError(f"the subprocess died with exit code {process.exitcode}")
+
+
+def map_with_limits(function, items, limits, jobs=None, on_failure=None):
+    # Calls the function for every item in a fresh subprocess (at most jobs
+    # subprocesses at the same time) and yields the returned values in the
+    # order of completion. When a subprocess fails to return a value (e.g. it
+    # was killed after exceeding the wall time), on_failure(item, exception)
+    # is yielded instead (or the exception is raised without on_failure).
+    jobs = jobs or os.cpu_count()
+    items_to_run = list(reversed(list(items)))
+    # Format: reader: (process, item, deadline)
+    running = {}
+    while items_to_run or running:
+        while items_to_run and len(running) < jobs:
+            item = items_to_run.pop()
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            process = FORK_CONTEXT.Process(
+                target=run_in_child, args=(function, item, limits, writer)
+            )
+            process.start()
+            # Only the child writes into the pipe, so the reader gets an EOF
+            # when the child dies without sending a value.
+            writer.close()
+            deadline = (
+                time.monotonic() + limits.wall_time
+                if limits.wall_time is not None
+                else math.inf
+            )
+            running[reader] = (process, item, deadline)
+
+        next_deadline = min(deadline for _, _, deadline in running.values())
+        timeout = (
+            max(next_deadline - time.monotonic(), 0)
+            if next_deadline != math.inf
+            else None
+        )
+        finished = multiprocessing.connection.wait(list(running), timeout)
+        for reader in list(running):
+            process, item, deadline = running[reader]
+            if reader in finished:
+                try:
+                    value = reader.recv()
+                    failure = None
+                except EOFError:
+                    process.join()
+                    failure = get_failure(process, limits)
+            elif time.monotonic() >= deadline:
+                process.kill()
+                failure = LimitExceeded("wall time", limits.wall_time)
+            else:
+                continue
+            del running[reader]
+            reader.close()
+            process.join()
+            if failure is None:
+                yield value
+            elif on_failure is None:
+                raise failure
+            else:
+                yield on_failure(item, failure)
+
+
+class Tests(unittest.TestCase):
+    def map_with_limits(self, function, items, limits):
+        return list(
+            map_with_limits(
+                function, items, limits, on_failure=lambda item, e: (item, e)
+            )
+        )
+
+    def test_map_with_limits_returns_values_computed_in_subprocesses(self):
+        values = self.map_with_limits(lambda n: (n, os.getpid()), [1, 2], Limits())
+
+        self.assertEqual(sorted(n for n, _ in values), [1, 2])
+        self.assertNotIn(os.getpid(), [pid for _, pid in values])
+
+    def test_map_with_limits_kills_subprocess_exceeding_wall_time(self):
+        start = time.monotonic()
+
+        [(item, e)] = self.map_with_limits(time.sleep, [10], Limits(wall_time=0.1))
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(item, 10)
+        self.assertEqual(e.limit, "wall time")
+        self.assertEqual(str(e), "wall time limit of 0.1 s exceeded")
+
+    def test_exceeding_cpu_time_raises_exception_in_subprocess(self):
+        def spin(_):
+            try:
+                while True:
+                    pass
+            except LimitExceeded as e:
+                return get_exceeded_limit(e)
+
+        self.assertEqual(
+            self.map_with_limits(spin, [None], Limits(cpu_time=0.1)), ["cpu time"]
+        )
+
+    def test_exceeding_memory_raises_memory_error_in_subprocess(self):
+        def allocate(size):
+            try:
+                return len(bytearray(size))
+            except MemoryError as e:
+                return get_exceeded_limit(e)
+
+        self.assertEqual(
+            self.map_with_limits(allocate, [2**30], Limits(memory=2**28)), ["memory"]
+        )
+
+    def test_map_with_limits_reports_subprocess_that_died(self):
+        [(_, e)] = self.map_with_limits(os._exit, [3], Limits())
+
+        self.assertIsInstance(e, ChildProcessError)
+        self.assertIn("exit code 3", str(e))
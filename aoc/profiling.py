@@ -0,0 +1,341 @@
+#
+# Runs solutions under a profiler and writes the hottest functions or
+# allocation sites into a report file.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.profiling (--profile | --sample | --tracemalloc)
+#         [--counters] [--top N] [-o REPORT] [--input PATH] SELECTOR ...
+#
+# --profile runs run_program() under cProfile (exact but with a considerable
+# overhead), --sample under a statistical profiler that periodically samples
+# the call stack (low overhead), and --tracemalloc traces memory allocations
+# and reports the allocation sites at the peak memory usage.
+#
+# --counters additionally reports named counters that solutions increment in
+# their hot loops (see counters.py).
+#
+
+import argparse
+import cProfile
+import collections
+import io
+import pathlib
+import pstats
+import signal
+import sys
+import tempfile
+import textwrap
+import time
+import tracemalloc
+import unittest
+
+from aoc import counters
+from aoc import run
+from aoc import solutions
+
+
+DEFAULT_TOP = 20
+DEFAULT_REPORT_PATH = solutions.ROOT_DIR / "profile-report.txt"
+# In seconds.
+DEFAULT_SAMPLING_INTERVAL = 0.001
+# Take a new allocation snapshot only after the traced memory has grown by
+# this ratio since the last snapshot (snapshots are expensive).
+SNAPSHOT_GROWTH_RATIO = 1.1
+
+
+def profile_calls(function, input, top=DEFAULT_TOP):
+    # Returns (result, report).
+    profile = cProfile.Profile()
+    result = profile.runcall(function, input)
+    report = io.StringIO()
+    stats = pstats.Stats(profile, stream=report)
+    stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return result, report.getvalue().strip("\n") + "\n"
+
+
+def format_frame(frame):
+    code = frame.f_code
+    file_name = pathlib.Path(code.co_filename).name
+    return f"{code.co_name} ({file_name}:{code.co_firstlineno})"
+
+
+def call_with_timer(function, input, handler, interval):
+    # Calls handler(frame) every interval seconds of CPU time while function
+    # is running. Signals that arrive while the handler is still running
+    # (e.g. during a slow allocation snapshot) are ignored.
+    in_handler = False
+
+    def handle_signal(signum, frame):
+        nonlocal in_handler
+        if not in_handler:
+            in_handler = True
+            try:
+                handler(frame)
+            finally:
+                in_handler = False
+
+    previous_handler = signal.signal(signal.SIGPROF, handle_signal)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        return function(input)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous_handler)
+
+
+def sample_stacks(function, input, top=DEFAULT_TOP, interval=DEFAULT_SAMPLING_INTERVAL):
+    # Returns (result, report). Every sample counts towards the function that
+    # was running (self) and towards every function on the stack (total).
+    self_samples = collections.Counter()
+    total_samples = collections.Counter()
+    sample_count = 0
+
+    def take_sample(frame):
+        nonlocal sample_count
+        sample_count += 1
+        self_samples[format_frame(frame)] += 1
+        on_stack = set()
+        while frame is not None:
+            on_stack.add(format_frame(frame))
+            frame = frame.f_back
+        total_samples.update(on_stack)
+
+    result = call_with_timer(function, input, take_sample, interval)
+
+    lines = [
+        f"{sample_count} samples taken every {interval * 1000:g} ms of CPU time",
+        "",
+        f"{'self':>7} {'total':>7}  function",
+    ]
+    for name, samples in self_samples.most_common(top):
+        lines.append(
+            f"{samples / sample_count:>7.1%} "
+            f"{total_samples[name] / sample_count:>7.1%}  {name}"
+        )
+    return result, "\n".join(lines) + "\n"
+
+
+def trace_allocations(
+    function, input, top=DEFAULT_TOP, interval=DEFAULT_SAMPLING_INTERVAL
+):
+    # Returns (result, report). tracemalloc does not keep track of the peak
+    # per allocation site, so snapshots are taken periodically whenever the
+    # traced memory grows and the one closest to the peak is reported.
+    snapshot = None
+    snapshot_size = 0
+
+    def take_snapshot_if_grown(frame):
+        nonlocal snapshot, snapshot_size
+        size, _ = tracemalloc.get_traced_memory()
+        if size > snapshot_size * SNAPSHOT_GROWTH_RATIO:
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_size = size
+
+    tracemalloc.start()
+    try:
+        result = call_with_timer(function, input, take_snapshot_if_grown, interval)
+        _, peak_size = tracemalloc.get_traced_memory()
+        if snapshot is None:
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+    )
+    lines = [
+        f"peak traced memory {run.format_size(peak_size)}, "
+        f"snapshot at {run.format_size(snapshot_size)}",
+        "",
+        f"{'size':>10} {'blocks':>8}  allocation site",
+    ]
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{run.format_size(stat.size):>10} {stat.count:>8}  "
+            f"{pathlib.Path(frame.filename).name}:{frame.lineno}"
+        )
+    return result, "\n".join(lines) + "\n"
+
+
+PROFILERS = {
+    "profile": profile_calls,
+    "sample": sample_stacks,
+    "tracemalloc": trace_allocations,
+}
+
+
+def profile_solution(solution, input, profiler, top=DEFAULT_TOP, with_counters=False):
+    # Returns (answer, report).
+    module = solutions.load_solution_module(solution)
+    with counters.counting(with_counters) as counted:
+        start = time.perf_counter()
+        answer, report = PROFILERS[profiler](module.run_program, input, top)
+        duration = time.perf_counter() - start
+
+    report = (
+        f"== {solution.name} ({profiler}): answer {answer}, "
+        f"{run.format_duration(duration)}\n\n{report}"
+    )
+    if with_counters:
+        report += f"\ncounters:\n{counters.format_counters(counted)}"
+    return answer, report
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.profiling",
+        description="Profiles Advent of Code solutions.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="+",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART",
+    )
+    profilers = parser.add_mutually_exclusive_group(required=True)
+    profilers.add_argument(
+        "--profile",
+        dest="profiler",
+        action="store_const",
+        const="profile",
+        help="report the hottest functions measured by cProfile",
+    )
+    profilers.add_argument(
+        "--sample",
+        dest="profiler",
+        action="store_const",
+        const="sample",
+        help="report the hottest functions measured by a sampling profiler",
+    )
+    profilers.add_argument(
+        "--tracemalloc",
+        dest="profiler",
+        action="store_const",
+        const="tracemalloc",
+        help="report the largest allocation sites at the peak memory usage",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="report named counters incremented by the solutions",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of reported functions or allocation sites "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=DEFAULT_REPORT_PATH,
+        help="path to the report file (default: profile-report.txt in the "
+        "repository root)",
+    )
+    parser.add_argument(
+        "--input",
+        type=pathlib.Path,
+        help="path to the input (default: the input file of each solution)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+    reports = []
+    failed = False
+    for solution in selected:
+        try:
+            if args.input is not None:
+                input = args.input.read_text(encoding="utf-8")
+            else:
+                input = solutions.read_solution_input(solution)
+            answer, report = profile_solution(
+                solution, input, args.profiler, args.top, args.counters
+            )
+        # See run.run_solution() for why BaseException is caught.
+        except BaseException as e:
+            print(f"{solution.name}: ERROR ({type(e).__name__}: {e})")
+            failed = True
+            continue
+        print(f"{solution.name}: {answer}")
+        reports.append(report)
+
+    args.output.write_text("\n".join(reports), encoding="utf-8")
+    print(f"report written to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    @staticmethod
+    def busy_loop(n):
+        total = 0
+        for i in range(n):
+            total += sum(range(100))
+        return total
+
+    def test_profile_calls_reports_called_functions(self):
+        result, report = profile_calls(self.busy_loop, 1000)
+
+        self.assertEqual(result, 1000 * 4950)
+        self.assertIn("busy_loop", report)
+
+    def test_sample_stacks_reports_running_function(self):
+        result, report = sample_stacks(self.busy_loop, 100_000)
+
+        self.assertEqual(result, 100_000 * 4950)
+        self.assertIn("busy_loop (profiling.py", report)
+
+    def test_trace_allocations_reports_allocation_sites(self):
+        def allocate(n):
+            return len([str(i) for i in range(n)])
+
+        result, report = trace_allocations(allocate, 100_000)
+
+        self.assertEqual(result, 100_000)
+        self.assertRegex(report, r"profiling\.py:\d+")
+
+    def test_profile_solution_reports_answer_and_counters(self):
+        dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "01"
+        dir.mkdir()
+        path = dir / "aoc01_part1.py"
+        path.write_text(
+            textwrap.dedent(
+                """
+                from aoc import counters
+
+                def run_program(input):
+                    for _ in range(input):
+                        counters.count("pops")
+                    return input
+                """
+            ),
+            encoding="utf-8",
+        )
+
+        answer, report = profile_solution(
+            solutions.Solution(2024, 1, 1, path), 3, "profile", with_counters=True
+        )
+
+        self.assertEqual(answer, 3)
+        self.assertIn("== 2024/01/1 (profile): answer 3", report)
+        self.assertRegex(report, r"counters:\npops +3\n")
@@ -0,0 +1,573 @@
+#
+# Runs the selected solutions across a pool of worker processes and reports
+# their answers together with wall time, CPU time, and peak memory usage.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.run [-j JOBS] [--cache] [--counters] [--report REPORT]
+#                       [--compare REPORT] [--cpu-limit SECONDS]
+#                       [--wall-limit SECONDS] [--memory-limit MIB]
+#                       [SELECTOR ...]
+#
+# where SELECTOR is YEAR, YEAR/DD, or YEAR/DD/PART (e.g. 2024 or 2024/06/2).
+# Every solution reads its input from the "input" file in its directory.
+# With --cache, answers of solutions whose input and source have not changed
+# since the last run are taken from a local cache (see cache.py).
+#
+# With --counters, operation counters of the solutions (e.g. heap pops or
+# cache misses, see counters.py) are reported next to the timings. Unlike
+# the timings, the counters are deterministic, so comparing them with a
+# previous JSON report (--report, --compare) catches complexity regressions
+# that are lost in the timing noise.
+#
+# With any of the --*-limit options, every solution runs in a subprocess with
+# the given CPU time, wall time, and memory limits (see limits.py). Solutions
+# exceeding a limit are reported as such (and their subprocesses are killed
+# when needed), so a run over the whole tree never stalls.
+#
+
+import argparse
+import dataclasses
+import functools
+import json
+import multiprocessing
+import os
+import pathlib
+import resource
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+from aoc import cache
+from aoc import counters
+from aoc import limits
+from aoc import solutions
+
+
+@dataclasses.dataclass
+class Result:
+    solution: solutions.Solution
+    answer: object = None
+    error: str | None = None
+    # In seconds.
+    wall_time: float = 0.0
+    # In seconds (user + system).
+    cpu_time: float = 0.0
+    # In bytes.
+    peak_rss: int = 0
+    # Whether the answer and measurements come from the cache.
+    cached: bool = False
+    # Operation counters (only when counting is enabled).
+    counters: dict = dataclasses.field(default_factory=dict)
+    # The exceeded limit ("cpu time", "wall time", or "memory"), if any.
+    limit: str | None = None
+
+
+def get_peak_rss():
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the value in kilobytes, macOS in bytes.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def run_solution(solution, cache_dir=None, with_counters=False):
+    # Runs the solution in the current process. Time and memory spent on
+    # importing the module and reading the input are not included in the
+    # measured times (but imports are included in the peak memory usage).
+    #
+    # When cache_dir is given, the answer is looked up in the cache first and
+    # a newly computed answer is stored into it. With with_counters, the
+    # cache is not looked up (the counters are not cached).
+    result = Result(solution)
+    try:
+        input = solutions.read_solution_input(solution)
+        if cache_dir is not None:
+            key = cache.get_cache_key(solution, input)
+            entry = None if with_counters else cache.load_entry(key, cache_dir)
+            if entry is not None:
+                return Result(solution, cached=True, **entry)
+        module = solutions.load_solution_module(solution)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with counters.counting(with_counters) as counted:
+                result.answer = module.run_program(input)
+        finally:
+            result.wall_time = time.perf_counter() - wall_start
+            result.cpu_time = time.process_time() - cpu_start
+            result.counters = dict(counted)
+    # Some solutions call sys.exit() when they cannot handle the input, so
+    # catch BaseException to report that as an error instead of dying.
+    except BaseException as e:
+        result.error = f"{type(e).__name__}: {e}"
+        result.limit = limits.get_exceeded_limit(e)
+    result.peak_rss = get_peak_rss()
+    if cache_dir is not None and result.error is None:
+        cache.store_entry(
+            key,
+            {
+                "answer": result.answer,
+                "wall_time": result.wall_time,
+                "cpu_time": result.cpu_time,
+                "peak_rss": result.peak_rss,
+            },
+            cache_dir,
+        )
+    return result
+
+
+def map_in_workers(function, items, jobs=None):
+    # Every item is processed in a fresh worker process so that measurements
+    # (e.g. the peak memory usage) belong only to that item. The results are
+    # yielded in the order of completion.
+    with multiprocessing.Pool(processes=jobs, maxtasksperchild=1) as pool:
+        yield from pool.imap_unordered(function, items)
+
+
+def create_failure_result(solution, exception):
+    # A result of a solution whose subprocess was killed or died.
+    result = Result(
+        solution,
+        error=f"{type(exception).__name__}: {exception}",
+        limit=limits.get_exceeded_limit(exception),
+    )
+    if result.limit == "wall time":
+        result.wall_time = exception.value
+    return result
+
+
+def run_solutions(
+    solutions_to_run,
+    jobs=None,
+    cache_dir=None,
+    with_counters=False,
+    resource_limits=None,
+):
+    function = functools.partial(
+        run_solution, cache_dir=cache_dir, with_counters=with_counters
+    )
+    if resource_limits is None:
+        return map_in_workers(function, solutions_to_run, jobs)
+    return limits.map_with_limits(
+        function,
+        solutions_to_run,
+        resource_limits,
+        jobs,
+        on_failure=create_failure_result,
+    )
+
+
+def create_report(results):
+    # Returns a JSON-serializable report of the results, keyed by solution.
+    return {
+        result.solution.name: {
+            # E.g. huge integers or sets are stored as strings.
+            "answer": (
+                result.answer
+                if isinstance(result.answer, (int, str, type(None)))
+                else str(result.answer)
+            ),
+            "error": result.error,
+            "wall_time": result.wall_time,
+            "cpu_time": result.cpu_time,
+            "peak_rss": result.peak_rss,
+            "counters": result.counters,
+            "limit": result.limit,
+        }
+        for result in results
+    }
+
+
+def save_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_counters(old_report, new_report):
+    # Returns (solution, counter, old value, new value) for every counter that
+    # changed between the reports (a missing counter has the value 0).
+    changes = []
+    for name, new_entry in new_report.items():
+        if name not in old_report:
+            continue
+        old_counters = old_report[name]["counters"]
+        new_counters = new_entry["counters"]
+        for counter in sorted(old_counters.keys() | new_counters.keys()):
+            old_value = old_counters.get(counter, 0)
+            new_value = new_counters.get(counter, 0)
+            if old_value != new_value:
+                changes.append((name, counter, old_value, new_value))
+    return changes
+
+
+def format_counter_change(change):
+    name, counter, old_value, new_value = change
+    ratio = f" ({new_value / old_value:.2f}x)" if old_value else ""
+    return f"{name:<10} {counter}: {old_value:,} -> {new_value:,}{ratio}"
+
+
+def format_duration(seconds):
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.0f} us"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_size(size):
+    return f"{size / 2**20:.1f} MiB"
+
+
+def format_result(result):
+    answer = result.answer if result.error is None else f"ERROR ({result.error})"
+    if result.limit is not None:
+        answer = f"LIMIT EXCEEDED ({result.limit})"
+    if result.cached:
+        answer = f"{answer} (cached)"
+    return (
+        f"{result.solution.name:<10} {format_duration(result.wall_time):>10} "
+        f"{format_duration(result.cpu_time):>10} {format_size(result.peak_rss):>10}"
+        f"  {answer}"
+    )
+
+
+def format_header():
+    return f"{'Solution':<10} {'Wall':>10} {'CPU':>10} {'Peak RSS':>10}  Answer"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.run",
+        description="Runs Advent of Code solutions and measures them.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all solutions)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse answers of solutions whose input and source have not changed",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=float,
+        default=cache.DEFAULT_MAX_SIZE / 2**20,
+        help="maximal size of the cache in MiB (default: %(default)g)",
+    )
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="count operations of the solutions and report them",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="REPORT",
+        type=pathlib.Path,
+        help="write the results (including the counters) into a JSON file",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="REPORT",
+        type=pathlib.Path,
+        help="compare the counters with a previous JSON report and fail when "
+        "any of them increased (implies --counters)",
+    )
+    parser.add_argument(
+        "--cpu-limit",
+        metavar="SECONDS",
+        type=float,
+        help="maximal CPU time of a solution",
+    )
+    parser.add_argument(
+        "--wall-limit",
+        metavar="SECONDS",
+        type=float,
+        help="maximal wall time of a solution (including its startup)",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        metavar="MIB",
+        type=float,
+        help="maximal memory usage of a solution",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+        old_report = load_report(args.compare) if args.compare is not None else None
+    except (ValueError, OSError) as e:
+        sys.exit(f"error: {e}")
+
+    with_counters = args.counters or args.compare is not None
+    cache_dir = cache.CACHE_DIR if args.cache else None
+    resource_limits = None
+    if (args.cpu_limit, args.wall_limit, args.memory_limit) != (None, None, None):
+        resource_limits = limits.Limits(
+            cpu_time=args.cpu_limit,
+            wall_time=args.wall_limit,
+            memory=(
+                int(args.memory_limit * 2**20)
+                if args.memory_limit is not None
+                else None
+            ),
+        )
+    print(format_header())
+    results = sorted(
+        run_solutions(selected, args.jobs, cache_dir, with_counters, resource_limits),
+        key=lambda result: result.solution,
+    )
+    for result in results:
+        print(format_result(result))
+        if with_counters:
+            print(
+                textwrap.indent(counters.format_counters(result.counters), "    "),
+                end="",
+            )
+    if cache_dir is not None:
+        cache.evict_entries(cache_dir, int(args.cache_size * 2**20))
+
+    wall_time = sum(result.wall_time for result in results)
+    cpu_time = sum(result.cpu_time for result in results)
+    print(
+        f"{len(results)} solutions, total wall time {format_duration(wall_time)}, "
+        f"total CPU time {format_duration(cpu_time)}"
+    )
+
+    report = create_report(results)
+    if args.report is not None:
+        save_report(report, args.report)
+    counters_increased = False
+    if old_report is not None:
+        changes = compare_counters(old_report, report)
+        print(f"\n{len(changes)} counters changed since {args.compare}")
+        for change in changes:
+            print(format_counter_change(change))
+        counters_increased = any(new > old for _, _, old, new in changes)
+
+    failed = any(result.error is not None for result in results)
+    return 1 if failed or counters_increased else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def create_solution(self, source, input=None):
+        dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "01"
+        dir.mkdir()
+        path = dir / "aoc01_part1.py"
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+        if input is not None:
+            (dir / "input").write_text(input, encoding="utf-8")
+        return solutions.Solution(2024, 1, 1, path)
+
+    def test_run_solution_returns_answer_and_measurements(self):
+        solution = self.create_solution(
+            """
+            def run_program(input):
+                return sum(map(int, input.split()))
+            """,
+            input="1 2 3\n",
+        )
+
+        result = run_solution(solution)
+
+        self.assertIsNone(result.error)
+        self.assertEqual(result.answer, 6)
+        self.assertGreaterEqual(result.wall_time, 0)
+        self.assertGreaterEqual(result.cpu_time, 0)
+        self.assertGreater(result.peak_rss, 0)
+
+    def test_run_solution_reports_exception_as_error(self):
+        solution = self.create_solution(
+            """
+            def run_program(input):
+                raise AssertionError("no guard found in map")
+            """,
+            input="",
+        )
+
+        result = run_solution(solution)
+
+        self.assertEqual(result.error, "AssertionError: no guard found in map")
+
+    def test_run_solution_reports_exit_as_error(self):
+        solution = self.create_solution(
+            """
+            import sys
+
+            def run_program(input):
+                sys.exit("error: incompatible program input")
+            """,
+            input="",
+        )
+
+        result = run_solution(solution)
+
+        self.assertEqual(result.error, "SystemExit: error: incompatible program input")
+
+    def test_run_solution_reports_missing_input_as_error(self):
+        solution = self.create_solution("def run_program(input): pass\n")
+
+        result = run_solution(solution)
+
+        self.assertTrue(result.error.startswith("FileNotFoundError"))
+
+    def test_run_solution_returns_cached_answer_for_unchanged_input(self):
+        cache_dir = self.enterContext(tempfile.TemporaryDirectory())
+        solution = self.create_solution(
+            """
+            import time
+
+            def run_program(input):
+                return time.time()
+            """,
+            input="",
+        )
+
+        result = run_solution(solution, cache_dir)
+        cached_result = run_solution(solution, cache_dir)
+
+        self.assertFalse(result.cached)
+        self.assertTrue(cached_result.cached)
+        self.assertEqual(cached_result.answer, result.answer)
+        self.assertEqual(cached_result.wall_time, result.wall_time)
+
+    def test_run_solution_does_not_cache_errors(self):
+        cache_dir = self.enterContext(tempfile.TemporaryDirectory())
+        solution = self.create_solution(
+            """
+            def run_program(input):
+                raise AssertionError("no guard found in map")
+            """,
+            input="",
+        )
+
+        run_solution(solution, cache_dir)
+
+        self.assertEqual(list(pathlib.Path(cache_dir).iterdir()), [])
+
+    def test_run_solutions_runs_solutions_in_worker_processes(self):
+        solution = self.create_solution(
+            """
+            import os
+
+            def run_program(input):
+                return os.getpid()
+            """,
+            input="",
+        )
+
+        results = list(run_solutions([solution], jobs=1))
+
+        self.assertEqual(len(results), 1)
+        self.assertNotEqual(results[0].answer, os.getpid())
+
+    def test_run_solution_counts_operations_when_enabled(self):
+        solution = self.create_solution(
+            """
+            from aoc import counters
+
+            def run_program(input):
+                counters.count("pops", 3)
+            """,
+            input="",
+        )
+
+        counted_result = run_solution(solution, with_counters=True)
+        result = run_solution(solution)
+
+        self.assertEqual(counted_result.counters, {"pops": 3})
+        self.assertEqual(result.counters, {})
+
+    def test_report_is_saved_and_loaded(self):
+        path = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "r"
+        result = Result(
+            solutions.Solution(2024, 6, 2, pathlib.Path("a")), {1}, counters={"pops": 2}
+        )
+
+        save_report(create_report([result]), path)
+
+        self.assertEqual(
+            load_report(path)["2024/06/2"],
+            {
+                "answer": "{1}",
+                "error": None,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "peak_rss": 0,
+                "counters": {"pops": 2},
+                "limit": None,
+            },
+        )
+
+    def test_compare_counters_returns_changed_counters(self):
+        old_report = {
+            "2024/06/1": {"counters": {"pops": 2, "pushes": 3}},
+            "2024/06/2": {"counters": {"pops": 1}},
+        }
+        new_report = {
+            "2024/06/1": {"counters": {"pops": 4, "hits": 1, "pushes": 3}},
+            "2024/07/1": {"counters": {"pops": 1}},
+        }
+
+        self.assertEqual(
+            compare_counters(old_report, new_report),
+            [("2024/06/1", "hits", 0, 1), ("2024/06/1", "pops", 2, 4)],
+        )
+
+    def test_run_solutions_reports_exceeded_limits(self):
+        sleeping = self.create_solution(
+            """
+            import time
+
+            def run_program(input):
+                time.sleep(10)
+            """,
+            input="",
+        )
+        allocating = self.create_solution(
+            """
+            def run_program(input):
+                return len(bytearray(2**30))
+            """,
+            input="",
+        )
+
+        results = run_solutions(
+            [sleeping, allocating],
+            jobs=2,
+            resource_limits=limits.Limits(wall_time=1, memory=2**28),
+        )
+
+        self.assertEqual(
+            sorted(result.limit for result in results), ["memory", "wall time"]
+        )
+
+    def test_format_result_includes_name_and_answer(self):
+        result = Result(solutions.Solution(2024, 6, 2, pathlib.Path("a")), 1812)
+
+        self.assertRegex(format_result(result), r"^2024/06/2 .* 1812$")
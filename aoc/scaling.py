@@ -0,0 +1,205 @@
+#
+# Runs solutions on synthetic inputs of increasing size (see generators.py)
+# and fits the empirical complexity curve to the measured times.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.scaling [--scales S ...] [-n RUNS] [SELECTOR ...]
+#
+# The size of an input is its length in characters, so for grid puzzles,
+# doubling the scale quadruples the size.
+#
+
+import argparse
+import functools
+import math
+import sys
+import unittest
+
+from aoc import bench
+from aoc import generators
+from aoc import run
+from aoc import solutions
+
+
+DEFAULT_SCALES = [0.25, 0.5, 1, 2]
+COMPLEXITY_CLASSES = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+def measure_at_scale(solution_and_scale, runs=1, seed=generators.DEFAULT_SEED):
+    # Returns (solution, scale, size, median time, error).
+    solution, scale = solution_and_scale
+    try:
+        input = generators.generate_input(solution, scale, seed)
+        module = solutions.load_solution_module(solution)
+        times = bench.time_runs(module.run_program, input, runs, warmup=0)
+        return solution, scale, len(input), sorted(times)[len(times) // 2], None
+    except BaseException as e:
+        return solution, scale, 0, 0.0, f"{type(e).__name__}: {e}"
+
+
+def fit_power_law(sizes, times):
+    # Least-squares fit of log(time) = k * log(size) + c. Returns k, i.e. the
+    # empirical exponent of time ~ size^k.
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(time, 1e-9)) for time in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        raise ValueError("at least two different sizes are needed")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+
+
+def fit_complexity_class(sizes, times):
+    # Returns the complexity class from COMPLEXITY_CLASSES that fits the
+    # measured times best (time = c * f(size) with the least squared error in
+    # the log space).
+    def residual(f):
+        diffs = [
+            math.log(max(time, 1e-9)) - math.log(f(size))
+            for size, time in zip(sizes, times)
+        ]
+        mean = sum(diffs) / len(diffs)
+        return sum((d - mean) ** 2 for d in diffs)
+
+    return min(COMPLEXITY_CLASSES, key=lambda name: residual(COMPLEXITY_CLASSES[name]))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.scaling",
+        description="Measures how Advent of Code solutions scale with input size.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all solutions with "
+        "an input generator)",
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="input scales relative to the official input size "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        type=int,
+        default=1,
+        help="number of measured runs per scale (default: 1)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=generators.DEFAULT_SEED,
+        help="seed for the input generators (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes (default: 1 to reduce noise)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    selected = [s for s in selected if generators.get_generator(s) is not None]
+    if not selected:
+        sys.exit("error: no selected solution has an input generator")
+
+    measure = functools.partial(measure_at_scale, runs=args.runs, seed=args.seed)
+    measurements = {}
+    failed = False
+    for solution, scale, size, time, error in run.map_in_workers(
+        measure,
+        [(solution, scale) for solution in selected for scale in args.scales],
+        args.jobs,
+    ):
+        if error is not None:
+            print(f"{solution.name} at scale {scale}: ERROR ({error})")
+            failed = True
+            continue
+        measurements.setdefault(solution, []).append((scale, size, time))
+
+    for solution, points in sorted(measurements.items()):
+        points.sort()
+        print(f"{solution.name}:")
+        for scale, size, time in points:
+            print(
+                f"  scale {scale:<6g} size {size:>12,} "
+                f"{run.format_duration(time):>10}"
+            )
+        sizes = [size for _, size, _ in points]
+        times = [time for _, _, time in points]
+        if len(set(sizes)) > 1:
+            print(
+                f"  time ~ size^{fit_power_law(sizes, times):.2f}, "
+                f"best fit: {fit_complexity_class(sizes, times)}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def test_fit_power_law_returns_exponent_of_exact_power_law(self):
+        sizes = [10, 100, 1000]
+        times = [0.5 * size**2 for size in sizes]
+
+        self.assertAlmostEqual(fit_power_law(sizes, times), 2.0)
+
+    def test_fit_power_law_raises_error_for_single_size(self):
+        with self.assertRaises(ValueError):
+            fit_power_law([10, 10], [1.0, 2.0])
+
+    def test_fit_complexity_class_returns_best_matching_class(self):
+        sizes = [1_000, 10_000, 100_000, 1_000_000]
+
+        self.assertEqual(fit_complexity_class(sizes, [3e-6 * n for n in sizes]), "O(n)")
+        self.assertEqual(
+            fit_complexity_class(sizes, [2e-7 * n * math.log(n) for n in sizes]),
+            "O(n log n)",
+        )
+        self.assertEqual(
+            fit_complexity_class(sizes, [1e-9 * n**2 for n in sizes]), "O(n^2)"
+        )
+
+    def test_measure_at_scale_runs_solution_on_generated_input(self):
+        solution = next(
+            s for s in solutions.discover_solutions() if s.name == "2024/01/1"
+        )
+
+        _, scale, size, time, error = measure_at_scale((solution, 0.1))
+
+        self.assertIsNone(error)
+        self.assertEqual(scale, 0.1)
+        self.assertEqual(size, 100 * len("12345   12345\n"))
+        self.assertGreater(time, 0)
+
+    def test_all_solutions_with_generator_accept_generated_inputs(self):
+        for solution in solutions.discover_solutions():
+            if generators.get_generator(solution) is not None:
+                with self.subTest(solution=solution.name):
+                    *_, error = measure_at_scale((solution, 0.1))
+                    self.assertIsNone(error)
@@ -0,0 +1,288 @@
+#
+# Graph searches over integer-encoded states.
+#
+# States are integers from 0 to state_count - 1 (e.g. grid positions, or
+# positions combined with directions as pos * 4 + direction), so distances
+# are kept in a flat list instead of a dictionary of tuples. Every search
+# takes:
+#
+# - sources: states to start from (all at distance 0),
+# - neighbors(state): the states reachable from the state in one step; for
+#   weighted searches, (next_state, weight) pairs,
+# - is_target(state) (optional): when given, the search stops once the first
+#   target state is reached with its final distance.
+#
+# and returns (distances, target), where unreachable (or not yet reached)
+# states have the distance INFINITY and target is the reached target state
+# (None when there is no target or none is reachable).
+#
+# Usage:
+#
+#     def neighbors(pos):
+#         return [pos + d for d in grid.directions if grid.cells[pos + d] == SAFE]
+#
+#     distances, end = search.bfs(len(grid.cells), [start], neighbors,
+#                                 is_target=lambda pos: pos == goal)
+#
+
+import collections
+import functools
+import heapq
+import math
+import unittest
+
+from aoc import counters
+
+
+INFINITY = math.inf
+
+
+def init_distances(state_count, sources):
+    distances = [INFINITY] * state_count
+    sources = list(dict.fromkeys(sources))
+    for state in sources:
+        distances[state] = 0
+    return distances, sources
+
+
+def count_operations(pushes, pops):
+    # Pushes and pops are counted in local variables and reported once per
+    # search, so counting does not slow down the searches.
+    counters.count("search pushes", pushes)
+    counters.count("search pops", pops)
+
+
+def bfs(state_count, sources, neighbors, is_target=None):
+    # Breadth-first search for unweighted graphs.
+    distances, queue = init_distances(state_count, sources)
+    queue = collections.deque(queue)
+    pushes = len(queue)
+    while queue:
+        state = queue.popleft()
+        if is_target is not None and is_target(state):
+            count_operations(pushes, pushes - len(queue))
+            return distances, state
+        next_distance = distances[state] + 1
+        for next_state in neighbors(state):
+            if distances[next_state] == INFINITY:
+                distances[next_state] = next_distance
+                queue.append(next_state)
+                pushes += 1
+    count_operations(pushes, pushes)
+    return distances, None
+
+
+def zero_one_bfs(state_count, sources, neighbors, is_target=None):
+    # Breadth-first search for graphs with weights 0 and 1: states reached
+    # over 0-weight edges go to the front of the queue.
+    distances, sources = init_distances(state_count, sources)
+    queue = collections.deque((0, state) for state in sources)
+    pushes = len(queue)
+    while queue:
+        distance, state = queue.popleft()
+        if distance > distances[state]:
+            continue
+        if is_target is not None and is_target(state):
+            count_operations(pushes, pushes - len(queue))
+            return distances, state
+        for next_state, weight in neighbors(state):
+            next_distance = distance + weight
+            if next_distance < distances[next_state]:
+                distances[next_state] = next_distance
+                if weight == 0:
+                    queue.appendleft((next_distance, next_state))
+                else:
+                    queue.append((next_distance, next_state))
+                pushes += 1
+    count_operations(pushes, pushes)
+    return distances, None
+
+
+def dijkstra(state_count, sources, neighbors, is_target=None):
+    # Dijkstra's algorithm for non-negative weights with a binary heap.
+    # Instead of decreasing keys, states are pushed again and outdated heap
+    # entries are skipped.
+    distances, sources = init_distances(state_count, sources)
+    heap = [(0, state) for state in sources]
+    heapq.heapify(heap)
+    pushes = len(heap)
+    while heap:
+        distance, state = heapq.heappop(heap)
+        if distance > distances[state]:
+            continue
+        if is_target is not None and is_target(state):
+            count_operations(pushes, pushes - len(heap))
+            return distances, state
+        for next_state, weight in neighbors(state):
+            next_distance = distance + weight
+            if next_distance < distances[next_state]:
+                distances[next_state] = next_distance
+                heapq.heappush(heap, (next_distance, next_state))
+                pushes += 1
+    count_operations(pushes, pushes)
+    return distances, None
+
+
+def dial(state_count, sources, neighbors, max_weight, is_target=None):
+    # Dijkstra's algorithm with Dial's bucket queue for small integer weights
+    # (0 to max_weight): states are kept in a circular array of buckets by
+    # their distance, so pushing and popping a state takes constant time.
+    distances, sources = init_distances(state_count, sources)
+    buckets = [[] for _ in range(max_weight + 1)]
+    buckets[0].extend(sources)
+    queued = pushes = len(sources)
+    distance = 0
+    while queued:
+        bucket = buckets[distance % len(buckets)]
+        while bucket:
+            state = bucket.pop()
+            queued -= 1
+            if distances[state] != distance:
+                continue
+            if is_target is not None and is_target(state):
+                count_operations(pushes, pushes - queued)
+                return distances, state
+            for next_state, weight in neighbors(state):
+                next_distance = distance + weight
+                if next_distance < distances[next_state]:
+                    distances[next_state] = next_distance
+                    buckets[next_distance % len(buckets)].append(next_state)
+                    queued += 1
+                    pushes += 1
+        distance += 1
+    count_operations(pushes, pushes)
+    return distances, None
+
+
+def astar(state_count, sources, neighbors, heuristic, is_target):
+    # A* search. The heuristic has to be consistent (it never overestimates
+    # the remaining distance to a target and does not decrease by more than
+    # the weight of an edge), so every state is expanded at most once.
+    distances, sources = init_distances(state_count, sources)
+    heap = [(heuristic(state), 0, state) for state in sources]
+    heapq.heapify(heap)
+    pushes = len(heap)
+    while heap:
+        _, distance, state = heapq.heappop(heap)
+        if distance > distances[state]:
+            continue
+        if is_target(state):
+            count_operations(pushes, pushes - len(heap))
+            return distances, state
+        for next_state, weight in neighbors(state):
+            next_distance = distance + weight
+            if next_distance < distances[next_state]:
+                distances[next_state] = next_distance
+                heapq.heappush(
+                    heap,
+                    (next_distance + heuristic(next_state), next_distance, next_state),
+                )
+                pushes += 1
+    count_operations(pushes, pushes)
+    return distances, None
+
+
+class Tests(unittest.TestCase):
+    # A weighted graph (state 5 is not connected to any other state):
+    #
+    #   0 --1-- 1 --2-- 2
+    #   |               |
+    #   5               1
+    #   |               |
+    #   3 ------0------ 4
+    #
+    EDGES = {
+        0: [(1, 1), (3, 5)],
+        1: [(0, 1), (2, 2)],
+        2: [(1, 2), (4, 1)],
+        3: [(0, 5), (4, 0)],
+        4: [(2, 1), (3, 0)],
+        5: [],
+    }
+    DISTANCES_FROM_0 = [0, 1, 3, 4, 4, INFINITY]
+
+    def neighbors(self, state):
+        return self.EDGES[state]
+
+    def unweighted_neighbors(self, state):
+        return [next_state for next_state, _ in self.EDGES[state]]
+
+    def test_bfs_returns_number_of_steps(self):
+        distances, target = bfs(6, [0], self.unweighted_neighbors)
+
+        self.assertEqual(distances, [0, 1, 2, 1, 2, INFINITY])
+        self.assertIsNone(target)
+
+    def test_bfs_starts_from_multiple_sources(self):
+        distances, _ = bfs(6, [0, 2, 0], self.unweighted_neighbors)
+
+        self.assertEqual(distances, [0, 1, 0, 1, 1, INFINITY])
+
+    def test_bfs_stops_at_first_reached_target(self):
+        distances, target = bfs(
+            6, [0], self.unweighted_neighbors, is_target=lambda s: s in (2, 4)
+        )
+
+        self.assertIn(target, (2, 4))
+        self.assertEqual(distances[target], 2)
+
+    def test_weighted_searches_return_shortest_distances(self):
+        for search in (dijkstra, functools.partial(dial, max_weight=5)):
+            with self.subTest(search=search):
+                distances, target = search(6, [0], self.neighbors)
+
+                self.assertEqual(distances, self.DISTANCES_FROM_0)
+                self.assertIsNone(target)
+
+    def test_weighted_searches_stop_at_first_reached_target(self):
+        for search in (
+            dijkstra,
+            functools.partial(dial, max_weight=5),
+            functools.partial(astar, heuristic=lambda s: 0),
+        ):
+            with self.subTest(search=search):
+                distances, target = search(
+                    6, [0], self.neighbors, is_target=lambda s: s in (3, 4)
+                )
+
+                self.assertIn(target, (3, 4))
+                self.assertEqual(distances[target], 4)
+
+    def test_dial_returns_no_target_when_no_target_is_reachable(self):
+        distances, target = dial(6, [0], self.neighbors, 5, is_target=lambda s: s == 5)
+
+        self.assertEqual(distances, self.DISTANCES_FROM_0)
+        self.assertIsNone(target)
+
+    def test_zero_one_bfs_prefers_zero_weight_edges(self):
+        edges = {0: [(1, 1), (2, 0)], 1: [], 2: [(3, 0)], 3: [(1, 0)]}
+
+        distances, _ = zero_one_bfs(4, [0], edges.__getitem__)
+
+        self.assertEqual(distances, [0, 0, 0, 0])
+
+    def test_searches_count_pushes_and_pops(self):
+        with counters.counting() as counted:
+            dijkstra(6, [0], self.neighbors)
+
+        # Every state is popped once (after pushing a better distance for
+        # state 3 via 4 than via 0, the outdated entry is popped as well).
+        self.assertEqual(counted, {"search pushes": 6, "search pops": 6})
+
+    def test_astar_finds_shortest_path_on_grid_with_taxicab_heuristic(self):
+        # A 3x3 grid with a wall in the middle, from the top-left corner to
+        # the bottom-right corner.
+        def neighbors(pos):
+            i, j = divmod(pos, 3)
+            for ni, nj in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+                if 0 <= ni < 3 and 0 <= nj < 3 and (ni, nj) != (1, 1):
+                    yield ni * 3 + nj, 1
+
+        def heuristic(pos):
+            i, j = divmod(pos, 3)
+            return (2 - i) + (2 - j)
+
+        distances, target = astar(9, [0], neighbors, heuristic, lambda s: s == 8)
+
+        self.assertEqual(target, 8)
+        self.assertEqual(distances[8], 4)
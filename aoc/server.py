@@ -0,0 +1,304 @@
+#
+# A solve server that keeps solution modules imported in a warm interpreter,
+# so that solving an input does not pay for the interpreter startup and
+# imports (e.g. networkx in 2023/25).
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.server [--socket PATH] [SELECTOR ...]
+#     python -m aoc.server --socket PATH --solve YEAR/DD[/PART] --input FILE
+#
+# The first form preloads the selected solutions (default: all) and serves
+# requests on a Unix socket (or on stdin/stdout without --socket). The second
+# form sends a single request to a running server and prints the answer.
+#
+# Requests and responses are JSON objects, one per line:
+#
+#     {"solution": "2023/25", "input": "jqt: rhn xhk nvd\n..."}
+#     {"solution": "2024/06/2", "input_path": "2024/06/input"}
+#
+#     {"solution": "2023/25", "answer": 54, "error": null,
+#      "solve_time": 0.0021, "latency": 0.0023}
+#
+# where solve_time is the time spent in run_program() and latency the time
+# from receiving the request to sending the response (in seconds).
+#
+
+import argparse
+import io
+import json
+import os
+import pathlib
+import socket
+import socketserver
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+
+from aoc import lazy
+from aoc import run
+from aoc import solutions
+
+
+def preload_solutions(solutions_to_load):
+    # Returns a mapping of solution names to solutions whose modules have
+    # been loaded (including their lazily imported dependencies).
+    solutions_by_name = {}
+    for solution in solutions_to_load:
+        solutions.get_solution_module(solution)
+        solutions_by_name[solution.name] = solution
+    lazy.load_pending_modules()
+    return solutions_by_name
+
+
+def find_solution(solutions_by_name, name):
+    if name in solutions_by_name:
+        return solutions_by_name[name]
+    # Allow YEAR/DD/PART for days solved by a single script.
+    year_and_day = "/".join(name.split("/")[:2])
+    if year_and_day in solutions_by_name:
+        return solutions_by_name[year_and_day]
+    raise ValueError(f"unknown or not loaded solution: {name}")
+
+
+def handle_request(line, solutions_by_name):
+    start = time.perf_counter()
+    response = {"solution": None, "answer": None, "error": None, "solve_time": 0.0}
+    try:
+        request = json.loads(line)
+        solution = find_solution(solutions_by_name, request["solution"])
+        response["solution"] = solution.name
+        if "input" in request:
+            input = request["input"]
+        else:
+            input = pathlib.Path(request["input_path"]).read_text(encoding="utf-8")
+        module = solutions.get_solution_module(solution)
+        solve_start = time.perf_counter()
+        try:
+            response["answer"] = module.run_program(input)
+        finally:
+            response["solve_time"] = time.perf_counter() - solve_start
+    # See run.run_solution() for why BaseException is caught (a failing
+    # request must not stop the server).
+    except BaseException as e:
+        response["error"] = f"{type(e).__name__}: {e}"
+    response["latency"] = time.perf_counter() - start
+    return response
+
+
+def format_response(response):
+    try:
+        return json.dumps(response)
+    except (TypeError, ValueError):
+        # E.g. huge integers or sets.
+        return json.dumps({**response, "answer": str(response["answer"])})
+
+
+def log_response(response, log):
+    print(
+        f"{response['solution'] or '?':<10} "
+        f"{run.format_duration(response['latency']):>10}"
+        + (f"  ERROR ({response['error']})" if response["error"] else ""),
+        file=log,
+        flush=True,
+    )
+
+
+def serve_stream(reader, writer, solutions_by_name, log=sys.stderr):
+    # Handles requests read line by line from reader until its end.
+    for line in reader:
+        if not line.strip():
+            continue
+        response = handle_request(line, solutions_by_name)
+        writer.write(format_response(response) + "\n")
+        writer.flush()
+        log_response(response, log)
+
+
+def create_unix_socket_server(path, solutions_by_name, log=sys.stderr):
+    class RequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+            writer = io.TextIOWrapper(self.wfile, encoding="utf-8")
+            serve_stream(reader, writer, solutions_by_name, log)
+
+    # Requests are handled one at a time, so that they do not compete for the
+    # CPU and their latencies are not skewed.
+    return socketserver.UnixStreamServer(str(path), RequestHandler)
+
+
+def send_request(path, request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        with client.makefile("rw", encoding="utf-8") as f:
+            f.write(json.dumps(request) + "\n")
+            f.flush()
+            client.shutdown(socket.SHUT_WR)
+            return json.loads(f.readline())
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.server",
+        description="Serves Advent of Code solutions from a warm interpreter.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART of the solutions to preload "
+        "(default: all solutions)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        help="path to the Unix socket (default: serve on stdin/stdout)",
+    )
+    parser.add_argument(
+        "--solve",
+        metavar="YEAR/DD[/PART]",
+        help="send a request to a server running on --socket",
+    )
+    parser.add_argument(
+        "--input",
+        type=pathlib.Path,
+        help="path to the input of the --solve request",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.solve is not None:
+        if args.socket is None or args.input is None:
+            sys.exit("error: --solve requires --socket and --input")
+        response = send_request(
+            args.socket,
+            {"solution": args.solve, "input_path": str(args.input.resolve())},
+        )
+        if response["error"] is not None:
+            sys.exit(f"error: {response['error']}")
+        print(response["answer"])
+        return 0
+
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    start = time.perf_counter()
+    solutions_by_name = preload_solutions(selected)
+    print(
+        f"{len(solutions_by_name)} solutions loaded in "
+        f"{run.format_duration(time.perf_counter() - start)}",
+        file=sys.stderr,
+    )
+
+    if args.socket is None:
+        serve_stream(sys.stdin, sys.stdout, solutions_by_name)
+        return 0
+    with create_unix_socket_server(args.socket, solutions_by_name) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        path = self.dir / "01" / "aoc01_part1.py"
+        path.parent.mkdir()
+        path.write_text(
+            textwrap.dedent(
+                """
+                def run_program(input):
+                    return sum(map(int, input.split()))
+                """
+            ),
+            encoding="utf-8",
+        )
+        self.solutions_by_name = preload_solutions(
+            [solutions.Solution(2024, 1, 1, path)]
+        )
+
+    def test_handle_request_returns_answer_and_times(self):
+        response = handle_request(
+            '{"solution": "2024/01/1", "input": "1 2 3"}', self.solutions_by_name
+        )
+
+        self.assertEqual(response["solution"], "2024/01/1")
+        self.assertEqual(response["answer"], 6)
+        self.assertIsNone(response["error"])
+        self.assertGreaterEqual(response["latency"], response["solve_time"])
+
+    def test_handle_request_reads_input_from_path(self):
+        input_path = self.dir / "input"
+        input_path.write_text("4 5\n", encoding="utf-8")
+
+        response = handle_request(
+            json.dumps({"solution": "2024/01/1", "input_path": str(input_path)}),
+            self.solutions_by_name,
+        )
+
+        self.assertEqual(response["answer"], 9)
+
+    def test_handle_request_reports_errors(self):
+        for line, error in [
+            ('{"solution": "2024/02/1", "input": ""}', "ValueError: unknown"),
+            ('{"solution": "2024/01/1", "input": "x"}', "ValueError: invalid"),
+            ("{", "JSONDecodeError"),
+        ]:
+            with self.subTest(line=line):
+                response = handle_request(line, self.solutions_by_name)
+                self.assertTrue(response["error"].startswith(error))
+
+    def test_find_solution_accepts_part_for_combined_script(self):
+        solution = solutions.Solution(2023, 25, None, pathlib.Path("a"))
+
+        self.assertEqual(find_solution({"2023/25": solution}, "2023/25/1"), solution)
+
+    def test_format_response_converts_unserializable_answer_to_string(self):
+        response = {"solution": "2024/01/1", "answer": {1}}
+
+        self.assertEqual(json.loads(format_response(response))["answer"], "{1}")
+
+    def test_serve_stream_writes_one_response_per_request(self):
+        reader = io.StringIO(
+            '{"solution": "2024/01/1", "input": "1"}\n'
+            "\n"
+            '{"solution": "2024/01/1", "input": "2"}\n'
+        )
+        writer = io.StringIO()
+
+        serve_stream(reader, writer, self.solutions_by_name, log=io.StringIO())
+
+        responses = [json.loads(line) for line in writer.getvalue().splitlines()]
+        self.assertEqual([response["answer"] for response in responses], [1, 2])
+
+    def test_unix_socket_server_answers_requests(self):
+        path = self.dir / "server.sock"
+        server = create_unix_socket_server(
+            path, self.solutions_by_name, log=io.StringIO()
+        )
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            response = send_request(path, {"solution": "2024/01/1", "input": "7 8"})
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        self.assertEqual(response["answer"], 15)
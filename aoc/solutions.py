@@ -0,0 +1,177 @@
+#
+# Discovery and loading of the Advent of Code solutions.
+#
+# Every solution lives in YEAR/DD/aocDD_partN.py (or YEAR/DD/aocDD.py when
+# both parts are solved by a single script) and exposes a run_program(input)
+# function that takes the puzzle input as a string and returns the answer.
+#
+
+import dataclasses
+import importlib.util
+import pathlib
+import re
+import tempfile
+import textwrap
+import unittest
+
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+INPUT_FILE_NAME = "input"
+SOLUTION_FILE_RE = re.compile(r"aoc(\d\d)(?:_part(\d))?\.py")
+SELECTOR_RE = re.compile(r"(\d{4})(?:/(\d{1,2})(?:/(\d))?)?")
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class Solution:
+    year: int
+    day: int
+    # None when a single script solves both parts (e.g. day 25).
+    part: int | None
+    path: pathlib.Path = dataclasses.field(compare=False)
+
+    @property
+    def name(self):
+        if self.part is None:
+            return f"{self.year}/{self.day:02}"
+        return f"{self.year}/{self.day:02}/{self.part}"
+
+    @property
+    def input_path(self):
+        return self.path.parent / INPUT_FILE_NAME
+
+    @property
+    def module_name(self):
+        return "aoc_solution_" + self.name.replace("/", "_")
+
+
+def discover_solutions(root_dir=ROOT_DIR):
+    solutions = []
+    for path in pathlib.Path(root_dir).glob("[0-9][0-9][0-9][0-9]/[0-9][0-9]/*.py"):
+        m = SOLUTION_FILE_RE.fullmatch(path.name)
+        if m is None or m.group(1) != path.parent.name:
+            continue
+        part = int(m.group(2)) if m.group(2) is not None else None
+        solutions.append(
+            Solution(int(path.parent.parent.name), int(m.group(1)), part, path)
+        )
+    return sorted(solutions)
+
+
+def select_solutions(solutions, selectors):
+    # Selectors have the form YEAR, YEAR/DD, or YEAR/DD/PART. When no selector
+    # is given, all the solutions are selected.
+    if not selectors:
+        return list(solutions)
+
+    def matches(solution, selector):
+        m = SELECTOR_RE.fullmatch(selector)
+        if m is None:
+            raise ValueError(f"invalid selector: {selector}")
+        year, day, part = m.groups()
+        return (
+            solution.year == int(year)
+            and (day is None or solution.day == int(day))
+            and (part is None or solution.part in (None, int(part)))
+        )
+
+    return [s for s in solutions if any(matches(s, sel) for sel in selectors)]
+
+
+def load_solution_module(solution):
+    spec = importlib.util.spec_from_file_location(solution.module_name, solution.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Modules loaded by get_solution_module(), by path.
+loaded_modules = {}
+
+
+def get_solution_module(solution):
+    # Like load_solution_module(), but loads every module only once per
+    # process, so repeated calls reuse the module and everything it has
+    # precomputed or cached.
+    if solution.path not in loaded_modules:
+        loaded_modules[solution.path] = load_solution_module(solution)
+    return loaded_modules[solution.path]
+
+
+def read_solution_input(solution):
+    with open(solution.input_path, encoding="utf-8") as f:
+        return f.read()
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def create_solution_file(self, relative_path, content):
+        path = self.root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content), encoding="utf-8")
+        return path
+
+    def test_discover_solutions_finds_part_and_combined_scripts_in_order(self):
+        self.create_solution_file("2024/25/aoc25.py", "")
+        self.create_solution_file("2024/06/aoc06_part2.py", "")
+        self.create_solution_file("2024/06/aoc06_part1.py", "")
+        self.create_solution_file("2024/06/helper.py", "")
+        self.create_solution_file("2024/07/aoc06_part1.py", "")
+
+        solutions = discover_solutions(self.root_dir)
+
+        self.assertEqual(
+            [s.name for s in solutions], ["2024/06/1", "2024/06/2", "2024/25"]
+        )
+
+    def test_select_solutions_returns_solutions_matching_any_selector(self):
+        solutions = [
+            Solution(2023, 1, 1, pathlib.Path("a")),
+            Solution(2024, 6, 1, pathlib.Path("b")),
+            Solution(2024, 6, 2, pathlib.Path("c")),
+            Solution(2024, 25, None, pathlib.Path("d")),
+        ]
+
+        selected = select_solutions(solutions, ["2023", "2024/6/2", "2024/25/1"])
+
+        self.assertEqual(
+            [s.name for s in selected], ["2023/01/1", "2024/06/2", "2024/25"]
+        )
+
+    def test_select_solutions_returns_all_solutions_when_there_are_no_selectors(self):
+        solutions = [Solution(2023, 1, 1, pathlib.Path("a"))]
+
+        self.assertEqual(select_solutions(solutions, []), solutions)
+
+    def test_select_solutions_raises_error_for_invalid_selector(self):
+        with self.assertRaises(ValueError):
+            select_solutions([Solution(2023, 1, 1, pathlib.Path("a"))], ["day1"])
+
+    def test_load_solution_module_returns_module_with_run_program(self):
+        path = self.create_solution_file(
+            "2024/01/aoc01_part1.py",
+            """
+            def run_program(input):
+                return len(input)
+            """,
+        )
+
+        module = load_solution_module(Solution(2024, 1, 1, path))
+
+        self.assertEqual(module.run_program("abc"), 3)
+
+    def test_get_solution_module_loads_module_only_once(self):
+        path = self.create_solution_file("2024/01/aoc01_part1.py", "loads = []\n")
+        solution = Solution(2024, 1, 1, path)
+
+        get_solution_module(solution).loads.append(1)
+
+        self.assertEqual(get_solution_module(solution).loads, [1])
+        self.assertEqual(load_solution_module(solution).loads, [])
+
+    def test_read_solution_input_reads_input_file_next_to_solution(self):
+        path = self.create_solution_file("2024/01/aoc01_part1.py", "")
+        (path.parent / "input").write_text("1 2\n", encoding="utf-8")
+
+        self.assertEqual(read_solution_input(Solution(2024, 1, 1, path)), "1 2\n")
@@ -0,0 +1,290 @@
+#
+# Runs the embedded Tests classes of the selected solutions in parallel and
+# reports failures together with the durations of the tests.
+#
+# Usage (from the repository root):
+#
+#     python -m aoc.tests [-j JOBS] [--slow SECONDS] [SELECTOR ...]
+#
+# All solution modules are loaded once (before the worker processes are
+# forked) and individual test methods are distributed across the workers.
+# Durations of the tests are remembered in .test-durations.json so that the
+# next run starts the slowest tests first and the whole suite takes about as
+# long as its slowest test.
+#
+
+import argparse
+import dataclasses
+import json
+import multiprocessing
+import os
+import pathlib
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+from aoc import run
+from aoc import solutions
+
+
+DURATIONS_PATH = solutions.ROOT_DIR / ".test-durations.json"
+# In seconds.
+DEFAULT_SLOW_THRESHOLD = 0.1
+DEFAULT_TOP = 10
+
+
+@dataclasses.dataclass
+class CaseResult:
+    solution: solutions.Solution
+    # None when the module of the solution cannot be loaded.
+    name: str | None
+    # "ok", "FAIL", "ERROR", or "skipped".
+    outcome: str
+    # In seconds.
+    duration: float = 0.0
+    details: str = ""
+
+    @property
+    def id(self):
+        return f"{self.solution.name}::{self.name}"
+
+
+def collect_tests(solutions_to_test):
+    # Returns (tests, load_errors), where tests are (solution, test name)
+    # pairs and load_errors are CaseResults of modules that cannot be loaded.
+    tests = []
+    load_errors = []
+    loader = unittest.TestLoader()
+    for solution in solutions_to_test:
+        try:
+            module = solutions.get_solution_module(solution)
+        except Exception as e:
+            details = f"{type(e).__name__}: {e}"
+            load_errors.append(CaseResult(solution, None, "ERROR", details=details))
+            continue
+        test_case = getattr(module, "Tests", None)
+        if test_case is not None:
+            for name in loader.getTestCaseNames(test_case):
+                tests.append((solution, name))
+    return tests, load_errors
+
+
+def run_test(test):
+    solution, name = test
+    test_result = unittest.TestResult()
+    start = time.perf_counter()
+    solutions.get_solution_module(solution).Tests(name).run(test_result)
+    duration = time.perf_counter() - start
+
+    if test_result.errors:
+        outcome, problems = "ERROR", test_result.errors
+    elif test_result.failures:
+        outcome, problems = "FAIL", test_result.failures
+    elif test_result.skipped:
+        outcome, problems = "skipped", []
+    else:
+        outcome, problems = "ok", []
+    details = "\n".join(traceback for _, traceback in problems)
+    return CaseResult(solution, name, outcome, duration, details)
+
+
+def load_durations(path=DURATIONS_PATH):
+    try:
+        return json.loads(pathlib.Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(results, path=DURATIONS_PATH):
+    durations = load_durations(path)
+    durations.update({result.id: result.duration for result in results})
+    pathlib.Path(path).write_text(
+        json.dumps(durations, indent=4, sort_keys=True) + "\n", encoding="utf-8"
+    )
+
+
+def order_slowest_first(tests, durations):
+    # Tests without a known duration are assumed to be slow.
+    def duration(test):
+        solution, name = test
+        return durations.get(f"{solution.name}::{name}", float("inf"))
+
+    return sorted(tests, key=duration, reverse=True)
+
+
+def run_tests(tests, jobs=None):
+    # Yields CaseResults in the order of completion. The worker processes are
+    # reused for all tests (unlike in run.map_in_workers()), so the modules
+    # are loaded only once. The workers have to be forked (not spawned, which
+    # is the default on macOS), so that they inherit the modules loaded by
+    # collect_tests() instead of importing them again.
+    with multiprocessing.get_context("fork").Pool(processes=jobs) as pool:
+        yield from pool.imap_unordered(run_test, tests)
+
+
+def format_test_result(result, slow_threshold=DEFAULT_SLOW_THRESHOLD):
+    slow = "  SLOW" if result.duration >= slow_threshold else ""
+    return (
+        f"{run.format_duration(result.duration):>10}  {result.outcome:<7} "
+        f"{result.id}{slow}"
+    )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.tests",
+        description="Runs tests of Advent of Code solutions in parallel.",
+    )
+    parser.add_argument(
+        "selectors",
+        metavar="SELECTOR",
+        nargs="*",
+        help="YEAR, YEAR/DD, or YEAR/DD/PART (default: all solutions)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--slow",
+        type=float,
+        default=DEFAULT_SLOW_THRESHOLD,
+        help="duration in seconds over which a test is flagged as slow "
+        "(default: %(default)g)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of the slowest tests to report (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        selected = solutions.select_solutions(
+            solutions.discover_solutions(), args.selectors
+        )
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+
+    start = time.perf_counter()
+    tests, results = collect_tests(selected)
+    tests = order_slowest_first(tests, load_durations())
+    for result in run_tests(tests, args.jobs):
+        if result.outcome in ("FAIL", "ERROR"):
+            print(format_test_result(result, args.slow))
+        results.append(result)
+    wall_time = time.perf_counter() - start
+    save_durations([result for result in results if result.name is not None])
+
+    problems = [r for r in results if r.outcome in ("FAIL", "ERROR")]
+    for result in sorted(problems, key=lambda result: result.id):
+        print(f"\n{result.outcome}: {result.id}\n{result.details}")
+
+    slowest = sorted(results, key=lambda result: result.duration, reverse=True)
+    print("\nslowest tests:")
+    for result in slowest[: args.top]:
+        print(format_test_result(result, args.slow))
+
+    slow_count = sum(1 for result in results if result.duration >= args.slow)
+    print(
+        f"\n{len(results)} tests, {len(problems)} failed, {slow_count} slow, "
+        f"wall time {run.format_duration(wall_time)}, total test time "
+        f"{run.format_duration(sum(result.duration for result in results))}"
+    )
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+class Tests(unittest.TestCase):
+    def create_solution(self, source):
+        dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "01"
+        dir.mkdir()
+        path = dir / "aoc01_part1.py"
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+        return solutions.Solution(2024, 1, 1, path)
+
+    def test_collect_tests_returns_test_methods_of_tests_class(self):
+        solution = self.create_solution(
+            """
+            import unittest
+
+            class Tests(unittest.TestCase):
+                def test_b(self):
+                    pass
+
+                def test_a(self):
+                    pass
+            """
+        )
+
+        tests, load_errors = collect_tests([solution])
+
+        self.assertEqual(tests, [(solution, "test_a"), (solution, "test_b")])
+        self.assertEqual(load_errors, [])
+
+    def test_collect_tests_reports_module_that_cannot_be_loaded(self):
+        solution = self.create_solution("import nonexistent_module\n")
+
+        tests, load_errors = collect_tests([solution])
+
+        self.assertEqual(tests, [])
+        self.assertEqual(load_errors[0].outcome, "ERROR")
+        self.assertIn("ModuleNotFoundError", load_errors[0].details)
+
+    def test_run_tests_returns_outcomes_of_tests(self):
+        solution = self.create_solution(
+            """
+            import unittest
+
+            class Tests(unittest.TestCase):
+                def test_ok(self):
+                    self.assertEqual(1, 1)
+
+                def test_fail(self):
+                    self.assertEqual(1, 2)
+
+                def test_error(self):
+                    raise ValueError("invalid literal for int()")
+            """
+        )
+        tests, _ = collect_tests([solution])
+
+        results = sorted(run_tests(tests, jobs=2), key=lambda result: result.name)
+
+        self.assertEqual(
+            [(result.name, result.outcome) for result in results],
+            [("test_error", "ERROR"), ("test_fail", "FAIL"), ("test_ok", "ok")],
+        )
+        self.assertIn("1 != 2", results[1].details)
+
+    def test_order_slowest_first_starts_with_unknown_and_slowest_tests(self):
+        solution = solutions.Solution(2024, 1, 1, pathlib.Path("a"))
+        tests = [(solution, "test_a"), (solution, "test_b"), (solution, "test_c")]
+        durations = {"2024/01/1::test_a": 0.5, "2024/01/1::test_b": 2.0}
+
+        self.assertEqual(
+            [name for _, name in order_slowest_first(tests, durations)],
+            ["test_c", "test_b", "test_a"],
+        )
+
+    def test_format_test_result_flags_slow_test(self):
+        result = CaseResult(
+            solutions.Solution(2024, 6, 2, pathlib.Path("a")), "test_x", "ok", 1.5
+        )
+
+        self.assertEqual(
+            format_test_result(result, slow_threshold=1.0),
+            "    1.50 s  ok      2024/06/2::test_x  SLOW",
+        )